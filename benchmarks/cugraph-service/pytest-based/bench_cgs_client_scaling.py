@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from threading import Thread
 
 import pytest
 
 from cugraph_service_client import (
+    AsyncCugraphServiceClient,
     CugraphServiceClient,
     defaults,
 )
@@ -33,6 +35,7 @@ _edge_factor = 16
 _batch_size = 100
 _with_replacement = False
 _rng_seed = 42
+_keep_alive = 30
 
 
 @pytest.fixture(scope="module")
@@ -72,13 +75,15 @@ def running_server_for_sampling_with_graph(request):
         print("done.", flush=True)
 
 
-def create_sampling_client(host, port, graph_id):
+def create_sampling_client(host, port, graph_id, client=None):
     """
     Returns a callable that, when called will run uniform_neighbor_sample. This
     is intended to be called in a separate thread to produce multiple
-    concurrent client sampling calls.
+    concurrent client sampling calls. If client is given, it is used instead of
+    a new client, allowing multiple threads to share a connection pool.
     """
-    client = CugraphServiceClient(host, port)
+    if client is None:
+        client = CugraphServiceClient(host, port)
     fanout_vals = [10, 25]
     start_list = client.call_extension(
         "gen_vertex_list", graph_id, _batch_size
@@ -146,3 +151,61 @@ def bench_cgs_client_scaling_total_time(running_server_for_sampling_with_graph,
     with TimerContext():
         [t.start() for t in threads]
         [t.join() for t in threads]
+
+
+@pytest.mark.parametrize("num_clients", params.num_clients.values())
+def bench_cgs_client_scaling_pooled_total_time(running_server_for_sampling_with_graph,
+                                               num_clients):
+    """
+    Same as bench_cgs_client_scaling_total_time, but all threads share a single
+    client which reuses a pool of num_clients connections.
+    """
+    graph_id = running_server_for_sampling_with_graph
+
+    client = CugraphServiceClient(_host, _port,
+                                  pool_size=num_clients,
+                                  keep_alive=_keep_alive)
+    threads = []
+    for _ in range(num_clients):
+        sampling_function = create_sampling_client(_host, _port, graph_id,
+                                                   client=client)
+        threads.append(Thread(target=sampling_function, args=[None]))
+
+    with TimerContext():
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+
+    client.close_pool()
+
+
+@pytest.mark.parametrize("num_clients", params.num_clients.values())
+def bench_cgs_client_scaling_async_total_time(running_server_for_sampling_with_graph,
+                                              num_clients):
+    """
+    Same as bench_cgs_client_scaling_total_time, but num_clients concurrent
+    sampling calls are awaited on a single AsyncCugraphServiceClient.
+    """
+    graph_id = running_server_for_sampling_with_graph
+    fanout_vals = [10, 25]
+
+    async def run_sampling():
+        async with AsyncCugraphServiceClient(_host, _port,
+                                             pool_size=num_clients,
+                                             keep_alive=_keep_alive) as client:
+            start_lists = await asyncio.gather(*[
+                client.call_extension("gen_vertex_list", graph_id, _batch_size)
+                for _ in range(num_clients)
+            ])
+            with TimerContext():
+                results = await asyncio.gather(*[
+                    client.uniform_neighbor_sample(start_list,
+                                                   fanout_vals,
+                                                   _with_replacement,
+                                                   graph_id=graph_id)
+                    for start_list in start_lists
+                ])
+        return results
+
+    results = asyncio.run(run_sampling())
+
+    assert len(results) == num_clients
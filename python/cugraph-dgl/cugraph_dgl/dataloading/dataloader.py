@@ -230,6 +230,9 @@ class DataLoader(torch.utils.data.DataLoader):
             deduplicate_sources=deduplicate_sources,
             prior_sources_behavior=prior_sources_behavior,
             renumber=renumber,
+            # Allows reading individual batches, eg. when batches are split
+            # between multiple workers.
+            write_index=True,
         )
         if self.shuffle:
             self.tensorized_indices_ds.shuffle()
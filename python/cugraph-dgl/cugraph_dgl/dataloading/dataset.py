@@ -14,8 +14,11 @@ from __future__ import annotations
 from typing import Tuple, Dict, Optional, List, Union
 
 import os
+from bisect import bisect_right
+from collections import OrderedDict
 import cudf
 from cugraph.utilities.utils import import_optional
+from cugraph.gnn.data_loading.bulk_sampler_io import read_batch_index
 from cugraph_dgl.dataloading.utils.sampling_helpers import (
     create_homogeneous_sampled_graphs_from_dataframe,
     create_heterogeneous_sampled_graphs_from_dataframe,
@@ -33,6 +36,7 @@ class HomogenousBulkSamplerDataset(torch.utils.data.Dataset):
         total_number_of_nodes: int,
         edge_dir: str,
         return_type: str = "dgl.Block",
+        partition_cache_size: int = 1,
     ):
         if return_type not in ["dgl.Block", "cugraph_dgl.nn.SparseGraph"]:
             raise ValueError(
@@ -44,9 +48,10 @@ class HomogenousBulkSamplerDataset(torch.utils.data.Dataset):
         # in the next release
         self.total_number_of_nodes = total_number_of_nodes
         self.edge_dir = edge_dir
-        self._current_batch_fn = None
         self._input_files = None
         self._return_type = return_type
+        # The number of decoded partitions to keep in memory, see _get_batch()
+        self._partition_cache_size = partition_cache_size
 
     def __len__(self):
         return self.num_batches
@@ -58,14 +63,12 @@ class HomogenousBulkSamplerDataset(torch.utils.data.Dataset):
                 "before trying to fetch a sample"
             )
 
-        fn, batch_offset = self._batch_to_fn_d[idx]
-        if fn != self._current_batch_fn:
-            df = _load_sampled_file(dataset_obj=self, fn=fn)
-            self._current_batches = create_homogeneous_sampled_graphs_from_dataframe(
-                sampled_df=df, edge_dir=self.edge_dir, return_type=self._return_type
-            )
-        current_offset = idx - batch_offset
-        return self._current_batches[current_offset]
+        return _get_batch(dataset_obj=self, idx=idx)
+
+    def _create_batches(self, df: cudf.DataFrame):
+        return create_homogeneous_sampled_graphs_from_dataframe(
+            sampled_df=df, edge_dir=self.edge_dir, return_type=self._return_type
+        )
 
     def set_input_files(
         self,
@@ -95,14 +98,16 @@ class HetrogenousBulkSamplerDataset(torch.utils.data.Dataset):
         etype_offset_dict: Dict[Tuple[str, str, str], int],
         ntype_offset_dict: Dict[str, int],
         edge_dir: str = "in",
+        partition_cache_size: int = 1,
     ):
         self.num_nodes_dict = num_nodes_dict
         self.etype_id_dict = etype_id_dict
         self.etype_offset_dict = etype_offset_dict
         self.ntype_offset_dict = ntype_offset_dict
         self.edge_dir = edge_dir
-        self._current_batch_fn = None
         self._input_files = None
+        # The number of decoded partitions to keep in memory, see _get_batch()
+        self._partition_cache_size = partition_cache_size
 
     def __len__(self):
         return self.num_batches
@@ -114,21 +119,17 @@ class HetrogenousBulkSamplerDataset(torch.utils.data.Dataset):
                 "before trying to fetch a sample"
             )
 
-        fn, batch_offset = self._batch_to_fn_d[idx]
-        if fn != self._current_batch_fn:
-            df = _load_sampled_file(dataset_obj=self, fn=fn)
-            self._current_batches = create_heterogeneous_sampled_graphs_from_dataframe(
-                sampled_df=df,
-                num_nodes_dict=self.num_nodes_dict,
-                etype_id_dict=self.etype_id_dict,
-                etype_offset_dict=self.etype_offset_dict,
-                ntype_offset_dict=self.ntype_offset_dict,
-                edge_dir=self.edge_dir,
-            )
-            del df
+        return _get_batch(dataset_obj=self, idx=idx)
 
-        current_offset = idx - batch_offset
-        return self._current_batches[current_offset]
+    def _create_batches(self, df: cudf.DataFrame):
+        return create_heterogeneous_sampled_graphs_from_dataframe(
+            sampled_df=df,
+            num_nodes_dict=self.num_nodes_dict,
+            etype_id_dict=self.etype_id_dict,
+            etype_offset_dict=self.etype_offset_dict,
+            ntype_offset_dict=self.ntype_offset_dict,
+            edge_dir=self.edge_dir,
+        )
 
     def set_input_files(
         self,
@@ -150,15 +151,107 @@ class HetrogenousBulkSamplerDataset(torch.utils.data.Dataset):
         )
 
 
+def _get_batch(dataset_obj, idx):
+    """
+    Returns batch idx, from the cache of decoded partitions if possible.
+    Otherwise, reads and decodes its whole partition into the cache, unless
+    batches are being accessed out of order and the partition has a batch
+    index, in which case only the batch is read and decoded.
+    """
+    fn, batch_offset = dataset_obj._batch_to_fn_d[idx]
+    current_offset = idx - batch_offset
+
+    sequential = idx == dataset_obj._last_idx + 1
+    dataset_obj._last_idx = idx
+
+    cache = dataset_obj._partition_cache
+    if fn in cache:
+        cache.move_to_end(fn)
+        return cache[fn][current_offset]
+
+    if not sequential:
+        if fn not in dataset_obj._batch_indices:
+            dataset_obj._batch_indices[fn] = read_batch_index(fn)
+        batch_index = dataset_obj._batch_indices[fn]
+        if batch_index is not None:
+            df = _load_sampled_batch(dataset_obj, fn, current_offset, batch_index)
+            return dataset_obj._create_batches(df)[0]
+
+    df = _load_sampled_file(dataset_obj=dataset_obj, fn=fn)
+    cache[fn] = dataset_obj._create_batches(df)
+    del df
+    while len(cache) > dataset_obj._partition_cache_size:
+        cache.popitem(last=False)
+    return cache[fn][current_offset]
+
+
 def _load_sampled_file(dataset_obj, fn):
     df = cudf.read_parquet(os.path.join(fn))
+    _rename_for_edge_dir(dataset_obj, df)
+    return df
+
+
+def _load_sampled_batch(dataset_obj, fn, offset, batch_index):
+    """
+    Reads the batch at offset within the partition fn, reading only the row
+    groups containing the batch and its renumber map.  Returns a dataframe in
+    the same format as a partition containing only that batch.
+    """
+    row_group_offsets = batch_index["row_group_offsets"]
+    start, end = batch_index["batch_offsets"][offset : offset + 2]
+    df = _read_parquet_rows(fn, start, end, batch_index["columns"], row_group_offsets)
+
+    map_offsets = batch_index["renumber_map_offsets"]
+    if map_offsets is not None:
+        map_start, map_end = map_offsets[offset : offset + 2]
+        renumber_map = _read_parquet_rows(
+            fn, map_start, map_end, ["map"], row_group_offsets
+        )["map"]
+        # Prepend the renumber map offsets for a single batch
+        map_series = cudf.concat(
+            [
+                cudf.Series([2, 2 + len(renumber_map)], dtype=renumber_map.dtype),
+                renumber_map,
+            ],
+            ignore_index=True,
+        )
+        map_series.name = "map"
+        if len(map_series) > len(df):
+            df = df.join(map_series, how="outer").sort_index()
+        else:
+            df["map"] = map_series
+
+    _rename_for_edge_dir(dataset_obj, df)
+    return df
+
+
+def _read_parquet_rows(fn, start, end, columns, row_group_offsets):
+    """
+    Returns rows [start, end) of columns of the parquet file fn, reading only
+    the row groups containing those rows.  The i-th row group of fn contains
+    rows [row_group_offsets[i], row_group_offsets[i + 1]).
+    """
+    num_row_groups = len(row_group_offsets) - 1
+    first_row_group = min(bisect_right(row_group_offsets, start), num_row_groups) - 1
+    last_row_group = max(
+        first_row_group,
+        min(bisect_right(row_group_offsets, end - 1), num_row_groups) - 1,
+    )
+    df = cudf.read_parquet(
+        fn,
+        columns=columns,
+        row_groups=list(range(first_row_group, last_row_group + 1)),
+    )
+    first_row = row_group_offsets[first_row_group]
+    return df.iloc[start - first_row : end - first_row].reset_index(drop=True)
+
+
+def _rename_for_edge_dir(dataset_obj, df):
     if dataset_obj.edge_dir == "in":
         df.rename(
             columns={"sources": "destinations", "destinations": "sources"},
             inplace=True,
         )
-    dataset_obj._current_batch_fn = fn
-    return df
 
 
 def get_batch_start_end(fn):
@@ -195,7 +288,14 @@ def _set_input_files(
     if input_file_paths:
         dataset_obj._input_files = input_file_paths
     if input_directory:
-        dataset_obj._input_files = [fp.path for fp in os.scandir(input_directory)]
+        # Skip the batch index files written alongside the parquet files
+        dataset_obj._input_files = [
+            fp.path
+            for fp in os.scandir(input_directory)
+            if fp.name.endswith(".parquet")
+        ]
     dataset_obj._batch_to_fn_d = get_batch_to_fn_d(dataset_obj._input_files)
     dataset_obj.num_batches = len(dataset_obj._batch_to_fn_d)
-    dataset_obj._current_batch_fn = None
+    dataset_obj._partition_cache = OrderedDict()
+    dataset_obj._batch_indices = {}
+    dataset_obj._last_idx = -1
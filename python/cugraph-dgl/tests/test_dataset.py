@@ -20,6 +20,8 @@ try:
 except ModuleNotFoundError:
     pytest.skip("cugraph_dgl not available", allow_module_level=True)
 
+import json
+
 from dgl.dataloading import MultiLayerNeighborSampler
 import dgl
 import torch
@@ -27,6 +29,14 @@ import cudf
 import pandas as pd
 import cupy as cp
 import numpy as np
+import pyarrow.parquet as pq
+from cugraph.gnn.data_loading.bulk_sampler_io import (
+    get_batch_index_path,
+    read_batch_index,
+    write_samples,
+)
+from cugraph_dgl.dataloading import HomogenousBulkSamplerDataset
+from cugraph_dgl.dataloading.dataset import _load_sampled_batch
 from cugraph_dgl.dataloading.utils.sampling_helpers import (
     create_homogeneous_sampled_graphs_from_dataframe,
 )
@@ -126,3 +136,161 @@ def test_homogeneous_sampled_graphs_from_dataframe(return_type, seed_node):
             cugraph_offsets, cugraph_indices, _ = cugraph_dgl_graph.csc()
             assert torch.equal(dgl_offsets.to("cpu"), cugraph_offsets.to("cpu"))
             assert torch.equal(dgl_indices.to("cpu"), cugraph_indices.to("cpu"))
+
+
+def write_indexed_samples(output_path, num_batches, batches_per_partition, **kwargs):
+    """
+    Writes num_batches sampled batches of 3 edges each, with a renumber map
+    of 4 vertices, to output_path using the BulkSampler writer.
+    """
+    results = cudf.DataFrame(
+        {
+            "sources": cp.tile(cp.array([0, 0, 1], dtype="int64"), num_batches),
+            "destinations": cp.tile(cp.array([1, 2, 3], dtype="int64"), num_batches),
+            "edge_id": cp.arange(3 * num_batches, dtype="int64"),
+            "edge_type": None,
+            "weight": None,
+            "hop_id": cp.tile(cp.array([0, 0, 1], dtype="int32"), num_batches),
+        }
+    )
+    offsets = cudf.DataFrame(
+        {
+            "offsets": cp.arange(0, 3 * num_batches, 3, dtype="int64"),
+            "batch_id": cp.arange(num_batches, dtype="int32"),
+            "renumber_map_offsets": cp.arange(0, 4 * num_batches, 4, dtype="int64"),
+        }
+    )
+    renumber_map = cudf.DataFrame(
+        {
+            "map": (
+                cp.arange(4 * num_batches, dtype="int64") % 4
+                + 10 * cp.repeat(cp.arange(num_batches, dtype="int64"), 4)
+            )
+        }
+    )
+    write_samples(
+        results, offsets, renumber_map, batches_per_partition, output_path, **kwargs
+    )
+
+
+def split_row_groups(parquet_path, row_group_sizes):
+    """
+    Rewrites the parquet file at parquet_path with row groups of the given
+    sizes, and updates its batch index to match.
+    """
+    table = pq.read_table(parquet_path)
+    row_group_offsets = np.cumsum([0] + row_group_sizes).tolist()
+    assert row_group_offsets[-1] == table.num_rows
+    with pq.ParquetWriter(parquet_path, table.schema) as writer:
+        for start, end in zip(row_group_offsets[:-1], row_group_offsets[1:]):
+            writer.write_table(table.slice(start, end - start))
+    assert pq.read_metadata(parquet_path).num_row_groups == len(row_group_sizes)
+
+    batch_index = read_batch_index(parquet_path)
+    batch_index["row_group_offsets"] = row_group_offsets
+    with open(get_batch_index_path(parquet_path), "w") as f:
+        json.dump(batch_index, f)
+
+
+def assert_same_batch(batch, expected_batch):
+    input_nodes, output_nodes, blocks = batch
+    expected_input_nodes, expected_output_nodes, expected_blocks = expected_batch
+    assert torch.equal(input_nodes, expected_input_nodes)
+    assert torch.equal(output_nodes, expected_output_nodes)
+    assert len(blocks) == len(expected_blocks)
+    for block, expected_block in zip(blocks, expected_blocks):
+        src, dst = block.edges()
+        expected_src, expected_dst = expected_block.edges()
+        assert torch.equal(src, expected_src)
+        assert torch.equal(dst, expected_dst)
+
+
+def test_load_sampled_batch(tmp_path):
+    write_indexed_samples(str(tmp_path), 3, 3, write_index=True)
+    parquet_path = str(tmp_path / "batch=0-2.parquet")
+    # The row groups do not all have the same size, and the renumber map
+    # is longer than the sampled edges.
+    split_row_groups(parquet_path, [5, 3, 8])
+
+    dataset = HomogenousBulkSamplerDataset(total_number_of_nodes=40, edge_dir="in")
+    batch_index = read_batch_index(parquet_path)
+    full_df = cudf.read_parquet(parquet_path)
+    for offset in range(3):
+        df = _load_sampled_batch(dataset, parquet_path, offset, batch_index)
+        # The edges are renamed for edge_dir="in"
+        start, end = batch_index["batch_offsets"][offset : offset + 2]
+        expected = full_df.iloc[start:end].reset_index(drop=True)
+        df_edges = df.dropna(subset=["batch_id"])
+        assert (df_edges.sources.values_host == expected.destinations.values_host).all()
+        assert (df_edges.destinations.values_host == expected.sources.values_host).all()
+        assert (df_edges.edge_id.values_host == expected.edge_id.values_host).all()
+        assert (df_edges.batch_id == offset).all()
+        # The renumber map is rebuilt as the map of a single batch
+        assert df["map"].dropna().values_host.tolist() == [2, 6] + [
+            10 * offset + i for i in range(4)
+        ]
+
+
+@pytest.mark.parametrize("return_type", ["dgl.Block", "cugraph_dgl.nn.SparseGraph"])
+def test_get_batch_out_of_order(tmp_path, return_type):
+    write_indexed_samples(str(tmp_path), 6, 3, write_index=True)
+    split_row_groups(str(tmp_path / "batch=0-2.parquet"), [7, 9])
+    split_row_groups(str(tmp_path / "batch=3-5.parquet"), [1, 2, 13])
+
+    dataset = HomogenousBulkSamplerDataset(
+        total_number_of_nodes=60, edge_dir="in", return_type=return_type
+    )
+    dataset.set_input_files(input_directory=str(tmp_path))
+    assert len(dataset) == 6
+    batches = [dataset[i] for i in range(len(dataset))]
+    for i, batch in enumerate(batches):
+        assert batch[0].tolist() == [10 * i + j for j in range(len(batch[0]))]
+
+    dataset.set_input_files(input_directory=str(tmp_path))
+    for i in [4, 1, 5, 0, 3, 2]:
+        if return_type == "dgl.Block":
+            assert_same_batch(dataset[i], batches[i])
+        else:
+            assert torch.equal(dataset[i][0], batches[i][0])
+            assert torch.equal(dataset[i][1], batches[i][1])
+    # Batches accessed out of order are read alone, without caching their
+    # partitions.
+    assert len(dataset._partition_cache) == 0
+
+
+@pytest.mark.parametrize("partition_cache_size", [1, 2])
+def test_get_batch_partition_cache(tmp_path, partition_cache_size):
+    write_indexed_samples(str(tmp_path), 4, 2)
+    dataset = HomogenousBulkSamplerDataset(
+        total_number_of_nodes=40,
+        edge_dir="in",
+        partition_cache_size=partition_cache_size,
+    )
+    dataset.set_input_files(
+        input_file_paths=[
+            str(tmp_path / "batch=0-1.parquet"),
+            str(tmp_path / "batch=2-3.parquet"),
+        ]
+    )
+    first_fn, second_fn = dataset._input_files
+
+    dataset[0]
+    assert list(dataset._partition_cache) == [first_fn]
+    batch = dataset[1]
+    assert dataset[1] is batch
+    assert list(dataset._partition_cache) == [first_fn]
+
+    dataset[2]
+    if partition_cache_size == 1:
+        assert list(dataset._partition_cache) == [second_fn]
+    else:
+        assert list(dataset._partition_cache) == [first_fn, second_fn]
+        # Cached partitions are used even if accessed out of order, and
+        # become the most recently used.
+        assert dataset[1] is batch
+        assert list(dataset._partition_cache) == [second_fn, first_fn]
+
+    # Without a batch index, partitions accessed out of order are cached
+    dataset[3]
+    assert list(dataset._partition_cache)[-1] == second_fn
+    assert len(dataset._partition_cache) == partition_cache_size
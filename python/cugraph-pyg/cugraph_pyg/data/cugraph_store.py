@@ -933,57 +933,67 @@ class EXPERIMENTAL__CuGraphStore:
         it = chain.from_iterable(self._tensor_attr_dict.values())
         return [CuGraphTensorAttr.cast(c) for c in it]
 
-    def _get_tensor(self, attr: CuGraphTensorAttr) -> TensorType:
+    def __get_feature_index(self, idx):
+        """
+        Converts the index of a CuGraphTensorAttr to a type accepted by the
+        feature store backend.
+        """
+        if idx is None:
+            return idx
+
         feature_backend = self.__features.backend
-        cols = attr.properties
+        if feature_backend == "torch":
+            if not isinstance(idx, torch.Tensor):
+                raise TypeError(
+                    f"Type {type(idx)} invalid"
+                    f" for feature store backend {feature_backend}"
+                )
+            idx = idx.cpu()
+        elif feature_backend in ("numpy", "mmap"):
+            # allow feature indexing through cupy arrays
+            if isinstance(idx, cupy.ndarray):
+                idx = idx.get()
+            elif isinstance(idx, torch.Tensor):
+                idx = np.asarray(idx.cpu())
 
-        idx = attr.index
-        if idx is not None:
-            if feature_backend == "torch":
-                if not isinstance(idx, torch.Tensor):
-                    raise TypeError(
-                        f"Type {type(idx)} invalid"
-                        f" for feature store backend {feature_backend}"
-                    )
-                idx = idx.cpu()
-            elif feature_backend == "numpy":
-                # allow feature indexing through cupy arrays
-                if isinstance(idx, cupy.ndarray):
-                    idx = idx.get()
-                elif isinstance(idx, torch.Tensor):
-                    idx = np.asarray(idx.cpu())
+        return idx
+
+    def _get_tensor(self, attr: CuGraphTensorAttr) -> TensorType:
+        return self.__get_tensor_from_index(attr, self.__get_feature_index(attr.index))
+
+    def __get_tensor_from_index(self, attr: CuGraphTensorAttr, idx) -> TensorType:
+        """
+        Returns the tensor for attr, using idx, the index of attr already
+        converted by __get_feature_index(), in place of attr.index.
+        """
+        cols = attr.properties
 
         if cols is None:
             t = self.__features.get_data(idx, attr.group_name, attr.attr_name)
             if idx is None:
                 t = t[-1]
-
-            if isinstance(t, np.ndarray):
-                t = torch.as_tensor(t, device="cuda")
-            else:
-                t = t.cuda()
-
-            return t
-
         else:
-            t = self.__features.get_data(idx, attr.group_name, cols[0])
-
-            if len(t.shape) == 1:
-                t = torch.tensor([t])
-
-            for col in cols[1:]:
-                u = self.__features.get_data(idx, attr.group_name, col)
-
-                if len(u.shape) == 1:
-                    u = torch.tensor([u])
-
-                t = torch.concatenate([t, u])
+            # Gather all columns into a single preallocated array
+            t = self.__features.get_multi_data(idx, attr.group_name, cols)
 
+        if isinstance(t, np.ndarray):
+            t = torch.as_tensor(t, device="cuda")
+        else:
             t = t.cuda()
-            return t
+
+        return t
 
     def _multi_get_tensor(self, attrs: List[CuGraphTensorAttr]) -> List[TensorType]:
-        return [self._get_tensor(attr) for attr in attrs]
+        # Attrs of the same group usually share one index (eg. the sampled
+        # nodes of a type), so only convert each distinct index once.
+        converted_indices = {}
+        tensors = []
+        for attr in attrs:
+            key = (attr.group_name, id(attr.index))
+            if key not in converted_indices:
+                converted_indices[key] = self.__get_feature_index(attr.index)
+            tensors.append(self.__get_tensor_from_index(attr, converted_indices[key]))
+        return tensors
 
     def multi_get_tensor(self, attrs: List[CuGraphTensorAttr]) -> List[TensorType]:
         """
@@ -15,6 +15,8 @@ import tempfile
 
 import os
 import re
+import queue
+import threading
 
 import cupy
 import cudf
@@ -52,6 +54,7 @@ class EXPERIMENTAL__BulkSampleLoader:
         input_files: List[str] = None,
         starting_batch_id: int = 0,
         batches_per_partition: int = 100,
+        prefetch_partitions: int = 0,
         # Sampler args
         num_neighbors: Union[List[int], Dict[Tuple[str, str, str], List[int]]] = None,
         replace: bool = True,
@@ -107,6 +110,13 @@ class EXPERIMENTAL__BulkSampleLoader:
             sampler if there is one; otherwise, this argument
             is used to determine which files to read.
 
+        prefetch_partitions: int (optional, default=0)
+            The number of output partitions to read ahead of
+            the current one in a background thread, so that
+            iterating does not wait on reading from disk.
+            Defaults to 0, which reads each partition when
+            its first batch is requested.
+
         num_neighbors: Union[List[int],
                  Dict[Tuple[str, str, str], List[int]]] (required)
             The number of neighbors to sample for each node in each iteration.
@@ -125,15 +135,23 @@ class EXPERIMENTAL__BulkSampleLoader:
         self.__batches_per_partition = batches_per_partition
         self.__starting_batch_id = starting_batch_id
 
+        self.__stop_prefetch = threading.Event()
+        self.__partition_queue = None
+        if prefetch_partitions < 0:
+            raise ValueError("prefetch_partitions must be >= 0")
+        self.__prefetch_partitions = prefetch_partitions
+
         if input_nodes is None:
             # Will be loading from disk
             self.__num_batches = input_nodes
             self.__directory = directory
             if input_files is None:
                 if isinstance(self.__directory, str):
-                    self.__input_files = iter(os.listdir(self.__directory))
+                    self.__input_files = self.__list_parquet_files(self.__directory)
                 else:
-                    self.__input_files = iter(os.listdir(self.__directory.name))
+                    self.__input_files = self.__list_parquet_files(
+                        self.__directory.name
+                    )
             else:
                 self.__input_files = iter(input_files)
             return
@@ -205,7 +223,131 @@ class EXPERIMENTAL__BulkSampleLoader:
             )
 
         bulk_sampler.flush()
-        self.__input_files = iter(os.listdir(self.__directory.name))
+        self.__input_files = self.__list_parquet_files(self.__directory.name)
+
+    @staticmethod
+    def __list_parquet_files(dir_path):
+        """
+        Returns an iterator over the parquet files in dir_path, skipping
+        other files such as batch indices written by the BulkSampler.
+        """
+        return iter(f for f in os.listdir(dir_path) if f.endswith(".parquet"))
+
+    def __del__(self):
+        # Stop the prefetching thread, if any, from reading more partitions
+        self.__stop_prefetch.set()
+
+    @classmethod
+    def __read_partition(cls, dir_path, fname):
+        """
+        Reads the sampling results in the parquet file fname and returns a
+        tuple of (first batch id, last batch id + 1, sampling results,
+        renumber map, batch offsets), where the rows of batch
+        (first batch id + i) are at [batch offsets[i], batch offsets[i + 1]).
+        """
+        m = cls.__ex_parquet_file.match(fname)
+        if m is None:
+            raise ValueError(f"Invalid parquet filename {fname}")
+
+        start_inclusive, end_inclusive = [int(g) for g in m.groups()]
+        end_exclusive = end_inclusive + 1
+
+        parquet_path = os.path.join(
+            dir_path,
+            fname,
+        )
+
+        columns = {
+            "sources": "int64",
+            "destinations": "int64",
+            # 'edge_id':'int64',
+            "edge_type": "int32",
+            "batch_id": "int32",
+            "hop_id": "int32",
+        }
+
+        raw_sample_data = cudf.read_parquet(parquet_path)
+        if "map" in raw_sample_data.columns:
+            renumber_map = raw_sample_data["map"]
+            raw_sample_data.drop("map", axis=1, inplace=True)
+        else:
+            renumber_map = None
+
+        data = raw_sample_data[list(columns.keys())].astype(columns)
+        data.dropna(inplace=True)
+
+        # Group the rows of each batch together, keeping their order, so that
+        # each batch is a contiguous slice of the partition.
+        if not data["batch_id"].is_monotonic_increasing:
+            data["_row"] = cupy.arange(len(data))
+            data = data.sort_values(["batch_id", "_row"]).drop(columns="_row")
+        batch_offsets = cupy.searchsorted(
+            data["batch_id"].values,
+            cupy.arange(start_inclusive, end_exclusive + 1, dtype="int32"),
+        ).get()
+
+        return (start_inclusive, end_exclusive, data, renumber_map, batch_offsets)
+
+    @classmethod
+    def __prefetch(cls, dir_path, input_files, partition_queue, stop, device):
+        """
+        Reads the partitions in input_files into partition_queue until there
+        are none left, followed by None, or until stop is set. Exceptions are
+        put in the queue to be raised by the consumer.
+        """
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    partition_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        with cupy.cuda.Device(device):
+            try:
+                for fname in input_files:
+                    if not put(cls.__read_partition(dir_path, fname)):
+                        return
+            except Exception as ex:
+                put(ex)
+                return
+            put(None)
+
+    def __next_partition(self, dir_path):
+        """
+        Returns the next partition (see __read_partition()), or None if there
+        are no partitions left.
+        """
+        if self.__prefetch_partitions == 0:
+            try:
+                fname = next(self.__input_files)
+            except StopIteration:
+                return None
+            return self.__read_partition(dir_path, fname)
+
+        if self.__partition_queue is None:
+            self.__partition_queue = queue.Queue(maxsize=self.__prefetch_partitions)
+            threading.Thread(
+                target=self.__prefetch,
+                args=(
+                    dir_path,
+                    self.__input_files,
+                    self.__partition_queue,
+                    self.__stop_prefetch,
+                    cupy.cuda.Device().id,
+                ),
+                daemon=True,
+            ).start()
+
+        partition = self.__partition_queue.get()
+        if isinstance(partition, Exception):
+            # Leave the exception for any later call, since the thread has
+            # stopped.
+            self.__partition_queue.put_nowait(partition)
+            raise partition
+        return partition
 
     def __next__(self):
         # Load the next set of sampling results if necessary
@@ -221,50 +363,28 @@ class EXPERIMENTAL__BulkSampleLoader:
             )
 
             # Will raise StopIteration if there are no files left
-            try:
-                fname = next(self.__input_files)
-            except StopIteration as ex:
+            partition = self.__next_partition(dir_path)
+            if partition is None:
                 # Won't delete a non-temp dir (since it would just be deleting a string)
                 del self.__directory
                 self.__directory = None
-                raise StopIteration(ex)
-
-            m = self.__ex_parquet_file.match(fname)
-            if m is None:
-                raise ValueError(f"Invalid parquet filename {fname}")
+                raise StopIteration
 
-            self.__start_inclusive, end_inclusive = [int(g) for g in m.groups()]
+            (
+                self.__start_inclusive,
+                self.__end_exclusive,
+                self.__data,
+                self.__renumber_map,
+                self.__batch_offsets,
+            ) = partition
             self.__next_batch = self.__start_inclusive
-            self.__end_exclusive = end_inclusive + 1
-
-            parquet_path = os.path.join(
-                dir_path,
-                fname,
-            )
-
-            columns = {
-                "sources": "int64",
-                "destinations": "int64",
-                # 'edge_id':'int64',
-                "edge_type": "int32",
-                "batch_id": "int32",
-                "hop_id": "int32",
-            }
-
-            raw_sample_data = cudf.read_parquet(parquet_path)
-            if "map" in raw_sample_data.columns:
-                self.__renumber_map = raw_sample_data["map"]
-                raw_sample_data.drop("map", axis=1, inplace=True)
-            else:
-                self.__renumber_map = None
-
-            self.__data = raw_sample_data[list(columns.keys())].astype(columns)
-            self.__data.dropna(inplace=True)
 
         # Pull the next set of sampling results out of the dataframe in memory
-        f = self.__data["batch_id"] == self.__next_batch
+        i = self.__next_batch - self.__start_inclusive
+        batch_data = self.__data.iloc[
+            self.__batch_offsets[i] : self.__batch_offsets[i + 1]
+        ]
         if self.__renumber_map is not None:
-            i = self.__next_batch - self.__start_inclusive
             ix = self.__renumber_map.iloc[[i, i + 1]]
             ix_start, ix_end = ix.iloc[0], ix.iloc[1]
             current_renumber_map = self.__renumber_map.iloc[ix_start:ix_end]
@@ -274,7 +394,7 @@ class EXPERIMENTAL__BulkSampleLoader:
             current_renumber_map = None
 
         sampler_output = _sampler_output_from_sampling_results(
-            self.__data[f], current_renumber_map, self.__graph_store
+            batch_data, current_renumber_map, self.__graph_store
         )
 
         # Get ready for next iteration
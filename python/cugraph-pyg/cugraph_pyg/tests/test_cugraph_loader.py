@@ -165,6 +165,57 @@ def test_cugraph_loader_from_disk_subset():
     assert num_samples == 100
 
 
+@pytest.mark.skipif(isinstance(torch, MissingModule), reason="torch not available")
+@pytest.mark.parametrize("prefetch_partitions", [0, 3])
+def test_cugraph_loader_from_disk_multiple_batches(prefetch_partitions):
+    F = FeatureStore()
+    F.add_data(torch.tensor([1, 2, 3, 4, 5, 6, 7]), "t0", "x")
+
+    G = {("t0", "knows", "t0"): 7}
+    N = {"t0": 7}
+
+    cugraph_store = CuGraphStore(F, G, N)
+
+    bogus_samples = cudf.DataFrame(
+        {
+            "sources": [0, 1, 2, 3, 4, 5, 6],
+            "destinations": [6, 4, 3, 2, 2, 1, 5],
+            "edge_type": cudf.Series([0, 0, 0, 0, 0, 0, 0], dtype="int32"),
+            "edge_id": [5, 10, 15, 20, 25, 30, 35],
+            "hop_id": cudf.Series([0, 0, 0, 1, 1, 2, 2], dtype="int32"),
+        }
+    )
+
+    tempdir = tempfile.TemporaryDirectory()
+    for s in range(0, 256, 2):
+        # Write the batches of each partition out of order
+        partition = cudf.concat(
+            [
+                bogus_samples.assign(batch_id=cupy.int32(s + 1)),
+                bogus_samples.assign(batch_id=cupy.int32(s)),
+            ],
+            ignore_index=True,
+        )
+        partition.to_parquet(os.path.join(tempdir.name, f"batch={s}-{s + 1}.parquet"))
+
+    loader = BulkSampleLoader(
+        feature_store=cugraph_store,
+        graph_store=cugraph_store,
+        directory=tempdir,
+        prefetch_partitions=prefetch_partitions,
+    )
+
+    num_samples = 0
+    for sample in loader:
+        num_samples += 1
+        assert sample["t0"]["num_nodes"] == 7
+        # correct vertex order is [0, 1, 2, 6, 4, 3, 5]; x = [1, 2, 3, 7, 5, 4, 6]
+        assert sample["t0"]["x"].tolist() == [1, 2, 3, 7, 5, 4, 6]
+        assert list(sample[("t0", "knows", "t0")]["edge_index"].shape) == [2, 7]
+
+    assert num_samples == 256
+
+
 @pytest.mark.skipif(isinstance(torch, MissingModule), reason="torch not available")
 def test_cugraph_loader_from_disk_subset_renumbered():
     F = FeatureStore()
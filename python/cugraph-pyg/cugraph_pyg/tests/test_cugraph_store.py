@@ -252,6 +252,30 @@ def test_get_tensor(graph):
             assert tsr == base_series
 
 
+@pytest.mark.skipif(isinstance(torch, MissingModule), reason="torch not available")
+def test_get_tensor_properties(graph):
+    F, G, N = graph
+    cugraph_store = CuGraphStore(F, G, N)
+
+    feat_names = list(F.get_feature_list().keys())
+    for vertex_type in sorted(N.keys()):
+        v_ids = np.arange(N[vertex_type])
+        base_series = np.stack(
+            [F.get_data(v_ids, vertex_type, feat_name) for feat_name in feat_names]
+        )
+
+        tsr = cugraph_store.get_tensor(
+            CuGraphTensorAttr(
+                group_name=vertex_type,
+                attr_name=feat_names[0],
+                index=v_ids,
+                properties=feat_names,
+            )
+        )
+
+        assert tsr.tolist() == base_series.tolist()
+
+
 @pytest.mark.skipif(isinstance(torch, MissingModule), reason="torch not available")
 def test_get_tensor_empty_idx(karate_gnn):
     F, G, N = karate_gnn
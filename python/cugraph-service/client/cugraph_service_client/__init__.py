@@ -33,6 +33,7 @@ extension_return_dtype_map.update(
 )
 
 from cugraph_service_client.client import CugraphServiceClient
+from cugraph_service_client.async_client import AsyncCugraphServiceClient
 from cugraph_service_client.remote_graph import RemoteGraph
 
 __version__ = "23.10.00"
@@ -0,0 +1,158 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+
+from cugraph_service_client import defaults
+from cugraph_service_client.client import CugraphServiceClient
+
+
+class AsyncCugraphServiceClient:
+    """
+    asyncio-friendly client object for cugraph_service. This provides the same
+    API as CugraphServiceClient, except that server APIs are coroutines and
+    APIs returning generators of pages (eg. get_graph_vertex_data_pages()) are
+    async generators.
+
+    Server calls are run in a pool of threads, each using its own connection,
+    so up to pool_size calls can be awaited concurrently without blocking the
+    event loop.
+    """
+
+    def __init__(
+        self,
+        host=defaults.host,
+        port=defaults.port,
+        results_port=defaults.results_port,
+        *,
+        pool_size=4,
+        keep_alive=30,
+    ):
+        """
+        Creates a client for a cugraph_service server running on host/port.
+
+        Parameters
+        ----------
+        host : string, defaults to 127.0.0.1
+            Hostname where the cugraph_service server is running
+
+        port : int, defaults to 9090
+            Port number where the cugraph_service server is listening
+
+        pool_size : int, defaults to 4
+            The maximum number of concurrent server calls, and the maximum
+            number of connections open to the server at once.
+
+        keep_alive : float, defaults to 30
+            The number of seconds a connection is kept open for reuse by later
+            calls.
+
+        Returns
+        -------
+        AsyncCugraphServiceClient object
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> from cugraph_service_client import AsyncCugraphServiceClient
+        >>> async def main():
+        ...     async with AsyncCugraphServiceClient() as client:
+        ...         return await asyncio.gather(
+        ...             client.get_num_vertices(), client.get_num_edges()
+        ...         )
+        >>> asyncio.run(main())
+        """
+        self.client = CugraphServiceClient(
+            host,
+            port,
+            results_port,
+            pool_size=pool_size,
+            keep_alive=keep_alive,
+        )
+        self.__executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="cugraph_service_client"
+        )
+
+    def __getattr__(self, attr):
+        # Called only for attributes not found on this object. Avoid recursion
+        # if __init__ did not complete.
+        if attr in ("client", "_AsyncCugraphServiceClient__executor"):
+            raise AttributeError(attr)
+
+        client_attr = getattr(self.client, attr)
+        if not callable(client_attr) or attr.startswith("_"):
+            return client_attr
+        if attr.endswith("_pages"):
+            return self.__make_async_generator(client_attr)
+        return self.__make_coroutine(client_attr)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the connections to the server and stops the threads used to run
+        server calls. The client cannot be used after this is called.
+        """
+        self.__executor.shutdown(wait=True)
+        self.client.close()
+        self.client.close_pool()
+
+    def __make_coroutine(self, method):
+        """
+        Returns a coroutine function that awaits method called in the thread
+        pool.
+        """
+
+        @wraps(method)
+        async def coroutine(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.__executor, partial(method, *args, **kwargs)
+            )
+
+        return coroutine
+
+    def __make_async_generator(self, method):
+        """
+        Returns an async generator function that yields the items of the
+        generator returned by method, each retrieved in the thread pool.
+        """
+
+        @wraps(method)
+        async def async_generator(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            pages = await loop.run_in_executor(
+                self.__executor, partial(method, *args, **kwargs)
+            )
+            # Use a sentinel since StopIteration cannot be raised into a future
+            done = object()
+            try:
+                while True:
+                    page = await loop.run_in_executor(
+                        self.__executor, next, pages, done
+                    )
+                    if page is done:
+                        break
+                    yield page
+            finally:
+                # Close the server-side cursor if iteration stopped early
+                await loop.run_in_executor(self.__executor, pages.close)
+
+        return async_generator
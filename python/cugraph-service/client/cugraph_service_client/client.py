@@ -29,18 +29,22 @@ from cugraph_service_client.remote_graph import RemoteGraph
 from cugraph_service_client import extension_return_dtype_map
 from cugraph_service_client.types import (
     ValueWrapper,
+    ArrayWrapper,
     GraphVertexEdgeID,
     UniformNeighborSampleResult,
 )
-from cugraph_service_client.cugraph_service_thrift import create_client
+from cugraph_service_client.connection_pool import ConnectionPool
+from cugraph_service_client.exceptions import CugraphServiceError
 
 cp = import_optional("cupy")
 cudf = import_optional("cudf")
 pandas = import_optional("pandas")
+pa = import_optional("pyarrow")
 
 cupy_installed = not isinstance(cp, MissingModule)
 cudf_installed = not isinstance(cudf, MissingModule)
 pandas_installed = not isinstance(pandas, MissingModule)
+pyarrow_installed = not isinstance(pa, MissingModule)
 
 
 class RunAsyncioThread(threading.Thread):
@@ -136,11 +140,20 @@ class CugraphServiceClient:
     """
 
     def __init__(
-        self, host=defaults.host, port=defaults.port, results_port=defaults.results_port
+        self,
+        host=defaults.host,
+        port=defaults.port,
+        results_port=defaults.results_port,
+        *,
+        pool_size=1,
+        keep_alive=0,
     ):
         """
         Creates a connection to a cugraph_service server running on host/port.
 
+        The client can be shared by multiple threads, each of which uses its
+        own connection from a pool of at most pool_size connections.
+
         Parameters
         ----------
         host : string, defaults to 127.0.0.1
@@ -149,6 +162,16 @@ class CugraphServiceClient:
         port : int, defaults to 9090
             Port number where the cugraph_service server is listening
 
+        pool_size : int, defaults to 1
+            The maximum number of connections open to the server at once.
+            Threads making server calls wait for a connection if all of them
+            are in use.
+
+        keep_alive : float, defaults to 0
+            The number of seconds a connection is kept open for reuse by
+            later calls. By default, connections are closed after each call
+            so that other clients are not kept from connecting.
+
         Returns
         -------
         CugraphServiceClient object
@@ -157,11 +180,17 @@ class CugraphServiceClient:
         --------
         >>> from cugraph_service_client import CugraphServiceClient
         >>> client = CugraphServiceClient()
+        >>> # Share a client between 8 threads, reusing connections
+        >>> client = CugraphServiceClient(pool_size=8, keep_alive=30)
         """
         self.host = host
         self.port = port
         self.results_port = results_port
-        self.__client = None
+        self.__pool = ConnectionPool(
+            host, port, max_size=pool_size, keep_alive=keep_alive
+        )
+        # The connection currently used by each thread
+        self.__local = threading.local()
 
         # If True, do not automatically close a server connection upon
         # completion or error of a server API call. This requires the caller to
@@ -169,7 +198,17 @@ class CugraphServiceClient:
         self.hold_open = False
 
     def __del__(self):
-        self.close()
+        # __init__ may have raised before creating the pool
+        if hasattr(self, "_CugraphServiceClient__pool"):
+            self.close()
+            self.close_pool()
+
+    @property
+    def __client(self):
+        """
+        The server connection opened by the current thread, or None.
+        """
+        return getattr(self.__local, "connection", None)
 
     def __server_connection(method):
         """
@@ -185,11 +224,19 @@ class CugraphServiceClient:
         @wraps(method)
         def wrapped_method(self, *args, **kwargs):
             self.open()
+            discard = False
             try:
                 ret_val = method(self, *args, **kwargs)
+            except CugraphServiceError:
+                raise
+            except Exception:
+                # The connection may be left in an unknown state (eg. after a
+                # timeout), so do not return it to the pool for reuse.
+                discard = True
+                raise
             finally:
                 if not self.hold_open:
-                    self.close()
+                    self.close(discard=discard)
             return ret_val
 
         return wrapped_method
@@ -228,19 +275,21 @@ class CugraphServiceClient:
 
         """
         if self.__client is None:
-            self.__client = create_client(
-                self.host, self.port, call_timeout=call_timeout
-            )
+            self.__local.connection = self.__pool.acquire(call_timeout)
 
-    def close(self):
+    def close(self, discard=False):
         """
         Closes a connection to the server if one has been established, allowing
         other clients to access the server. This method is called automatically
         for all APIs that access the server if self.hold_open is False.
 
+        If the client was created with a keep_alive value, the connection is
+        returned to the pool for reuse instead of being closed.
+
         Parameters
         ----------
-        None
+        discard : bool (default is False)
+            If True, close the connection even if keep_alive was specified.
 
         Returns
         -------
@@ -260,9 +309,26 @@ class CugraphServiceClient:
         >>> # go back to automatic open/close mode (safer)
         >>> client.hold_open = False
         """
-        if self.__client is not None:
-            self.__client.close()
-            self.__client = None
+        connection = self.__client
+        if connection is not None:
+            self.__local.connection = None
+            self.__pool.release(connection, discard=discard)
+
+    def close_pool(self):
+        """
+        Closes all connections kept open for reuse (see the keep_alive
+        parameter of the constructor). Connections currently in use by other
+        threads are not closed.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.__pool.close()
 
     ###########################################################################
     # Environment management
@@ -863,9 +929,44 @@ class CugraphServiceClient:
     def get_edge_IDs_for_vertices(
         self, src_vert_IDs, dst_vert_IDs, graph_id=defaults.graph_id
     ):
-        """ """
-        # FIXME: finish docstring above
-        # FIXME: add type checking
+        """
+        Returns the edge IDs of the edges defined by the vertex IDs in each of
+        src_vert_IDs and dst_vert_IDs, looked up in a single batched call to
+        the server.
+
+        Parameters
+        ----------
+        src_vert_IDs : list, numpy/cupy array, or pandas/cudf Series of ints
+            The source vertex IDs of the edges.
+
+        dst_vert_IDs : list, numpy/cupy array, or pandas/cudf Series of ints
+            The destination vertex IDs of the edges, the same length as
+            src_vert_IDs.
+
+        graph_id : int, default is defaults.graph_id
+            The graph ID of a graph extracted from a PropertyGraph.
+
+        Returns
+        -------
+        A list of edge IDs, where the edge ID at position i is the ID of the
+        edge (src_vert_IDs[i], dst_vert_IDs[i]).
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> # Assume a graph containing edges (1, 0), (2, 0) was extracted and
+        >>> # has graph ID 1
+        >>> client.get_edge_IDs_for_vertices([1, 2], [0, 0], graph_id=1)
+        [0, 1]
+        """
+        src_vert_IDs = self.__get_id_list(src_vert_IDs)
+        dst_vert_IDs = self.__get_id_list(dst_vert_IDs)
+        if len(src_vert_IDs) != len(dst_vert_IDs):
+            raise ValueError(
+                "src_vert_IDs and dst_vert_IDs must be the same length, got "
+                f"{len(src_vert_IDs)} and {len(dst_vert_IDs)}"
+            )
         return self.__client.get_edge_IDs_for_vertices(
             src_vert_IDs, dst_vert_IDs, graph_id
         )
@@ -977,6 +1078,7 @@ class CugraphServiceClient:
         property_keys=None,
         types=None,
         graph_id=defaults.graph_id,
+        result_format="numpy",
     ):
         """
         Returns ...
@@ -999,8 +1101,17 @@ class CugraphServiceClient:
            The graph ID to extract the subgraph from. If the ID passed is not
            valid on the server, CugraphServiceError is raised.
 
+        result_format : string (default "numpy")
+            The type of object to return the data as, one of "numpy", "arrow",
+            "pandas", or "cudf". For all but "numpy", the server sends the data
+            as an Arrow IPC stream which keeps the dtype of each column and
+            any NA values (null_replacement_value is not used), and requires
+            pyarrow to be installed.
+
         Returns
         -------
+        A numpy array, pyarrow Table, pandas DataFrame, or cudf DataFrame, as
+        specified by result_format.
 
         Examples
         --------
@@ -1008,20 +1119,22 @@ class CugraphServiceClient:
         """
         # FIXME: finish docstring above
 
+        server_result_format = self.__get_server_result_format(result_format)
         vertex_edge_id_obj = self.__get_vertex_edge_id_obj(id_or_ids)
         null_replacement_value_obj = ValueWrapper(
             null_replacement_value, val_name="null_replacement_value"
         ).union
 
-        ndarray_bytes = self.__client.get_graph_vertex_data(
+        data_bytes = self.__client.get_graph_vertex_data(
             vertex_edge_id_obj,
             null_replacement_value_obj,
             property_keys or [],
             types or [],
             graph_id,
+            server_result_format,
         )
 
-        return pickle.loads(ndarray_bytes)
+        return self.__get_graph_data_result(data_bytes, result_format)
 
     @__server_connection
     def get_graph_edge_data(
@@ -1031,6 +1144,7 @@ class CugraphServiceClient:
         property_keys=None,
         types=None,
         graph_id=defaults.graph_id,
+        result_format="numpy",
     ):
         """
         Returns ...
@@ -1053,8 +1167,17 @@ class CugraphServiceClient:
            The graph ID to extract the subgraph from. If the ID passed is not
            valid on the server, CugraphServiceError is raised.
 
+        result_format : string (default "numpy")
+            The type of object to return the data as, one of "numpy", "arrow",
+            "pandas", or "cudf". For all but "numpy", the server sends the data
+            as an Arrow IPC stream which keeps the dtype of each column and
+            any NA values (null_replacement_value is not used), and requires
+            pyarrow to be installed.
+
         Returns
         -------
+        A numpy array, pyarrow Table, pandas DataFrame, or cudf DataFrame, as
+        specified by result_format.
 
         Examples
         --------
@@ -1062,20 +1185,142 @@ class CugraphServiceClient:
         """
         # FIXME: finish docstring above
 
+        server_result_format = self.__get_server_result_format(result_format)
         vertex_edge_id_obj = self.__get_vertex_edge_id_obj(id_or_ids)
         null_replacement_value_obj = ValueWrapper(
             null_replacement_value, val_name="null_replacement_value"
         ).union
 
-        ndarray_bytes = self.__client.get_graph_edge_data(
+        data_bytes = self.__client.get_graph_edge_data(
             vertex_edge_id_obj,
             null_replacement_value_obj,
             property_keys or [],
             types or [],
             graph_id,
+            server_result_format,
         )
 
-        return pickle.loads(ndarray_bytes)
+        return self.__get_graph_data_result(data_bytes, result_format)
+
+    def get_graph_vertex_data_pages(
+        self,
+        id_or_ids=-1,
+        null_replacement_value=0,
+        property_keys=None,
+        types=None,
+        graph_id=defaults.graph_id,
+        result_format="numpy",
+        page_size=defaults.page_size,
+    ):
+        """
+        Returns a generator of the data returned by get_graph_vertex_data(),
+        retrieved from the server in pages of at most page_size rows. Only one
+        page at a time is serialized and sent, which bounds the memory used for
+        the transfer and the time taken by each server call.
+
+        The result is computed when iteration starts, and the server holds it
+        until the last page is retrieved or the generator is closed. The
+        server also releases results that are not retrieved for a while, after
+        which retrieving the next page raises CugraphServiceError.
+
+        Parameters
+        ----------
+        See get_graph_vertex_data() for the other parameters.
+
+        page_size : int (default is defaults.page_size)
+            The maximum number of rows in each page.
+
+        Returns
+        -------
+        A generator of numpy arrays, pyarrow Tables, pandas DataFrames, or cudf
+        DataFrames, as specified by result_format.
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> for page in client.get_graph_vertex_data_pages(page_size=1000):
+        ...     print(page.shape)
+        """
+        server_result_format = self.__get_server_result_format(result_format)
+        vertex_edge_id_obj = self.__get_vertex_edge_id_obj(id_or_ids)
+
+        def open_cursor():
+            return self.__call_server(
+                "open_graph_vertex_data_cursor",
+                vertex_edge_id_obj,
+                property_keys or [],
+                types or [],
+                graph_id,
+            )
+
+        return self.__get_graph_data_pages(
+            open_cursor,
+            page_size,
+            null_replacement_value,
+            result_format,
+            server_result_format,
+        )
+
+    def get_graph_edge_data_pages(
+        self,
+        id_or_ids=-1,
+        null_replacement_value=0,
+        property_keys=None,
+        types=None,
+        graph_id=defaults.graph_id,
+        result_format="numpy",
+        page_size=defaults.page_size,
+    ):
+        """
+        Returns a generator of the data returned by get_graph_edge_data(),
+        retrieved from the server in pages of at most page_size rows. Only one
+        page at a time is serialized and sent, which bounds the memory used for
+        the transfer and the time taken by each server call.
+
+        The result is computed when iteration starts, and the server holds it
+        until the last page is retrieved or the generator is closed. The
+        server also releases results that are not retrieved for a while, after
+        which retrieving the next page raises CugraphServiceError.
+
+        Parameters
+        ----------
+        See get_graph_edge_data() for the other parameters.
+
+        page_size : int (default is defaults.page_size)
+            The maximum number of rows in each page.
+
+        Returns
+        -------
+        A generator of numpy arrays, pyarrow Tables, pandas DataFrames, or cudf
+        DataFrames, as specified by result_format.
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> for page in client.get_graph_edge_data_pages(page_size=1000):
+        ...     print(page.shape)
+        """
+        server_result_format = self.__get_server_result_format(result_format)
+        vertex_edge_id_obj = self.__get_vertex_edge_id_obj(id_or_ids)
+
+        def open_cursor():
+            return self.__call_server(
+                "open_graph_edge_data_cursor",
+                vertex_edge_id_obj,
+                property_keys or [],
+                types or [],
+                graph_id,
+            )
+
+        return self.__get_graph_data_pages(
+            open_cursor,
+            page_size,
+            null_replacement_value,
+            result_format,
+            server_result_format,
+        )
 
     @__server_connection
     def is_vertex_property(self, property_key, graph_id=defaults.graph_id):
@@ -1219,10 +1464,10 @@ class CugraphServiceClient:
         )
 
         return (
-            batched_ego_graphs_result.src_verts,
-            batched_ego_graphs_result.dst_verts,
-            batched_ego_graphs_result.edge_weights,
-            batched_ego_graphs_result.seeds_offsets,
+            ArrayWrapper(batched_ego_graphs_result.src_verts).get_py_obj(),
+            ArrayWrapper(batched_ego_graphs_result.dst_verts).get_py_obj(),
+            ArrayWrapper(batched_ego_graphs_result.edge_weights).get_py_obj(),
+            ArrayWrapper(batched_ego_graphs_result.seeds_offsets).get_py_obj(),
         )
 
     @__server_connection
@@ -1251,16 +1496,16 @@ class CugraphServiceClient:
         # FIXME: finish docstring above
 
         # start_vertices must be a list (cannot just be an iterable), and
-        # assume return value is tuple of python lists on host.
+        # assume return value is tuple of numpy arrays on host.
         if not isinstance(start_vertices, list):
             start_vertices = [start_vertices]
         # FIXME: ensure list is a list of int32, since Thrift interface
         # specifies that?
         node2vec_result = self.__client.node2vec(start_vertices, max_depth, graph_id)
         return (
-            node2vec_result.vertex_paths,
-            node2vec_result.edge_weights,
-            node2vec_result.path_sizes,
+            ArrayWrapper(node2vec_result.vertex_paths).get_py_obj(),
+            ArrayWrapper(node2vec_result.edge_weights).get_py_obj(),
+            ArrayWrapper(node2vec_result.path_sizes).get_py_obj(),
         )
 
     @__server_connection
@@ -1290,19 +1535,21 @@ class CugraphServiceClient:
         Returns
         -------
         result : UniformNeighborSampleResult
-            Instance containing three CuPy device arrays.
+            Instance containing three read-only numpy arrays, or three CuPy
+            device arrays if result_device is specified.
 
-            result.sources: CuPy array
+            result.sources: numpy or CuPy array
                 Contains the source vertices from the sampling result
-            result.destinations: CuPy array
+            result.destinations: numpy or CuPy array
                 Contains the destination vertices from the sampling result
-            result.indices: CuPy array
+            result.indices: numpy or CuPy array
                 Contains the indices from the sampling result for path reconstruction
         """
 
         if result_device is not None:
             result_obj = run_async(
                 self.__uniform_neighbor_sample_to_device,
+                self.__client,
                 start_list,
                 fanout_vals,
                 with_replacement,
@@ -1311,16 +1558,75 @@ class CugraphServiceClient:
             )
 
         else:
-            result_obj = self.__client.uniform_neighbor_sample(
+            result_obj = self.__get_uniform_neighbor_sample_result(
+                self.__client.uniform_neighbor_sample(
+                    start_list,
+                    fanout_vals,
+                    with_replacement,
+                    graph_id,
+                    client_host=None,
+                    client_result_port=None,
+                )
+            )
+
+        return result_obj
+
+    def get_uniform_neighbor_sample_pages(
+        self,
+        start_list,
+        fanout_vals,
+        with_replacement=True,
+        *,
+        graph_id=defaults.graph_id,
+        page_size=defaults.page_size,
+    ):
+        """
+        Samples the graph and returns a generator of UniformNeighborSampleResult
+        instances, each containing at most page_size rows of the result. The
+        server samples once when iteration starts, and holds the result until
+        the last page is retrieved or the generator is closed. The server also
+        releases results that are not retrieved for a while, after which
+        retrieving the next page raises CugraphServiceError.
+
+        Parameters
+        ----------
+        See uniform_neighbor_sample() for the other parameters.
+
+        page_size : int (default is defaults.page_size)
+            The maximum number of rows in each page.
+
+        Returns
+        -------
+        A generator of UniformNeighborSampleResult instances.
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> for page in client.get_uniform_neighbor_sample_pages(
+        ...     [0, 1], [2], page_size=1000, graph_id=1
+        ... ):
+        ...     print(len(page.sources))
+        """
+
+        def open_cursor():
+            return self.__call_server(
+                "open_uniform_neighbor_sample_cursor",
                 start_list,
                 fanout_vals,
                 with_replacement,
                 graph_id,
-                client_host=None,
-                client_result_port=None,
             )
 
-        return result_obj
+        def get_page(cursor_id):
+            page = self.__get_uniform_neighbor_sample_result(
+                self.__call_server(
+                    "get_uniform_neighbor_sample_page", cursor_id, page_size
+                )
+            )
+            return (page, len(page.sources))
+
+        return self.__get_cursor_pages(open_cursor, page_size, get_page)
 
     @__server_connection
     def pagerank(self, graph_id=defaults.graph_id):
@@ -1405,11 +1711,19 @@ class CugraphServiceClient:
         return result_obj.array
 
     async def __uniform_neighbor_sample_to_device(
-        self, start_list, fanout_vals, with_replacement, graph_id, result_device
+        self,
+        connection,
+        start_list,
+        fanout_vals,
+        with_replacement,
+        graph_id,
+        result_device,
     ):
         """
-        Run uniform_neighbor_sample() with the args provided, but have the
-        result send directly to the device specified by result_device.
+        Run uniform_neighbor_sample() with the args provided using connection,
+        but have the result send directly to the device specified by
+        result_device. The connection is passed in since this may be run in a
+        different thread than the one that opened it.
         """
         # FIXME: check for valid device
         result_obj = UniformNeighborSampleResult()
@@ -1440,7 +1754,7 @@ class CugraphServiceClient:
         threading.excepthook = excepthook
 
         thread = threading.Thread(
-            target=self.__client.uniform_neighbor_sample,
+            target=connection.uniform_neighbor_sample,
             args=(
                 start_list,
                 fanout_vals,
@@ -1538,6 +1852,140 @@ class CugraphServiceClient:
             result = result[0]
         return result
 
+    @__server_connection
+    def __call_server(self, func_name, *args):
+        """
+        Calls the server function func_name with args using a connection that
+        is closed afterwards (unless self.hold_open is True). This is used by
+        generators, which cannot hold a connection open between pages without
+        blocking other clients.
+        """
+        return getattr(self.__client, func_name)(*args)
+
+    def __get_cursor_pages(self, open_cursor, page_size, get_page):
+        """
+        Opens a server cursor using open_cursor(), which returns the cursor
+        ID, and yields the pages returned by get_page(cursor_id) until a page
+        with fewer than page_size rows (the last page) is returned. get_page()
+        returns a (page, number of rows) tuple. If the generator is closed
+        before the last page, the cursor is closed on the server.
+
+        The cursor is opened when iteration starts, so that a generator that
+        is never iterated does not leave a cursor open on the server.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be > 0, got {page_size}")
+        cursor_id = open_cursor()
+        done = False
+        try:
+            while not done:
+                page, num_rows = get_page(cursor_id)
+                done = num_rows < page_size
+                if num_rows > 0:
+                    yield page
+        finally:
+            if not done:
+                self.__call_server("close_cursor", cursor_id)
+
+    def __get_graph_data_pages(
+        self,
+        open_cursor,
+        page_size,
+        null_replacement_value,
+        result_format,
+        server_result_format,
+    ):
+        """
+        Returns a generator of the pages of vertex or edge data for the cursor
+        opened by open_cursor().
+        """
+        null_replacement_value_obj = ValueWrapper(
+            null_replacement_value, val_name="null_replacement_value"
+        ).union
+
+        def get_page(cursor_id):
+            data_bytes = self.__call_server(
+                "get_graph_data_page",
+                cursor_id,
+                page_size,
+                null_replacement_value_obj,
+                server_result_format,
+            )
+            page = self.__get_graph_data_result(data_bytes, result_format)
+            return (page, len(page))
+
+        return self.__get_cursor_pages(open_cursor, page_size, get_page)
+
+    @staticmethod
+    def __get_uniform_neighbor_sample_result(result_obj):
+        """
+        Replaces the Array structs in the UniformNeighborSampleResult received
+        from the server with numpy arrays, and returns it.
+        """
+        result_obj.sources = ArrayWrapper(result_obj.sources).get_py_obj()
+        result_obj.destinations = ArrayWrapper(result_obj.destinations).get_py_obj()
+        result_obj.indices = ArrayWrapper(result_obj.indices).get_py_obj()
+        return result_obj
+
+    @staticmethod
+    def __get_server_result_format(result_format):
+        """
+        Returns the format the server is to serialize graph data in for the
+        given result_format.
+        """
+        if result_format == "numpy":
+            return "numpy"
+        if result_format in ("arrow", "pandas", "cudf"):
+            if not pyarrow_installed:
+                raise RuntimeError(
+                    f"result_format '{result_format}' requires the pyarrow "
+                    "package/module"
+                )
+            return "arrow"
+        raise ValueError(
+            "result_format must be one of 'numpy', 'arrow', 'pandas', or "
+            f"'cudf', got {result_format}"
+        )
+
+    @staticmethod
+    def __get_graph_data_result(data_bytes, result_format):
+        """
+        Returns the object of the type specified by result_format for the
+        graph data received from the server.
+        """
+        if result_format == "numpy":
+            return pickle.loads(data_bytes)
+
+        # Reading the stream from a buffer references the received bytes
+        # rather than copying them into the table.
+        with pa.ipc.open_stream(pa.py_buffer(data_bytes)) as reader:
+            table = reader.read_all()
+        if result_format == "pandas":
+            return table.to_pandas()
+        if result_format == "cudf":
+            return cudf.DataFrame.from_arrow(table)
+        return table
+
+    @staticmethod
+    def __get_id_list(ids):
+        """
+        Returns ids, which can be a list or array-like of ints, as a list of
+        Python ints for passing to the server.
+        """
+        if isinstance(ids, list):
+            return ids
+        if isinstance(ids, Sequence):
+            return list(ids)
+        if cupy_installed and isinstance(ids, cp.ndarray):
+            ids = ids.get()
+        elif cudf_installed and isinstance(ids, cudf.Series):
+            ids = ids.values_host
+        elif pandas_installed and isinstance(ids, pandas.Series):
+            ids = ids.to_numpy()
+        if isinstance(ids, np.ndarray):
+            return ids.tolist()
+        raise TypeError(f"expected a list or array of IDs, got {type(ids)}")
+
     @staticmethod
     def __get_vertex_edge_id_obj(id_or_ids):
         # Force np.ndarray
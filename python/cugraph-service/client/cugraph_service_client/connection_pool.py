@@ -0,0 +1,145 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+from cugraph_service_client.cugraph_service_thrift import create_client
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of connections to a cugraph_service server.
+
+    At most max_size connections are open at once; acquire() blocks until a
+    connection is released if all of them are in use. Released connections
+    are kept open for reuse for keep_alive seconds, or closed immediately if
+    keep_alive is 0.
+    """
+
+    def __init__(self, host, port, max_size=1, keep_alive=0):
+        """
+        Parameters
+        ----------
+        host : string
+            Hostname where the cugraph_service server is running
+
+        port : int
+            Port number where the cugraph_service server is listening
+
+        max_size : int (default is 1)
+            The maximum number of connections open at once.
+
+        keep_alive : float (default is 0)
+            The number of seconds an idle connection is kept open for reuse.
+            This should be less than the server's client timeout (90 seconds
+            by default), after which the server closes idle connections.
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be > 0, got {max_size}")
+        if keep_alive < 0:
+            raise ValueError(f"keep_alive must be >= 0, got {keep_alive}")
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.keep_alive = keep_alive
+
+        # Idle connections as (connection, call_timeout, time released) tuples,
+        # most recently released last.
+        self.__idle = []
+        self.__num_open = 0
+        self.__condition = threading.Condition()
+
+    def acquire(self, call_timeout=900000):
+        """
+        Returns an open connection with the given call_timeout (see
+        cugraph_service_thrift.create_client()), reusing an idle connection if
+        possible. The connection must be returned with release().
+        """
+        with self.__condition:
+            while True:
+                self.__close_expired_connections()
+                for i in range(len(self.__idle) - 1, -1, -1):
+                    (connection, timeout, _) = self.__idle[i]
+                    if timeout == call_timeout:
+                        del self.__idle[i]
+                        return connection
+                if self.__num_open < self.max_size:
+                    break
+                if self.__idle:
+                    # Make room for a connection with a different timeout
+                    self.__close_connection(self.__idle.pop(0)[0])
+                    break
+                self.__condition.wait()
+            self.__num_open += 1
+
+        # Connect outside of the lock so other threads can use the pool
+        try:
+            connection = create_client(self.host, self.port, call_timeout=call_timeout)
+        except Exception:
+            with self.__condition:
+                self.__num_open -= 1
+                self.__condition.notify()
+            raise
+        connection._cugraph_service_call_timeout = call_timeout
+        return connection
+
+    def release(self, connection, discard=False):
+        """
+        Returns connection, obtained from acquire(), to the pool. The
+        connection is closed if discard is True (for example, if a transport
+        error occurred while using it) or if keep_alive is 0.
+        """
+        with self.__condition:
+            if discard or self.keep_alive == 0:
+                self.__close_connection(connection)
+            else:
+                self.__idle.append(
+                    (
+                        connection,
+                        connection._cugraph_service_call_timeout,
+                        time.monotonic(),
+                    )
+                )
+            self.__condition.notify()
+
+    def close(self):
+        """
+        Closes all idle connections. Connections currently in use are closed
+        when they are released if keep_alive is 0, otherwise they are kept
+        until close() is called again.
+        """
+        with self.__condition:
+            while self.__idle:
+                self.__close_connection(self.__idle.pop()[0])
+            self.__condition.notify_all()
+
+    def __close_expired_connections(self):
+        """
+        Closes the idle connections that have been idle for longer than
+        keep_alive. Must be called with self.__condition held.
+        """
+        expire_time = time.monotonic() - self.keep_alive
+        while self.__idle and self.__idle[0][2] < expire_time:
+            self.__close_connection(self.__idle.pop(0)[0])
+
+    def __close_connection(self, connection):
+        """
+        Closes connection. Must be called with self.__condition held.
+        """
+        self.__num_open -= 1
+        try:
+            connection.close()
+        except Exception:
+            pass
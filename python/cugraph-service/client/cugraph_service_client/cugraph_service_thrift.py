@@ -13,11 +13,13 @@
 # limitations under the License.
 
 import io
+import threading
+from functools import wraps
 
 import thriftpy2
 from thriftpy2.rpc import make_client
 from thriftpy2.protocol import TBinaryProtocolFactory
-from thriftpy2.server import TSimpleServer
+from thriftpy2.server import TThreadedServer
 from thriftpy2.thrift import TProcessor
 from thriftpy2.transport import (
     TBufferedTransportFactory,
@@ -44,25 +46,33 @@ exception CugraphServiceError {
   1:string message
 }
 
+# A 1-D array of numbers as the bytes of its little-endian values, along with
+# the numpy dtype string (eg. "<i4") needed to interpret them. This avoids
+# creating a Thrift value (and a Python object) for each element.
+struct Array {
+  1:binary data
+  2:string dtype
+}
+
 struct BatchedEgoGraphsResult {
-  1:list<i32> src_verts
-  2:list<i32> dst_verts
-  3:list<double> edge_weights
-  4:list<i32> seeds_offsets
+  1:Array src_verts
+  2:Array dst_verts
+  3:Array edge_weights
+  4:Array seeds_offsets
 }
 
 struct Node2vecResult {
-  1:list<i32> vertex_paths
-  2:list<double> edge_weights
-  3:list<i32> path_sizes
+  1:Array vertex_paths
+  2:Array edge_weights
+  3:Array path_sizes
 }
 
 # FIXME: uniform_neighbor_sample may need to return indices as ints
 # See: https://github.com/rapidsai/cugraph/issues/2654
 struct UniformNeighborSampleResult {
-  1:list<i32> sources
-  2:list<i32> destinations
-  3:list<double> indices
+  1:Array sources
+  2:Array destinations
+  3:Array indices
 }
 
 union GraphVertexEdgeID {
@@ -175,11 +185,14 @@ service CugraphService {
                        8:i32 graph_id
                        ) throws (1:CugraphServiceError e),
 
+  # result_format is "numpy" (or "") for a pickled numpy array, or "arrow"
+  # for an Arrow IPC stream.
   binary get_graph_vertex_data(1:GraphVertexEdgeID vertex_id,
                                2:Value null_replacement_value,
                                3:list<string> property_keys,
                                4:list<string> types,
-                               5:i32 graph_id
+                               5:i32 graph_id,
+                               6:string result_format
                                ) throws (1:CugraphServiceError e),
 
   binary get_graph_edge_data(1:GraphVertexEdgeID edge_id,
@@ -187,6 +200,7 @@ service CugraphService {
                              3:list<string> property_keys,
                              4:list<string> types,
                              5:i32 graph_id,
+                             6:string result_format
                              ) throws (1:CugraphServiceError e),
 
   bool is_vertex_property(1:string property_key,
@@ -236,6 +250,41 @@ service CugraphService {
                           6:i16 result_port
                           ) throws (1:CugraphServiceError e),
 
+  ##############################################################################
+  # Cursors
+  # Results are returned a page at a time. A page with fewer than page_size
+  # rows is the last page, after which the cursor is closed by the server.
+  i32 open_graph_vertex_data_cursor(1:GraphVertexEdgeID vertex_id,
+                                    2:list<string> property_keys,
+                                    3:list<string> types,
+                                    4:i32 graph_id
+                                    ) throws (1:CugraphServiceError e),
+
+  i32 open_graph_edge_data_cursor(1:GraphVertexEdgeID edge_id,
+                                  2:list<string> property_keys,
+                                  3:list<string> types,
+                                  4:i32 graph_id
+                                  ) throws (1:CugraphServiceError e),
+
+  binary get_graph_data_page(1:i32 cursor_id,
+                             2:i64 page_size,
+                             3:Value null_replacement_value,
+                             4:string result_format
+                             ) throws (1:CugraphServiceError e),
+
+  i32 open_uniform_neighbor_sample_cursor(1:list<i32> start_list,
+                                          2:list<i32> fanout_vals,
+                                          3:bool with_replacement,
+                                          4:i32 graph_id
+                                          ) throws (1:CugraphServiceError e),
+
+  UniformNeighborSampleResult
+  get_uniform_neighbor_sample_page(1:i32 cursor_id,
+                                   2:i64 page_size
+                                   ) throws (1:CugraphServiceError e),
+
+  void close_cursor(1:i32 cursor_id) throws (1:CugraphServiceError e),
+
   ##############################################################################
   # Test/Debug
   i32 create_test_array(1:i64 nbytes
@@ -262,6 +311,29 @@ service CugraphService {
 spec = thriftpy2.load_fp(io.StringIO(cugraph_thrift_spec), module_name="cugraph_thrift")
 
 
+class _SerializedHandler:
+    """
+    Wraps a handler object so its methods can be called from multiple server
+    threads, one call at a time.
+    """
+
+    def __init__(self, handler):
+        self.__handler = handler
+        self.__lock = threading.Lock()
+
+    def __getattr__(self, attr):
+        handler_attr = getattr(self.__handler, attr)
+        if not callable(handler_attr):
+            return handler_attr
+
+        @wraps(handler_attr)
+        def serialized_method(*args, **kwargs):
+            with self.__lock:
+                return handler_attr(*args, **kwargs)
+
+        return serialized_method
+
+
 def create_server(handler, host, port, client_timeout=90000):
     """
     Return a server object configured to listen on host/port and use the
@@ -269,6 +341,12 @@ def create_server(handler, host, port, client_timeout=90000):
     an interface compatible with the CugraphService service defined in the
     Thrift specification.
 
+    Each client connection is served by its own thread, so clients that hold
+    connections open (for example, in a ConnectionPool) do not block other
+    clients from connecting. Calls to the handler are still made one at a
+    time. Connections idle for longer than client_timeout milliseconds are
+    closed by the server.
+
     Note: This function is defined here in order to allow it to have easy
     access to the Thrift spec loaded here on import, and to keep all thriftpy2
     calls in this module. However, this function is likely only called from the
@@ -278,13 +356,14 @@ def create_server(handler, host, port, client_timeout=90000):
     trans_factory = TBufferedTransportFactory()
     client_timeout = client_timeout
 
-    processor = TProcessor(spec.CugraphService, handler)
+    processor = TProcessor(spec.CugraphService, _SerializedHandler(handler))
     server_socket = TServerSocket(host=host, port=port, client_timeout=client_timeout)
-    server = TSimpleServer(
+    server = TThreadedServer(
         processor,
         server_socket,
         iprot_factory=proto_factory,
         itrans_factory=trans_factory,
+        daemon=True,
     )
     return server
 
@@ -16,3 +16,4 @@ host = "localhost"
 port = 9090
 results_port = 9091
 graph_id = 0
+page_size = 1000000
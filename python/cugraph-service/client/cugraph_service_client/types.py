@@ -24,6 +24,7 @@ except ModuleNotFoundError:
 
 from cugraph_service_client.cugraph_service_thrift import spec
 
+Array = spec.Array
 Value = spec.Value
 GraphVertexEdgeID = spec.GraphVertexEdgeID
 BatchedEgoGraphsResult = spec.BatchedEgoGraphsResult
@@ -191,3 +192,40 @@ class GraphVertexEdgeIDWrapper(UnionWrapper):
                 return val
 
         return None
+
+
+class ArrayWrapper:
+    """
+    Provides conversions between 1-D arrays of numbers (numpy or cupy arrays,
+    or sequences of numbers) and Thrift Array structs, which carry the values
+    as the bytes of a little-endian typed array.
+    """
+
+    def __init__(self, val, val_name="array"):
+        """
+        Construct with an Array struct, or an array or sequence of numbers to
+        convert to one.
+
+        val_name is used for better error messages only, and can be passed for
+        including in the exception thrown if an invalid type is passed here.
+        """
+        if isinstance(val, Array):
+            self.array = val
+            return
+        if cupy and isinstance(val, cupy.ndarray):
+            val = cupy.asnumpy(val)
+        val = numpy.asarray(val)
+        if val.ndim != 1 or val.dtype.kind not in "biuf":
+            raise TypeError(
+                f"{val_name} must be a 1-D array of numbers, got {val.ndim}-D "
+                f"array of {val.dtype}"
+            )
+        val = val.astype(val.dtype.newbyteorder("<"), copy=False)
+        self.array = Array(data=val.tobytes(), dtype=val.dtype.str)
+
+    def get_py_obj(self):
+        """
+        Get the values of the Array as a numpy array. The numpy array is a
+        read-only view of the received bytes rather than a copy.
+        """
+        return numpy.frombuffer(self.array.data, dtype=self.array.dtype)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
 from functools import cached_property
 from pathlib import Path
 import importlib
@@ -29,6 +30,7 @@ from cugraph.utilities.utils import import_optional
 
 import numpy as np
 import cupy as cp
+import pyarrow as pa
 import ucp
 import cudf
 import dask_cudf
@@ -63,6 +65,7 @@ from cugraph_service_client.types import (
     UniformNeighborSampleResult,
     ValueWrapper,
     GraphVertexEdgeIDWrapper,
+    ArrayWrapper,
     Offsets,
 )
 
@@ -161,7 +164,23 @@ class CugraphHandler:
     # instance for server extension functions.
     __server_facade_extension_param_name = "server"
 
-    def __init__(self):
+    def __init__(self, max_cursors=32, cursor_idle_timeout=600):
+        """
+        Parameters
+        ----------
+        max_cursors : int (default is 32)
+            The maximum number of open cursors (see
+            open_graph_vertex_data_cursor()). When a cursor is opened and this
+            many are already open, the least recently used one is closed.
+
+        cursor_idle_timeout : float (default is 600)
+            The number of seconds after which a cursor that has not been used
+            is closed, releasing its result. Cursors abandoned by clients,
+            for example clients that exited before retrieving the last page,
+            are closed this way.
+        """
+        if max_cursors < 1:
+            raise ValueError(f"max_cursors must be > 0, got {max_cursors}")
         self.__next_graph_id = defaults.graph_id + 1
         self.__graph_objs = {}
         self.__graph_creation_extensions = {}
@@ -171,6 +190,13 @@ class CugraphHandler:
         self.__start_time = int(time.time())
         self.__next_test_array_id = 0
         self.__test_arrays = {}
+        # Results being returned to clients a page at a time, as
+        # [DataFrame, next row position, time last used] lists keyed by cursor
+        # ID, least recently used first.
+        self.__next_cursor_id = 0
+        self.__cursors = OrderedDict()
+        self.__max_cursors = max_cursors
+        self.__cursor_idle_timeout = cursor_idle_timeout
 
     def __del__(self):
         self.shutdown_dask_client()
@@ -739,155 +765,52 @@ class CugraphHandler:
         return self._add_graph(G)
 
     def get_graph_vertex_data(
-        self, id_or_ids, null_replacement_value, property_keys, types, graph_id
+        self,
+        id_or_ids,
+        null_replacement_value,
+        property_keys,
+        types,
+        graph_id,
+        result_format="numpy",
     ):
         """
         Returns the vertex data as a serialized numpy array for the given
         id_or_ids.  null_replacement_value must be provided if the data
         contains NA values, since NA values cannot be serialized.
 
+        If result_format is "arrow", the data is instead returned as an Arrow
+        IPC stream, which preserves the column dtypes and NA values
+        (null_replacement_value is not used).
+
         If the graph is a structural graph (a graph without properties),
         this method does not accept the id_or_ids, property_keys, or types
         arguments, and instead returns a list of valid vertex ids.
         """
-        G = self._get_graph(graph_id)
-        ids = GraphVertexEdgeIDWrapper(id_or_ids).get_py_obj()
-        null_replacement_value = ValueWrapper(null_replacement_value).get_py_obj()
-
-        if ids == -1:
-            ids = None
-        elif not isinstance(ids, list):
-            ids = [ids]
-        if property_keys == []:
-            columns = None
-        else:
-            columns = property_keys
-        if types == []:
-            types = None
-        if isinstance(G, (PropertyGraph, MGPropertyGraph)):
-            if columns is not None and G.vertex_col_name in columns:
-                raise CugraphServiceError(
-                    f"ID key {G.vertex_col_name} is not allowed for property query. "
-                    f"Vertex IDs are always returned in query."
-                )
-
-            try:
-                df = G.get_vertex_data(vertex_ids=ids, columns=columns, types=types)
-                if isinstance(df, dask_cudf.DataFrame):
-                    df = df.compute()
-            except KeyError:
-                df = None
-        else:
-            if (columns is not None) or (ids is not None) or (types is not None):
-                raise CugraphServiceError("Graph does not contain properties")
-            if self.is_multi_gpu:
-                # FIXME may run out of memory for very lage graphs.
-                s = (
-                    dask_cudf.concat(
-                        [
-                            G.edgelist.edgelist_df[
-                                G.renumber_map.renumbered_src_col_name
-                            ],
-                            G.edgelist.edgelist_df[
-                                G.renumber_map.renumbered_dst_col_name
-                            ],
-                        ]
-                    )
-                    .unique()
-                    .compute()
-                )
-                df = cudf.DataFrame()
-                df["id"] = s
-                df = dask_cudf.from_cudf(df, npartitions=self.num_gpus)
-            else:
-                s = cudf.concat(
-                    [
-                        G.edgelist.edgelist_df[G.srcCol],
-                        G.edgelist.edgelist_df[G.dstCol],
-                    ]
-                ).unique()
-                df = cudf.DataFrame()
-                df["id"] = s
-            if G.is_renumbered():
-                df = G.unrenumber(df, "id", preserve_order=True)
-
-        return self.__get_graph_data_as_numpy_bytes(df, null_replacement_value)
+        df = self.__get_graph_vertex_dataframe(
+            id_or_ids, property_keys, types, graph_id
+        )
+        return self.__get_graph_data_as_bytes(df, null_replacement_value, result_format)
 
     def get_graph_edge_data(
-        self, id_or_ids, null_replacement_value, property_keys, types, graph_id
+        self,
+        id_or_ids,
+        null_replacement_value,
+        property_keys,
+        types,
+        graph_id,
+        result_format="numpy",
     ):
         """
         Returns the edge data as a serialized numpy array for the given
         id_or_ids.  null_replacement_value must be provided if the data
         contains NA values, since NA values cannot be serialized.
-        """
-        G = self._get_graph(graph_id)
-        ids = GraphVertexEdgeIDWrapper(id_or_ids).get_py_obj()
-        if ids == -1:
-            ids = None
-        elif not isinstance(ids, list):
-            ids = [ids]
-        if property_keys == []:
-            columns = None
-        else:
-            columns = property_keys
-        if types == []:
-            types = None
-        if isinstance(G, (PropertyGraph, MGPropertyGraph)):
-            try:
-                df = G.get_edge_data(edge_ids=ids, columns=columns, types=types)
-            except KeyError:
-                df = None
-        else:
-            if columns is not None:
-                raise CugraphServiceError(
-                    f"Graph does not contain properties. {columns}"
-                )
 
-            # Get the edgelist; API expects edge id, src, dst, type
-            df = G.edgelist.edgelist_df
-
-            if G.edgeIdCol in df.columns:
-                if ids is not None:
-                    if self.is_multi_gpu:
-                        # FIXME use ids = cudf.Series(ids) after dask_cudf fix
-                        ids = np.array(ids)
-                        df = df.reindex(df[G.edgeIdCol]).loc[ids]
-                    else:
-                        ids = cudf.Series(ids)
-                        df = df.reindex(df[G.edgeIdCol]).loc[ids]
-            else:
-                if ids is not None:
-                    raise CugraphServiceError("Graph does not have edge ids")
-                df[G.edgeIdCol] = df.index
-
-            if G.edgeTypeCol in df.columns:
-                if types is not None:
-                    df = df[df[G.edgeTypeCol].isin(types)]
-            else:
-                if types is not None:
-                    raise CugraphServiceError("Graph does not have typed edges")
-                df[G.edgeTypeCol] = ""
-
-            src_col_name = (
-                G.renumber_map.renumbered_src_col_name
-                if self.is_multi_gpu
-                else G.srcCol
-            )
-            dst_col_name = (
-                G.renumber_map.renumbered_dst_col_name
-                if self.is_multi_gpu
-                else G.dstCol
-            )
-            if G.is_renumbered():
-                df = G.unrenumber(df, src_col_name, preserve_order=True)
-                df = G.unrenumber(df, dst_col_name, preserve_order=True)
-
-            df = df[[G.edgeIdCol, src_col_name, dst_col_name, G.edgeTypeCol]]
-
-        if isinstance(df, dask_cudf.DataFrame):
-            df = df.compute()
-        return self.__get_graph_data_as_numpy_bytes(df, null_replacement_value)
+        If result_format is "arrow", the data is instead returned as an Arrow
+        IPC stream, which preserves the column dtypes and NA values
+        (null_replacement_value is not used).
+        """
+        df = self.__get_graph_edge_dataframe(id_or_ids, property_keys, types, graph_id)
+        return self.__get_graph_data_as_bytes(df, null_replacement_value, result_format)
 
     def is_vertex_property(self, property_key, graph_id):
         G = self._get_graph(graph_id)
@@ -996,18 +919,11 @@ class CugraphHandler:
             seeds = cudf.Series(seeds, dtype="int32")
             (ego_edge_list, seeds_offsets) = batched_ego_graphs(G, seeds, radius)
 
-            # batched_ego_graphs_result = BatchedEgoGraphsResult(
-            #     src_verts=ego_edge_list["src"].values_host.tobytes(), #i32
-            #     dst_verts=ego_edge_list["dst"].values_host.tobytes(), #i32
-            #     edge_weights=ego_edge_list["weight"].values_host.tobytes(),
-            #                                                             #f64
-            #     seeds_offsets=seeds_offsets.values_host.tobytes() #i64
-            # )
             batched_ego_graphs_result = BatchedEgoGraphsResult(
-                src_verts=ego_edge_list["src"].values_host,
-                dst_verts=ego_edge_list["dst"].values_host,
-                edge_weights=ego_edge_list["weight"].values_host,
-                seeds_offsets=seeds_offsets.values_host,
+                src_verts=ArrayWrapper(ego_edge_list["src"].values_host).array,
+                dst_verts=ArrayWrapper(ego_edge_list["dst"].values_host).array,
+                edge_weights=ArrayWrapper(ego_edge_list["weight"].values_host).array,
+                seeds_offsets=ArrayWrapper(seeds_offsets.values_host).array,
             )
             return batched_ego_graphs_result
         except Exception:
@@ -1039,9 +955,9 @@ class CugraphHandler:
             (paths, weights, path_sizes) = node2vec(G, start_vertices, max_depth)
 
             node2vec_result = Node2vecResult(
-                vertex_paths=paths.values_host,
-                edge_weights=weights.values_host,
-                path_sizes=path_sizes.values_host,
+                vertex_paths=ArrayWrapper(paths.values_host).array,
+                edge_weights=ArrayWrapper(weights.values_host).array,
+                path_sizes=ArrayWrapper(path_sizes.values_host).array,
             )
         except Exception:
             raise CugraphServiceError(f"{traceback.format_exc()}")
@@ -1059,23 +975,10 @@ class CugraphHandler:
     ):
         print("SERVER: running uns", flush=True)
         try:
-            G = self._get_graph(graph_id)
-            if isinstance(G, (MGPropertyGraph, PropertyGraph)):
-                # Implicitly extract a subgraph containing the entire multigraph.
-                # G will be garbage collected when this function returns.
-                G = G.extract_subgraph(
-                    create_using=MultiGraph(directed=True),
-                    default_edge_weight=1.0,
-                )
-
             print("SERVER: starting sampling...")
             st = time.perf_counter_ns()
-            uns_result = call_algo(
-                uniform_neighbor_sample,
-                G,
-                start_list=start_list,
-                fanout_vals=fanout_vals,
-                with_replacement=with_replacement,
+            uns_result = self.__uniform_neighbor_sample(
+                start_list, fanout_vals, with_replacement, graph_id
             )
             print(
                 f"SERVER: done sampling, took {((time.perf_counter_ns() - st) / 1e9)}s"
@@ -1104,10 +1007,11 @@ class CugraphHandler:
                 return UniformNeighborSampleResult()
 
             else:
-                uns_result.sources = cp.asnumpy(uns_result.sources)
-                uns_result.destinations = cp.asnumpy(uns_result.destinations)
-                uns_result.indices = cp.asnumpy(uns_result.indices)
-                return uns_result
+                return UniformNeighborSampleResult(
+                    sources=ArrayWrapper(uns_result.sources).array,
+                    destinations=ArrayWrapper(uns_result.destinations).array,
+                    indices=ArrayWrapper(uns_result.indices).array,
+                )
 
         except Exception:
             raise CugraphServiceError(f"{traceback.format_exc()}")
@@ -1116,6 +1020,87 @@ class CugraphHandler:
         """ """
         raise NotImplementedError
 
+    ###########################################################################
+    # Cursors
+    def open_graph_vertex_data_cursor(self, id_or_ids, property_keys, types, graph_id):
+        """
+        Returns a cursor ID for retrieving the vertex data described by the
+        args (see get_graph_vertex_data()) a page at a time using
+        get_graph_data_page().
+        """
+        df = self.__get_graph_vertex_dataframe(
+            id_or_ids, property_keys, types, graph_id
+        )
+        return self.__add_cursor(df)
+
+    def open_graph_edge_data_cursor(self, id_or_ids, property_keys, types, graph_id):
+        """
+        Returns a cursor ID for retrieving the edge data described by the args
+        (see get_graph_edge_data()) a page at a time using
+        get_graph_data_page().
+        """
+        df = self.__get_graph_edge_dataframe(id_or_ids, property_keys, types, graph_id)
+        return self.__add_cursor(df)
+
+    def get_graph_data_page(
+        self, cursor_id, page_size, null_replacement_value, result_format
+    ):
+        """
+        Returns the next page_size rows of the vertex or edge data for
+        cursor_id, serialized as in get_graph_vertex_data(). A page with fewer
+        than page_size rows is the last page, and the cursor is closed after
+        returning it.
+        """
+        df = self.__get_cursor_page(cursor_id, page_size)
+        return self.__get_graph_data_as_bytes(df, null_replacement_value, result_format)
+
+    def open_uniform_neighbor_sample_cursor(
+        self, start_list, fanout_vals, with_replacement, graph_id
+    ):
+        """
+        Runs uniform_neighbor_sample() on the graph for graph_id and returns a
+        cursor ID for retrieving the result a page at a time using
+        get_uniform_neighbor_sample_page().
+        """
+        try:
+            uns_result = self.__uniform_neighbor_sample(
+                start_list, fanout_vals, with_replacement, graph_id
+            )
+            df = cudf.DataFrame(
+                {
+                    "sources": uns_result.sources,
+                    "destinations": uns_result.destinations,
+                    "indices": uns_result.indices,
+                }
+            )
+        except Exception:
+            raise CugraphServiceError(f"{traceback.format_exc()}")
+
+        return self.__add_cursor(df)
+
+    def get_uniform_neighbor_sample_page(self, cursor_id, page_size):
+        """
+        Returns the next page_size rows of the uniform_neighbor_sample() result
+        for cursor_id as a UniformNeighborSampleResult. A page with fewer than
+        page_size rows is the last page, and the cursor is closed after
+        returning it.
+        """
+        df = self.__get_cursor_page(cursor_id, page_size)
+        return UniformNeighborSampleResult(
+            sources=ArrayWrapper(df["sources"].values_host).array,
+            destinations=ArrayWrapper(df["destinations"].values_host).array,
+            indices=ArrayWrapper(df["indices"].values_host).array,
+        )
+
+    def close_cursor(self, cursor_id):
+        """
+        Closes the cursor identified by cursor_id, releasing the result it
+        references. Cursors are closed automatically once their last page has
+        been returned.
+        """
+        if self.__cursors.pop(cursor_id, None) is None:
+            raise CugraphServiceError(f"invalid or expired cursor_id {cursor_id}")
+
     ###########################################################################
     # Test/Debug APIs
     def create_test_array(self, nbytes):
@@ -1334,24 +1319,320 @@ class CugraphHandler:
         For example, if src_vert_IDs is [0, 1, 2] and dst_vert_IDs is [7, 8, 9]
         return the edge IDs for edges (0, 7), (1, 8), and (2, 9).
 
-        G must have an "edge_data" attribute.
+        G must have an "edge_data" attribute. If more than one edge connects a
+        pair of vertices, the smallest edge ID for that pair is returned.
+
+        All of the pairs are looked up with a single join of the pairs against
+        the edge data, rather than a scan of the edge data for each pair.
         """
-        edge_IDs = []
         num_edges = len(src_vert_IDs)
+        if len(dst_vert_IDs) != num_edges:
+            raise CugraphServiceError(
+                "src_vert_IDs and dst_vert_IDs must be the same length, got "
+                f"{num_edges} and {len(dst_vert_IDs)}"
+            )
+        if num_edges == 0:
+            return []
+
+        src_col_name = PropertyGraph.src_col_name
+        dst_col_name = PropertyGraph.dst_col_name
+        edge_id_col_name = PropertyGraph.edge_id_col_name
+        # The position of each pair in the request, used to return the edge IDs
+        # in the same order as the pairs.
+        pos_col_name = "_POS_"
+
+        edge_data = G.edge_data[[src_col_name, dst_col_name, edge_id_col_name]]
+        pairs = cudf.DataFrame(
+            {
+                src_col_name: cudf.Series(src_vert_IDs).astype(
+                    edge_data[src_col_name].dtype
+                ),
+                dst_col_name: cudf.Series(dst_vert_IDs).astype(
+                    edge_data[dst_col_name].dtype
+                ),
+                pos_col_name: cp.arange(num_edges),
+            }
+        )
+
+        # For MG, the (small) cudf DataFrame of pairs is broadcast to each
+        # partition of the edge data and only the matches are computed.
+        matches = edge_data.merge(pairs, on=[src_col_name, dst_col_name], how="inner")
+        if self.is_multi_gpu:
+            matches = matches.compute()
 
-        for i in range(num_edges):
-            src_mask = G.edge_data[PropertyGraph.src_col_name] == src_vert_IDs[i]
-            dst_mask = G.edge_data[PropertyGraph.dst_col_name] == dst_vert_IDs[i]
-            value = G.edge_data[src_mask & dst_mask][PropertyGraph.edge_id_col_name]
+        edge_IDs = matches.groupby(pos_col_name)[edge_id_col_name].min().sort_index()
+        if len(edge_IDs) != num_edges:
+            missing = np.setdiff1d(
+                np.arange(num_edges), edge_IDs.index.values_host, assume_unique=True
+            )
+            missing_pairs = [(src_vert_IDs[i], dst_vert_IDs[i]) for i in missing[:10]]
+            raise CugraphServiceError(
+                f"{len(missing)} vertex pair(s) do not define an edge in the "
+                f"graph, including: {missing_pairs}"
+            )
+
+        return edge_IDs.values_host.tolist()
+
+    def __get_graph_vertex_dataframe(self, id_or_ids, property_keys, types, graph_id):
+        """
+        Returns the cudf DataFrame of vertex data for get_graph_vertex_data()
+        and open_graph_vertex_data_cursor(), or None if there is no data for
+        id_or_ids.
+        """
+        G = self._get_graph(graph_id)
+        ids = GraphVertexEdgeIDWrapper(id_or_ids).get_py_obj()
 
-            # FIXME: This will compute the result (if using dask) then transfer
-            # to host memory for each iteration - is there a more efficient
-            # way?
+        if ids == -1:
+            ids = None
+        elif not isinstance(ids, list):
+            ids = [ids]
+        if property_keys == []:
+            columns = None
+        else:
+            columns = property_keys
+        if types == []:
+            types = None
+        if isinstance(G, (PropertyGraph, MGPropertyGraph)):
+            if columns is not None and G.vertex_col_name in columns:
+                raise CugraphServiceError(
+                    f"ID key {G.vertex_col_name} is not allowed for property query. "
+                    f"Vertex IDs are always returned in query."
+                )
+
+            try:
+                df = G.get_vertex_data(vertex_ids=ids, columns=columns, types=types)
+                if isinstance(df, dask_cudf.DataFrame):
+                    df = df.compute()
+            except KeyError:
+                df = None
+        else:
+            if (columns is not None) or (ids is not None) or (types is not None):
+                raise CugraphServiceError("Graph does not contain properties")
             if self.is_multi_gpu:
-                value = value.compute()
-            edge_IDs.append(value.values_host[0])
+                # FIXME may run out of memory for very lage graphs.
+                s = (
+                    dask_cudf.concat(
+                        [
+                            G.edgelist.edgelist_df[
+                                G.renumber_map.renumbered_src_col_name
+                            ],
+                            G.edgelist.edgelist_df[
+                                G.renumber_map.renumbered_dst_col_name
+                            ],
+                        ]
+                    )
+                    .unique()
+                    .compute()
+                )
+                df = cudf.DataFrame()
+                df["id"] = s
+                df = dask_cudf.from_cudf(df, npartitions=self.num_gpus)
+            else:
+                s = cudf.concat(
+                    [
+                        G.edgelist.edgelist_df[G.srcCol],
+                        G.edgelist.edgelist_df[G.dstCol],
+                    ]
+                ).unique()
+                df = cudf.DataFrame()
+                df["id"] = s
+            if G.is_renumbered():
+                df = G.unrenumber(df, "id", preserve_order=True)
+
+        if isinstance(df, dask_cudf.DataFrame):
+            df = df.compute()
+        return df
 
-        return edge_IDs
+    def __get_graph_edge_dataframe(self, id_or_ids, property_keys, types, graph_id):
+        """
+        Returns the cudf DataFrame of edge data for get_graph_edge_data() and
+        open_graph_edge_data_cursor(), or None if there is no data for
+        id_or_ids.
+        """
+        G = self._get_graph(graph_id)
+        ids = GraphVertexEdgeIDWrapper(id_or_ids).get_py_obj()
+        if ids == -1:
+            ids = None
+        elif not isinstance(ids, list):
+            ids = [ids]
+        if property_keys == []:
+            columns = None
+        else:
+            columns = property_keys
+        if types == []:
+            types = None
+        if isinstance(G, (PropertyGraph, MGPropertyGraph)):
+            try:
+                df = G.get_edge_data(edge_ids=ids, columns=columns, types=types)
+            except KeyError:
+                df = None
+        else:
+            if columns is not None:
+                raise CugraphServiceError(
+                    f"Graph does not contain properties. {columns}"
+                )
+
+            # Get the edgelist; API expects edge id, src, dst, type
+            df = G.edgelist.edgelist_df
+
+            if G.edgeIdCol in df.columns:
+                if ids is not None:
+                    if self.is_multi_gpu:
+                        # FIXME use ids = cudf.Series(ids) after dask_cudf fix
+                        ids = np.array(ids)
+                        df = df.reindex(df[G.edgeIdCol]).loc[ids]
+                    else:
+                        ids = cudf.Series(ids)
+                        df = df.reindex(df[G.edgeIdCol]).loc[ids]
+            else:
+                if ids is not None:
+                    raise CugraphServiceError("Graph does not have edge ids")
+                df[G.edgeIdCol] = df.index
+
+            if G.edgeTypeCol in df.columns:
+                if types is not None:
+                    df = df[df[G.edgeTypeCol].isin(types)]
+            else:
+                if types is not None:
+                    raise CugraphServiceError("Graph does not have typed edges")
+                df[G.edgeTypeCol] = ""
+
+            src_col_name = (
+                G.renumber_map.renumbered_src_col_name
+                if self.is_multi_gpu
+                else G.srcCol
+            )
+            dst_col_name = (
+                G.renumber_map.renumbered_dst_col_name
+                if self.is_multi_gpu
+                else G.dstCol
+            )
+            if G.is_renumbered():
+                df = G.unrenumber(df, src_col_name, preserve_order=True)
+                df = G.unrenumber(df, dst_col_name, preserve_order=True)
+
+            df = df[[G.edgeIdCol, src_col_name, dst_col_name, G.edgeTypeCol]]
+
+        if isinstance(df, dask_cudf.DataFrame):
+            df = df.compute()
+        return df
+
+    def __uniform_neighbor_sample(
+        self, start_list, fanout_vals, with_replacement, graph_id
+    ):
+        """
+        Returns the UniformNeighborSampleResult of sampling the graph for
+        graph_id, with CuPy arrays for the sources, destinations, and indices.
+        """
+        G = self._get_graph(graph_id)
+        if isinstance(G, (MGPropertyGraph, PropertyGraph)):
+            # Implicitly extract a subgraph containing the entire multigraph.
+            # G will be garbage collected when this function returns.
+            G = G.extract_subgraph(
+                create_using=MultiGraph(directed=True),
+                default_edge_weight=1.0,
+            )
+
+        return call_algo(
+            uniform_neighbor_sample,
+            G,
+            start_list=start_list,
+            fanout_vals=fanout_vals,
+            with_replacement=with_replacement,
+        )
+
+    def __add_cursor(self, df):
+        """
+        Adds a cursor for returning the rows of df (None if there are no rows)
+        a page at a time, and returns its ID. If max_cursors cursors are
+        already open, the least recently used ones are closed.
+        """
+        self.__close_idle_cursors()
+        while len(self.__cursors) >= self.__max_cursors:
+            self.__cursors.popitem(last=False)
+
+        cursor_id = self.__next_cursor_id
+        self.__cursors[cursor_id] = [df, 0, time.monotonic()]
+        self.__next_cursor_id += 1
+        return cursor_id
+
+    def __get_cursor_page(self, cursor_id, page_size):
+        """
+        Returns the next page_size rows for cursor_id, or None if the cursor
+        has no rows. The cursor is closed if the page is the last one, which
+        is any page with fewer than page_size rows.
+        """
+        if page_size < 1:
+            raise CugraphServiceError(f"page_size must be > 0, got {page_size}")
+        self.__close_idle_cursors()
+        cursor = self.__cursors.get(cursor_id)
+        if cursor is None:
+            raise CugraphServiceError(f"invalid or expired cursor_id {cursor_id}")
+        self.__cursors.move_to_end(cursor_id)
+        cursor[2] = time.monotonic()
+
+        df, start, _ = cursor
+        if df is None:
+            page = None
+            num_rows = 0
+        else:
+            page = df.iloc[start : start + page_size]
+            num_rows = len(page)
+        cursor[1] = start + num_rows
+        if num_rows < page_size:
+            del self.__cursors[cursor_id]
+        return page
+
+    def __close_idle_cursors(self):
+        """
+        Closes the cursors that have not been used for cursor_idle_timeout
+        seconds.
+        """
+        expire_time = time.monotonic() - self.__cursor_idle_timeout
+        while self.__cursors:
+            (cursor_id, cursor) = next(iter(self.__cursors.items()))
+            if cursor[2] >= expire_time:
+                break
+            del self.__cursors[cursor_id]
+
+    def __get_graph_data_as_bytes(
+        self, dataframe, null_replacement_value, result_format
+    ):
+        """
+        Returns a byte array repr of the vertex or edge graph data in the
+        format specified by result_format, either "numpy" (or None or "", for
+        clients that do not specify a format) or "arrow".
+        """
+        if result_format in (None, "", "numpy"):
+            return self.__get_graph_data_as_numpy_bytes(
+                dataframe, null_replacement_value
+            )
+        if result_format == "arrow":
+            return self.__get_graph_data_as_arrow_bytes(dataframe)
+        raise CugraphServiceError(
+            f"result_format must be 'numpy' or 'arrow', got {result_format}"
+        )
+
+    def __get_graph_data_as_arrow_bytes(self, dataframe):
+        """
+        Returns the vertex or edge graph data as an Arrow IPC stream. Unlike
+        the numpy repr, the stream keeps the dtype and null bitmap of each
+        column, and the client can read the columns directly from the received
+        buffer without unpickling.
+        """
+        try:
+            if dataframe is None:
+                table = pa.table({})
+            else:
+                table = dataframe.to_arrow(preserve_index=False)
+
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return sink.getvalue().to_pybytes()
+
+        except Exception:
+            raise CugraphServiceError(f"{traceback.format_exc()}")
 
     def __get_graph_data_as_numpy_bytes(self, dataframe, null_replacement_value):
         """
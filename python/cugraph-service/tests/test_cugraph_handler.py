@@ -485,3 +485,49 @@ def test_get_server_info(graph_creation_extension1, extension1):
         str(Path(meta_data["extensions"].list_value[0].get_py_obj()).parent)
         == extension1
     )
+
+
+def test_cursor_eviction(graph_creation_extension_big_vertex_ids):
+    """
+    Ensures cursors abandoned by clients are closed, either when too many are
+    open or when they have been idle for cursor_idle_timeout seconds.
+    """
+    import time
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+    from cugraph_service_client.exceptions import CugraphServiceError
+
+    def open_cursor(handler, graph_id):
+        return handler.open_graph_vertex_data_cursor(
+            id_or_ids=-1, property_keys=None, types=None, graph_id=graph_id
+        )
+
+    def get_page(handler, cursor_id):
+        return handler.get_graph_data_page(
+            cursor_id, page_size=1, null_replacement_value=0, result_format="numpy"
+        )
+
+    handler = CugraphHandler(max_cursors=2)
+    handler.load_graph_creation_extensions(graph_creation_extension_big_vertex_ids)
+    graph_id = handler.call_graph_creation_extension(
+        "graph_creation_function_vert_and_edge_data_big_vertex_ids", "()", "{}"
+    )
+
+    # Using a cursor makes it the most recently used
+    cursor_ids = [open_cursor(handler, graph_id) for _ in range(2)]
+    get_page(handler, cursor_ids[0])
+    cursor_ids.append(open_cursor(handler, graph_id))
+    with pytest.raises(CugraphServiceError):
+        get_page(handler, cursor_ids[1])
+    get_page(handler, cursor_ids[0])
+    get_page(handler, cursor_ids[2])
+
+    handler = CugraphHandler(cursor_idle_timeout=0.1)
+    handler.load_graph_creation_extensions(graph_creation_extension_big_vertex_ids)
+    graph_id = handler.call_graph_creation_extension(
+        "graph_creation_function_vert_and_edge_data_big_vertex_ids", "()", "{}"
+    )
+    cursor_id = open_cursor(handler, graph_id)
+    get_page(handler, cursor_id)
+    time.sleep(0.2)
+    with pytest.raises(CugraphServiceError):
+        get_page(handler, cursor_id)
@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections.abc import Sequence
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from . import data
@@ -178,6 +178,52 @@ def test_get_num_edges_nondefault_graph(client_with_edgelist_csv_loaded):
     )
 
 
+def test_pooled_client_concurrent_calls(client_with_edgelist_csv_loaded):
+    from concurrent.futures import ThreadPoolExecutor
+    from cugraph_service_client import CugraphServiceClient, defaults
+
+    (_, test_data) = client_with_edgelist_csv_loaded
+
+    pooled_client = CugraphServiceClient(
+        defaults.host, defaults.port, pool_size=4, keep_alive=10
+    )
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        num_edges = list(
+            executor.map(lambda _: pooled_client.get_num_edges(), range(32))
+        )
+    pooled_client.close_pool()
+
+    assert num_edges == [test_data["num_edges"]] * 32
+
+
+def test_async_client(client_with_edgelist_csv_loaded):
+    import asyncio
+    from cugraph_service_client import AsyncCugraphServiceClient, defaults
+
+    (_, test_data) = client_with_edgelist_csv_loaded
+
+    async def run():
+        async with AsyncCugraphServiceClient(
+            defaults.host, defaults.port, pool_size=2
+        ) as async_client:
+            results = await asyncio.gather(
+                async_client.get_num_edges(), async_client.get_graph_ids()
+            )
+            pages = [
+                page
+                async for page in async_client.get_graph_edge_data_pages(
+                    -1, page_size=10
+                )
+            ]
+        return (results, pages)
+
+    ((num_edges, graph_ids), pages) = asyncio.run(run())
+
+    assert num_edges == test_data["num_edges"]
+    assert graph_ids == [0]
+    assert sum(len(page) for page in pages) == test_data["num_edges"]
+
+
 def test_node2vec(client_with_edgelist_csv_loaded):
     (client, test_data) = client_with_edgelist_csv_loaded
     extracted_gid = client.extract_subgraph()
@@ -187,9 +233,11 @@ def test_node2vec(client_with_edgelist_csv_loaded):
         start_vertices, max_depth, extracted_gid
     )
     # FIXME: consider a more thorough test
-    assert isinstance(vertex_paths, list) and len(vertex_paths)
-    assert isinstance(edge_weights, list) and len(edge_weights)
-    assert isinstance(path_sizes, list) and len(path_sizes)
+    assert isinstance(vertex_paths, np.ndarray) and len(vertex_paths)
+    assert isinstance(edge_weights, np.ndarray) and len(edge_weights)
+    assert isinstance(path_sizes, np.ndarray) and len(path_sizes)
+    assert vertex_paths.dtype.kind == "i"
+    assert edge_weights.dtype.kind == "f"
 
 
 def test_extract_subgraph(client_with_edgelist_csv_loaded):
@@ -387,6 +435,61 @@ def test_get_graph_edge_data(client_with_property_csvs_loaded):
     assert np_array[0][0] == 1
 
 
+@pytest.mark.parametrize("result_format", ["arrow", "pandas", "cudf"])
+def test_get_graph_data_arrow(client_with_property_csvs_loaded, result_format):
+    (client, test_data) = client_with_property_csvs_loaded
+
+    np_array = client.get_graph_vertex_data()
+    data = client.get_graph_vertex_data(result_format=result_format)
+    if result_format != "pandas":
+        data = data.to_pandas()
+    # The Arrow stream keeps NA values instead of replacing them, and keeps
+    # the dtype of each column.
+    assert data.shape == np_array.shape
+    assert data.isna().to_numpy().any()
+    assert data.iloc[:, 0].tolist() == np_array[:, 0].tolist()
+    assert data.dtypes.iloc[0].kind == "i"
+
+    edge_ids = [0, 1, 2]
+    data = client.get_graph_edge_data(edge_ids, result_format=result_format)
+    if result_format != "pandas":
+        data = data.to_pandas()
+    assert data.iloc[:, 0].tolist() == edge_ids
+
+    with pytest.raises(ValueError):
+        client.get_graph_edge_data(result_format="bad_format")
+
+
+def test_get_graph_data_pages(client_with_property_csvs_loaded):
+    from cugraph_service_client.exceptions import CugraphServiceError
+
+    (client, test_data) = client_with_property_csvs_loaded
+
+    all_vertex_data = client.get_graph_vertex_data()
+    pages = list(client.get_graph_vertex_data_pages(page_size=4))
+    assert [len(p) for p in pages] == [4, 4, 1]
+    assert (np.concatenate(pages) == all_vertex_data).all()
+
+    all_edge_data = client.get_graph_edge_data()
+    pages = list(client.get_graph_edge_data_pages(page_size=len(all_edge_data)))
+    assert len(pages) == 1
+    assert (pages[0] == all_edge_data).all()
+
+    # Stopping early closes the cursor on the server
+    pages = client.get_graph_edge_data_pages(page_size=2)
+    assert len(next(pages)) == 2
+    pages.close()
+
+    with pytest.raises(ValueError):
+        list(client.get_graph_edge_data_pages(page_size=0))
+
+    # The cursor is not opened until iteration starts, so errors are raised
+    # then, and generators that are never iterated do not leave it open.
+    pages = client.get_graph_edge_data_pages(graph_id=9999)
+    with pytest.raises(CugraphServiceError):
+        next(pages)
+
+
 def test_get_graph_info(client_with_property_csvs_loaded):
     (client, test_data) = client_with_property_csvs_loaded
 
@@ -412,12 +515,12 @@ def test_batched_ego_graphs(client_with_edgelist_csv_loaded):
 
     (srcs, dsts, weights, seeds_offsets) = results_lists
 
-    assert isinstance(srcs, Sequence)
-    assert isinstance(dsts, Sequence)
-    assert isinstance(weights, Sequence)
+    assert isinstance(srcs, np.ndarray)
+    assert isinstance(dsts, np.ndarray)
+    assert isinstance(weights, np.ndarray)
     assert len(srcs) == len(dsts) == len(weights)
 
-    assert isinstance(seeds_offsets, Sequence)
+    assert isinstance(seeds_offsets, np.ndarray)
     assert len(srcs) == seeds_offsets[-1]
 
 
@@ -433,6 +536,21 @@ def test_get_edge_IDs_for_vertices(client_with_edgelist_csv_loaded):
 
     assert len(edge_IDs) == len(srcs)
 
+    # The edge IDs are returned in the order of the vertex pairs, and arrays
+    # are accepted in addition to lists.
+    edge_IDs_reversed = client.get_edge_IDs_for_vertices(
+        np.array(srcs[::-1]), np.array(dsts[::-1]), graph_id=extracted_gid
+    )
+    assert edge_IDs_reversed == edge_IDs[::-1]
+
+    from cugraph_service_client.exceptions import CugraphServiceError
+
+    # (0, 0) is not an edge in karate
+    with pytest.raises(CugraphServiceError):
+        client.get_edge_IDs_for_vertices([1, 0], [0, 0], graph_id=extracted_gid)
+    with pytest.raises(ValueError):
+        client.get_edge_IDs_for_vertices([1, 2], [0], graph_id=extracted_gid)
+
 
 def test_uniform_neighbor_sampling(client_with_edgelist_csv_loaded):
     from cugraph_service_client import defaults
@@ -453,12 +571,33 @@ def test_uniform_neighbor_sampling(client_with_edgelist_csv_loaded):
 
     extracted_gid = client.extract_subgraph(renumber_graph=True)
     # Ensure call can be made, assume results verified in other tests
-    client.uniform_neighbor_sample(
+    result = client.uniform_neighbor_sample(
         start_list=start_list,
         fanout_vals=fanout_vals,
         with_replacement=with_replacement,
         graph_id=extracted_gid,
     )
+    # Results are sent as typed arrays rather than lists of numbers
+    assert isinstance(result.sources, np.ndarray)
+    assert result.sources.dtype == result.destinations.dtype
+    assert result.sources.dtype.kind == "i"
+    assert result.indices.dtype.kind == "f"
+
+
+def test_uniform_neighbor_sampling_pages(client_with_edgelist_csv_loaded):
+    (client, test_data) = client_with_edgelist_csv_loaded
+
+    extracted_gid = client.extract_subgraph(renumber_graph=True)
+    # A fanout of -1 samples all neighbors, so the results are the same size
+    result = client.uniform_neighbor_sample([1, 2, 3], [-1], graph_id=extracted_gid)
+    pages = list(
+        client.get_uniform_neighbor_sample_pages(
+            [1, 2, 3], [-1], graph_id=extracted_gid, page_size=3
+        )
+    )
+    assert sum(len(p.sources) for p in pages) == len(result.sources)
+    assert all(len(p.sources) == 3 for p in pages[:-1])
+    assert all(len(p.sources) == len(p.destinations) for p in pages)
 
 
 def test_renumber_vertices_by_type(client_with_property_csvs_loaded):
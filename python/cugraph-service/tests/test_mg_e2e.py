@@ -16,6 +16,7 @@ import os
 from pathlib import Path
 
 import pytest
+import numpy as np
 import cupy as cp
 
 from cugraph_service_server.testing import utils
@@ -350,7 +351,7 @@ def test_uniform_neighbor_sampling_result_on_device(
 
     if result_device_id is None:
         # host memory
-        assert dtype is list
+        assert dtype is np.ndarray
     else:
         # device memory
         assert dtype is cp.ndarray
@@ -14,9 +14,14 @@
 import cudf
 import yaml
 import os
+import urllib.request
 from pathlib import Path
 from cugraph.structure.graph_classes import Graph
 
+# Version of the cached edgelist files written by Dataset.get_edgelist(). Bump
+# this to invalidate existing caches if the cache format changes.
+CACHE_FORMAT_VERSION = 1
+
 
 class DefaultDownloadDir:
     """
@@ -137,9 +142,9 @@ class Dataset:
 
         filename = self.metadata["name"] + self.metadata["file_type"]
         if self._dl_path.path.is_dir():
-            df = cudf.read_csv(url)
             self._path = self._dl_path.path / filename
-            df.to_csv(self._path, index=False)
+            # Save the file as-is rather than parsing and re-writing it
+            urllib.request.urlretrieve(url, self._path)
 
         else:
             raise RuntimeError(
@@ -159,7 +164,104 @@ class Dataset:
         """
         self._edgelist = None
 
-    def get_edgelist(self, download=False):
+    def __get_datafile(self, download):
+        """
+        Returns the path to the dataset file, downloading it first if it does
+        not exist and download is True.
+        """
+        full_path = self.get_path()
+        if not full_path.is_file():
+            if download:
+                full_path = self.__download_csv(self.metadata["url"])
+            else:
+                raise RuntimeError(
+                    f"The datafile {full_path} does not"
+                    " exist. Try setting download=True"
+                    " to download the datafile"
+                )
+        return full_path
+
+    def __read_csv(self, full_path, **kwargs):
+        """
+        Reads the dataset file (or part of it) using the delimiter, column
+        names and column types from the metadata.
+        """
+        header = None
+        if isinstance(self.metadata["header"], int):
+            header = self.metadata["header"]
+        kwargs.setdefault("header", header)
+        return cudf.read_csv(
+            full_path,
+            delimiter=self.metadata["delim"],
+            names=self.metadata["col_names"],
+            dtype=self.metadata["col_types"],
+            **kwargs,
+        )
+
+    def get_cache_path(self):
+        """
+        Returns the location of the binary (Parquet) copy of the edgelist that
+        get_edgelist() saves in the download directory.
+        """
+        return (
+            self._dl_path.path.absolute()
+            / "cache"
+            / (self.metadata["name"] + ".parquet")
+        )
+
+    def __cache_info(self, full_path):
+        """
+        Returns the information stored next to the cached edgelist, which must
+        match for the cache to be used. The path, size and modification time
+        of the dataset file are included so a cache of a file that has since
+        changed is not used, along with the settings used to parse it.
+        """
+        stat = os.stat(full_path)
+        return {
+            "cache_format_version": CACHE_FORMAT_VERSION,
+            "path": str(Path(full_path).absolute()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "delim": self.metadata["delim"],
+            "header": self.metadata["header"],
+            "col_names": list(self.metadata["col_names"]),
+            "col_types": list(self.metadata["col_types"]),
+        }
+
+    def __read_cache(self, cache_path, cache_info):
+        """
+        Returns the cached edgelist, or None if there is no valid cache.
+        """
+        info_path = cache_path.with_suffix(".yaml")
+        if not cache_path.is_file() or not info_path.is_file():
+            return None
+        with open(info_path, "r") as file:
+            if yaml.safe_load(file) != cache_info:
+                return None
+        return cudf.read_parquet(cache_path)
+
+    def __write_cache(self, cache_path, cache_info, df):
+        """
+        Saves the edgelist to the cache. Failing to write the cache (for
+        example, if the download directory is read-only) is not an error.
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to temporary files and rename them so that concurrent
+            # readers never see a partially written cache.
+            tmp_suffix = f".{os.getpid()}.tmp"
+            tmp_path = cache_path.with_name(cache_path.name + tmp_suffix)
+            df.to_parquet(tmp_path, index=False)
+            info_path = cache_path.with_suffix(".yaml")
+            tmp_info_path = info_path.with_name(info_path.name + tmp_suffix)
+            with open(tmp_info_path, "w") as file:
+                yaml.safe_dump(cache_info, file)
+            os.replace(tmp_path, cache_path)
+            os.replace(tmp_info_path, info_path)
+        except OSError:
+            pass
+
+    def get_edgelist(self, download=False, use_cache=True):
         """
         Return an Edgelist
 
@@ -168,31 +270,52 @@ class Dataset:
         download : Boolean (default=False)
             Automatically download the dataset from the 'url' location within
             the YAML file.
+
+        use_cache : Boolean (default=True)
+            Read the edgelist from a binary (Parquet) copy in the download
+            directory if one exists for the current dataset file, and otherwise
+            create one after parsing the dataset file, so later processes can
+            skip parsing the CSV file. See get_cache_path().
         """
         if self._edgelist is None:
-            full_path = self.get_path()
-            if not full_path.is_file():
-                if download:
-                    full_path = self.__download_csv(self.metadata["url"])
-                else:
-                    raise RuntimeError(
-                        f"The datafile {full_path} does not"
-                        " exist. Try setting download=True"
-                        " to download the datafile"
-                    )
-            header = None
-            if isinstance(self.metadata["header"], int):
-                header = self.metadata["header"]
-            self._edgelist = cudf.read_csv(
-                full_path,
-                delimiter=self.metadata["delim"],
-                names=self.metadata["col_names"],
-                dtype=self.metadata["col_types"],
-                header=header,
-            )
+            full_path = self.__get_datafile(download)
+            if use_cache:
+                cache_path = self.get_cache_path()
+                cache_info = self.__cache_info(full_path)
+                self._edgelist = self.__read_cache(cache_path, cache_info)
+            if self._edgelist is None:
+                self._edgelist = self.__read_csv(full_path)
+                if use_cache:
+                    self.__write_cache(cache_path, cache_info, self._edgelist)
 
         return self._edgelist.copy()
 
+    def get_edgelist_chunks(self, chunk_size=2**28, download=False):
+        """
+        Return an iterator of Edgelists that together contain every edge of
+        the dataset, for datasets that are too large to load at once. The
+        edgelists are read directly from the dataset file and are not saved
+        by the Dataset instance.
+
+        Parameters
+        ----------
+        chunk_size : int (default=2**28)
+            Approximate size of each chunk in bytes of the dataset file. Each
+            edgelist contains the rows that begin in its chunk.
+
+        download : Boolean (default=False)
+            Automatically download the dataset from the 'url' location within
+            the YAML file.
+        """
+        full_path = self.__get_datafile(download)
+        file_size = full_path.stat().st_size
+        for offset in range(0, file_size, chunk_size):
+            kwargs = {"byte_range": (offset, chunk_size)}
+            if offset > 0:
+                # Only the first chunk can contain the header
+                kwargs["header"] = None
+            yield self.__read_csv(full_path, **kwargs)
+
     def get_graph(
         self,
         download=False,
@@ -325,8 +448,7 @@ def download_all(force=False):
                 filename = meta["name"] + meta["file_type"]
                 save_to = default_download_dir.path / filename
                 if not save_to.is_file() or force:
-                    df = cudf.read_csv(meta["url"])
-                    df.to_csv(save_to, index=False)
+                    urllib.request.urlretrieve(meta["url"], save_to)
 
 
 def set_download_dir(path):
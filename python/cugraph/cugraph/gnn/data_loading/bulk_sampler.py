@@ -13,9 +13,11 @@
 
 import os
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
 import cudf
+import cupy
 import dask_cudf
 
 from dask.distributed import wait
@@ -58,6 +60,8 @@ class EXPERIMENTAL__BulkSampler:
         batches_per_partition: int = 100,
         renumber: bool = False,
         log_level: int = None,
+        write_index: bool = False,
+        pipeline_writes: bool = False,
         **kwargs,
     ):
         """
@@ -83,6 +87,16 @@ class EXPERIMENTAL__BulkSampler:
             Whether to enable logging for this sampler. Supports 3 levels
             of logging if enabled (INFO, WARNING, ERROR).  If not provided,
             defaults to WARNING.
+        write_index: bool (optional, default=False)
+            Whether to write an index of the batches in each parquet
+            partition to a ".index.json" file alongside it, allowing
+            individual batches to be read without reading the whole
+            partition.  See bulk_sampler_io.read_batch_index().
+        pipeline_writes: bool (optional, default=False)
+            Whether to write the output of each sampling call to parquet
+            on a background thread while the next sampling call runs.
+            At most one write is in flight at a time, so the output of
+            up to two sampling calls is held in memory at once.
         kwargs: kwargs
             Keyword arguments to be passed to the sampler (i.e. fanout).
         """
@@ -107,6 +121,8 @@ class EXPERIMENTAL__BulkSampler:
         self.__seeds_per_call = seeds_per_call
         self.__batches_per_partition = batches_per_partition
         self.__renumber = renumber
+        self.__write_index = write_index
+        self.__pipeline_writes = pipeline_writes
         self.__batches = None
         self.__sample_call_args = kwargs
 
@@ -212,6 +228,60 @@ class EXPERIMENTAL__BulkSampler:
         if self.size == 0:
             return
 
+        if self.__pipeline_writes:
+            # A single writer thread, so writes happen in order and at most
+            # one is in flight while the next sampling call runs.
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="bulk_sampler_write"
+            )
+        else:
+            executor = None
+
+        pending_write = None
+        try:
+            while self.size > 0:
+                samples, offsets, renumber_map = self.__sample()
+
+                if pending_write is not None:
+                    # Wait for the previous write before starting this one to
+                    # bound the number of sampling outputs held in memory.
+                    pending_write.result()
+                    pending_write = None
+
+                if executor is None:
+                    self.__write(samples, offsets, renumber_map)
+                else:
+                    pending_write = executor.submit(
+                        self.__write_on_device,
+                        cupy.cuda.runtime.getDevice(),
+                        samples,
+                        offsets,
+                        renumber_map,
+                    )
+
+                del samples
+                del offsets
+                del renumber_map
+
+                current_size = self.size
+                if current_size > 0:
+                    self.__logger.info(
+                        f"There are still {current_size} samples remaining, "
+                        "sampling the next batches..."
+                    )
+
+            if pending_write is not None:
+                pending_write.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def __sample(self):
+        """
+        Samples the next seeds_per_call seeds and removes them from the
+        uncomputed batches.  Returns the samples, offsets, and renumber map
+        (None if renumber is False).
+        """
         start_time_calc_batches = time.perf_counter()
         if isinstance(self.__batches, dask_cudf.DataFrame):
             self.__batches = self.__batches.persist()
@@ -290,34 +360,19 @@ class EXPERIMENTAL__BulkSampler:
         if isinstance(self.__batches, dask_cudf.DataFrame):
             self.__batches = self.__batches.persist()
 
-        start_time_write = time.perf_counter()
-
-        # Write batches to parquet
-        self.__write(samples, offsets, renumber_map)
-        if isinstance(self.__batches, dask_cudf.DataFrame):
-            futures = [f.release() for f in futures_of(samples)] + [
-                f.release() for f in futures_of(offsets)
-            ]
-            if renumber_map is not None:
-                futures += [f.release() for f in futures_of(renumber_map)]
-            wait(futures)
-
-        del samples
-        del offsets
-        if renumber_map is not None:
-            del renumber_map
-
-        end_time_write = time.perf_counter()
-        write_runtime = end_time_write - start_time_write
-        self.__logger.info(f"Wrote samples to parquet, took {write_runtime} seconds")
+        return samples, offsets, renumber_map
 
-        current_size = self.size
-        if current_size > 0:
-            self.__logger.info(
-                f"There are still {current_size} samples remaining, "
-                "calling flush() again..."
-            )
-            self.flush()
+    def __write_on_device(
+        self,
+        device_id: int,
+        samples: Union[cudf.DataFrame, dask_cudf.DataFrame],
+        offsets: Union[cudf.DataFrame, dask_cudf.DataFrame],
+        renumber_map: Union[cudf.DataFrame, dask_cudf.DataFrame],
+    ) -> None:
+        # Runs on the writer thread, which does not inherit the current
+        # device of the thread that sampled.
+        with cupy.cuda.Device(device_id):
+            self.__write(samples, offsets, renumber_map)
 
     def __write(
         self,
@@ -325,6 +380,9 @@ class EXPERIMENTAL__BulkSampler:
         offsets: Union[cudf.DataFrame, dask_cudf.DataFrame],
         renumber_map: Union[cudf.DataFrame, dask_cudf.DataFrame],
     ) -> None:
+        start_time_write = time.perf_counter()
+
+        # Write batches to parquet
         os.makedirs(self.__output_path, exist_ok=True)
         write_samples(
             samples,
@@ -332,4 +390,16 @@ class EXPERIMENTAL__BulkSampler:
             renumber_map,
             self.__batches_per_partition,
             self.__output_path,
+            write_index=self.__write_index,
         )
+        if isinstance(self.__batches, dask_cudf.DataFrame):
+            futures = [f.release() for f in futures_of(samples)] + [
+                f.release() for f in futures_of(offsets)
+            ]
+            if renumber_map is not None:
+                futures += [f.release() for f in futures_of(renumber_map)]
+            wait(futures)
+
+        end_time_write = time.perf_counter()
+        write_runtime = end_time_write - start_time_write
+        self.__logger.info(f"Wrote samples to parquet, took {write_runtime} seconds")
@@ -12,11 +12,46 @@
 # limitations under the License.
 
 import os
+import json
 import cudf
 import cupy
+import pyarrow.parquet as pq
 
 from typing import Union, Optional
 
+# The minimum number of rows per parquet row group when writing a batch index.
+_min_indexed_row_group_size_rows = 1000
+
+
+def get_batch_index_path(parquet_path: str) -> str:
+    """
+    Returns the path of the batch index file written alongside the parquet
+    file parquet_path when samples are written with write_index=True.
+    """
+    return os.path.splitext(parquet_path)[0] + ".index.json"
+
+
+def read_batch_index(parquet_path: str) -> Optional[dict]:
+    """
+    Returns the batch index written alongside the parquet file parquet_path,
+    or None if there is no index.
+
+    The index is a dictionary containing:
+        "batch_offsets": the rows of the i-th batch in the file are
+            [batch_offsets[i], batch_offsets[i + 1])
+        "renumber_map_offsets": the renumber map of the i-th batch is in
+            rows [renumber_map_offsets[i], renumber_map_offsets[i + 1]) of
+            the "map" column, or None if there is no renumber map
+        "row_group_offsets": the rows of the i-th parquet row group are
+            [row_group_offsets[i], row_group_offsets[i + 1])
+        "columns": the names of the columns other than "map"
+    """
+    index_path = get_batch_index_path(parquet_path)
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path) as f:
+        return json.load(f)
+
 
 def _write_samples_to_parquet(
     results: cudf.DataFrame,
@@ -24,6 +59,7 @@ def _write_samples_to_parquet(
     renumber_map: cudf.DataFrame,
     batches_per_partition: int,
     output_path: str,
+    write_index: bool = False,
     partition_info: Optional[Union[dict, str]] = None,
 ) -> cudf.Series:
     """
@@ -46,6 +82,9 @@ def _write_samples_to_parquet(
         The maximum number of minibatches allowed per written parquet partition.
     output_path: str
         The output path (where parquet files should be written to).
+    write_index: bool
+        Whether to write a batch index (see read_batch_index()) alongside
+        each parquet file, allowing individual batches to be read.
     partition_info: Union[dict, str]
         Either a dictionary containing partition data from dask, the string 'sg'
         indicating that this is a single GPU write, or None indicating that this
@@ -147,9 +186,50 @@ def _write_samples_to_parquet(
             output_path, f"batch={start_batch_id}-{end_batch_id}.parquet"
         )
 
-        results_p.to_parquet(
-            full_output_path, compression=None, index=False, force_nullable_schema=True
-        )
+        if write_index:
+            # Use about one row group per batch, so that reading a batch
+            # reads few rows of other batches.
+            row_group_size_rows = max(
+                _min_indexed_row_group_size_rows,
+                -(-(end_ix - start_ix) // len(offsets_p)),
+            )
+            results_p.to_parquet(
+                full_output_path,
+                compression=None,
+                index=False,
+                force_nullable_schema=True,
+                row_group_size_rows=row_group_size_rows,
+            )
+
+            # row_group_size_rows is only an upper bound on the size of
+            # each row group, so record the sizes that were actually written.
+            metadata = pq.read_metadata(full_output_path)
+            row_group_offsets = [0]
+            for i in range(metadata.num_row_groups):
+                row_group_offsets.append(
+                    row_group_offsets[-1] + metadata.row_group(i).num_rows
+                )
+
+            batch_offsets = cupy.append(
+                offsets_p.offsets.values - start_ix, end_ix - start_ix
+            )
+            batch_index = {
+                "batch_offsets": batch_offsets.tolist(),
+                "renumber_map_offsets": (
+                    None if renumber_map is None else renumber_map_o.values.tolist()
+                ),
+                "row_group_offsets": row_group_offsets,
+                "columns": [c for c in results_p.columns if c != "map"],
+            }
+            with open(get_batch_index_path(full_output_path), "w") as f:
+                json.dump(batch_index, f)
+        else:
+            results_p.to_parquet(
+                full_output_path,
+                compression=None,
+                index=False,
+                force_nullable_schema=True,
+            )
 
     return cudf.Series(dtype="int64")
 
@@ -160,6 +240,7 @@ def write_samples(
     renumber_map: cudf.DataFrame,
     batches_per_partition: cudf.DataFrame,
     output_path: str,
+    write_index: bool = False,
 ):
     """
     Writes the samples to parquet.
@@ -181,6 +262,9 @@ def write_samples(
         The maximum number of minibatches allowed per written parquet partition.
     output_path: str
         The output path (where parquet files should be written to).
+    write_index: bool (optional, default=False)
+        Whether to write a batch index (see read_batch_index()) alongside
+        each parquet file, allowing individual batches to be read.
     """
     if hasattr(results, "compute"):
         results.map_partitions(
@@ -189,6 +273,7 @@ def write_samples(
             renumber_map,
             batches_per_partition,
             output_path,
+            write_index,
             align_dataframes=False,
             meta=cudf.Series(dtype="int64"),
         ).compute()
@@ -200,5 +285,6 @@ def write_samples(
             renumber_map,
             batches_per_partition,
             output_path,
+            write_index=write_index,
             partition_info="sg",
         )
@@ -12,7 +12,11 @@
 # limitations under the License.
 from __future__ import annotations
 from collections import defaultdict
+from functools import reduce
 from typing import Sequence, Union
+from urllib.parse import quote
+import os
+import tempfile
 import cudf
 import cupy as cp
 import numpy as np
@@ -21,18 +25,51 @@ from cugraph.utilities.utils import import_optional
 
 torch = import_optional("torch")
 
+# The approximate number of bytes copied at a time when writing a feature
+# object to a memory-mapped file.
+_mmap_write_chunk_bytes = 2**28
+
 
 class FeatureStore:
     """The feature-store class used to store feature data for GNNS"""
 
-    def __init__(self, backend="numpy"):
+    def __init__(self, backend="numpy", mmap_dir=None):
+        """
+        Parameters:
+        ----------
+          backend : str
+            "numpy" or "torch" to keep features in memory as numpy arrays or
+            torch tensors, or "mmap" to store features in files that are
+            memory-mapped as numpy arrays. Only the rows requested from an
+            "mmap" store are read into memory.
+          mmap_dir : str
+            The directory to write feature files to for the "mmap" backend.
+            If not specified, a new temporary directory is used, which is
+            deleted by close() or when the FeatureStore is garbage collected.
+        """
         self.fd = defaultdict(dict)
-        if backend not in ["numpy", "torch"]:
+        if backend not in ["numpy", "torch", "mmap"]:
             raise ValueError(
-                f"backend {backend} not supported. Supported backends are numpy, torch"
+                f"backend {backend} not supported. "
+                "Supported backends are numpy, torch, mmap"
             )
         self.backend = backend
 
+        self._tmp_dir = None
+        if backend == "mmap":
+            if mmap_dir is None:
+                # TemporaryDirectory also deletes the directory when it is
+                # garbage collected.
+                self._tmp_dir = tempfile.TemporaryDirectory(
+                    prefix="cugraph_feature_store_"
+                )
+                mmap_dir = self._tmp_dir.name
+            else:
+                os.makedirs(mmap_dir, exist_ok=True)
+        elif mmap_dir is not None:
+            raise ValueError("mmap_dir is only supported for the mmap backend")
+        self.mmap_dir = mmap_dir
+
     def add_data(self, feat_obj: Sequence, type_name: str, feat_name: str) -> None:
         """
         Add the feature data to the feature_storage class
@@ -48,9 +85,18 @@ class FeatureStore:
         -------
             None
         """
-        self.fd[feat_name][type_name] = self._cast_feat_obj_to_backend(
-            feat_obj, self.backend
-        )
+        if self.backend == "mmap":
+            (feat_file_name, type_file_name) = (
+                _escape_file_name(name) for name in (feat_name, type_name)
+            )
+            filename = os.path.join(
+                self.mmap_dir, f"{feat_file_name}.{type_file_name}.npy"
+            )
+            self.fd[feat_name][type_name] = _write_to_memmap(feat_obj, filename)
+        else:
+            self.fd[feat_name][type_name] = self._cast_feat_obj_to_backend(
+                feat_obj, self.backend
+            )
 
     def get_data(
         self,
@@ -73,9 +119,121 @@ class FeatureStore:
         Returns:
         --------
         np.ndarray or torch.Tensor
-            Array object of the backend type
+            Array object of the backend type (np.ndarray for the mmap backend)
+        """
+        feat_obj = self._get_feat_obj(type_name, feat_name)
+
+        if self.backend == "mmap":
+            return _gather_from_memmap(feat_obj, indices)
+
+        return feat_obj[indices]
+
+    def get_multi_data(
+        self,
+        indices: Union[np.ndarray, torch.Tensor],
+        type_name: str,
+        feat_names: Sequence[str],
+    ) -> Union[np.ndarray, torch.Tensor]:
+        """
+        Retrieve the feature data corresponding to the indices for several
+        features of the same type, gathered into a single array
+
+        Parameters:
+        -----------
+        indices: np.ndarray or torch.Tensor
+            The indices of the values to extract.
+        type_name : str
+            The node-type/edge-type to store data
+        feat_names: list[str]
+            The feature names to retrieve data for
+
+        Returns:
+        --------
+        np.ndarray or torch.Tensor
+            The result of get_data() for each feature, concatenated along the
+            first axis, with one-dimensional results treated as a single row.
+            Array object of the backend type (np.ndarray for the mmap backend)
+        """
+        if len(feat_names) == 0:
+            raise ValueError("feat_names must contain at least one feature name")
+
+        feat_objs = [
+            self._get_feat_obj(type_name, feat_name) for feat_name in feat_names
+        ]
+
+        index = _as_index_array(indices, self.backend)
+        if index is None:
+            # Not a 1-D integer array (eg. None or a boolean mask), so gather
+            # each feature separately.
+            results = [self.get_data(indices, type_name, f) for f in feat_names]
+            results = [
+                r.reshape((1,) + tuple(r.shape)) if r.ndim == 1 else r for r in results
+            ]
+            if self.backend == "torch":
+                return torch.cat(results)
+            return np.concatenate(results)
+
+        num_rows = len(index)
+        has_negative_index = False
+        if num_rows > 0:
+            # Check the bounds once for all features, allowing the gathers
+            # below to skip bounds checking.
+            (min_index, max_index) = (int(index.min()), int(index.max()))
+            for feat_name, feat_obj in zip(feat_names, feat_objs):
+                if min_index < -len(feat_obj) or max_index >= len(feat_obj):
+                    raise IndexError(
+                        f"indices out of bounds for feature {feat_name} of "
+                        f"type_name {type_name} with {len(feat_obj)} rows"
+                    )
+            has_negative_index = min_index < 0
+
+        if self.backend == "mmap":
+            # Read the requested rows of each file once, in sorted order
+            (sorted_index, index) = np.unique(index, return_inverse=True)
+            feat_objs = [feat_obj[sorted_index] for feat_obj in feat_objs]
+
+        result_shapes = [(num_rows,) + tuple(f.shape[1:]) for f in feat_objs]
+        block_shapes = [
+            shape if len(shape) > 1 else (1,) + shape for shape in result_shapes
+        ]
+        if len({shape[1:] for shape in block_shapes}) > 1:
+            raise ValueError(
+                f"features {feat_names} of type_name {type_name} have "
+                "incompatible shapes and cannot be retrieved together"
+            )
+        out_shape = (sum(shape[0] for shape in block_shapes),) + block_shapes[0][1:]
+
+        if self.backend == "torch":
+            dtype = reduce(torch.promote_types, [f.dtype for f in feat_objs])
+            out = torch.empty(out_shape, dtype=dtype, device=feat_objs[0].device)
+        else:
+            dtype = np.result_type(*[f.dtype for f in feat_objs])
+            out = np.empty(out_shape, dtype=dtype)
+
+        start = 0
+        for feat_obj, result_shape, block_shape in zip(
+            feat_objs, result_shapes, block_shapes
+        ):
+            block = out[start : start + block_shape[0]].reshape(result_shape)
+            _take_rows(feat_obj, index, block, has_negative_index)
+            start += block_shape[0]
+
+        return out
+
+    def close(self) -> None:
+        """
+        Remove all features. For the "mmap" backend, this also deletes the
+        temporary directory of the feature files if mmap_dir was not given.
         """
+        self.fd.clear()
+        if self._tmp_dir is not None:
+            self._tmp_dir.cleanup()
+            self._tmp_dir = None
 
+    def get_feature_list(self) -> list[str]:
+        return {feat_name: feats.keys() for feat_name, feats in self.fd.items()}
+
+    def _get_feat_obj(self, type_name: str, feat_name: str):
         if feat_name not in self.fd:
             raise ValueError(
                 f"{feat_name} not found in features: {list(self.fd.keys())}"
@@ -87,10 +245,7 @@ class FeatureStore:
                 f" feature: {list(self.fd[feat_name].keys())}"
             )
 
-        return self.fd[feat_name][type_name][indices]
-
-    def get_feature_list(self) -> list[str]:
-        return {feat_name: feats.keys() for feat_name, feats in self.fd.items()}
+        return self.fd[feat_name][type_name]
 
     @staticmethod
     def _cast_feat_obj_to_backend(feat_obj, backend: str):
@@ -124,3 +279,116 @@ def _cast_to_numpy_ar(ar):
     else:
         ar = np.asarray(ar)
     return ar
+
+
+def _escape_file_name(name):
+    """
+    Returns name escaped for use as part of a file name. "." is escaped too,
+    since it separates the feature and type names in the file name.
+    """
+    return quote(str(name), safe="").replace(".", "%2E")
+
+
+def _write_to_memmap(feat_obj, filename):
+    """
+    Writes feat_obj to the .npy file filename, a chunk of rows at a time, and
+    returns the file memory-mapped as a read-only numpy array. feat_obj is
+    returned as-is if it is already a memory-mapped numpy array.
+    """
+    if isinstance(feat_obj, np.memmap):
+        return feat_obj
+    if isinstance(feat_obj, (cudf.DataFrame, pd.DataFrame)):
+        feat_obj = feat_obj.values
+    elif not hasattr(feat_obj, "shape"):
+        feat_obj = np.asarray(feat_obj)
+
+    shape = tuple(feat_obj.shape)
+    dtype = _cast_to_numpy_ar(feat_obj[:1]).dtype
+    row_nbytes = max(1, dtype.itemsize * int(np.prod(shape[1:])))
+    chunk_rows = max(1, _mmap_write_chunk_bytes // row_nbytes)
+
+    # Write to a temporary file and replace filename with it, rather than
+    # truncating filename, which would invalidate existing maps of it (for
+    # example, if a feature is added again or mmap_dir is shared).
+    (fd, tmp_filename) = tempfile.mkstemp(
+        dir=os.path.dirname(filename) or None, suffix=".npy.tmp"
+    )
+    os.close(fd)
+    try:
+        ar = np.lib.format.open_memmap(
+            tmp_filename, mode="w+", dtype=dtype, shape=shape
+        )
+        for start in range(0, shape[0], chunk_rows):
+            ar[start : start + chunk_rows] = _cast_to_numpy_ar(
+                feat_obj[start : start + chunk_rows]
+            )
+        ar.flush()
+        del ar
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        os.unlink(tmp_filename)
+        raise
+
+    return np.load(filename, mmap_mode="r")
+
+
+def _gather_from_memmap(ar, indices):
+    """
+    Returns the rows of the memory-mapped array ar at indices. Integer indices
+    are read in sorted order, without duplicates, so the file is read
+    sequentially rather than at random.
+    """
+    if indices is None or isinstance(indices, slice):
+        return ar[indices]
+
+    indices = _cast_to_numpy_ar(indices)
+    if indices.ndim == 1 and indices.dtype.kind in "iu":
+        sorted_indices, inverse = np.unique(indices, return_inverse=True)
+        return ar[sorted_indices][inverse]
+
+    return ar[indices]
+
+
+def _as_index_array(indices, backend):
+    """
+    Returns indices as a 1-D integer array of the backend type, or None if
+    indices are not a 1-D integer array.
+    """
+    if indices is None or isinstance(indices, slice):
+        return None
+
+    if backend == "torch":
+        indices = torch.as_tensor(indices)
+        if (
+            indices.ndim == 1
+            and not indices.is_floating_point()
+            and not indices.is_complex()
+            and indices.dtype != torch.bool
+        ):
+            return indices
+        return None
+
+    indices = _cast_to_numpy_ar(indices)
+    if indices.ndim == 1 and indices.dtype.kind in "iu":
+        return indices
+    return None
+
+
+def _take_rows(ar, index, out, has_negative_index):
+    """
+    Writes the rows of ar at index, which must be within bounds, to out.
+    """
+    if isinstance(out, np.ndarray):
+        if ar.dtype == out.dtype:
+            # mode="wrap" avoids an intermediate copy when out is given.
+            np.take(ar, index, axis=0, out=out, mode="wrap")
+        else:
+            out[...] = ar[index]
+    else:
+        index = index.to(ar.device)
+        if has_negative_index:
+            index = torch.remainder(index, len(ar))
+        if ar.dtype == out.dtype and ar.device == out.device:
+            torch.index_select(ar, 0, index, out=out)
+        else:
+            out.copy_(ar[index])
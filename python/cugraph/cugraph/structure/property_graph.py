@@ -21,6 +21,9 @@ from cugraph.utilities.utils import (
     create_list_series_from_2d_ar,
 )
 
+import ast
+import functools
+from collections import namedtuple
 from typing import Union
 
 pd = import_optional("pandas")
@@ -30,6 +33,121 @@ if not isinstance(pd, MissingModule):
     _dataframe_types.append(pd.DataFrame)
 
 
+class _SelectionExpression:
+    """
+    A select_vertices() or select_edges() expression that has been parsed and
+    compiled, and can be evaluated against a vertex or edge eval dict.
+
+    If the expression is a "&" of terms and one of the terms compares the type
+    column to a string (eg. "(_TYPE_ == 'user') & (propC > 10)"), the rows of
+    that type are found using the categorical codes of the type column, and the
+    expression is only evaluated for those rows.
+    """
+
+    def __init__(self, expr, type_col_name):
+        if not isinstance(expr, str):
+            raise TypeError(f"expr must be a string, got: {type(expr)}")
+        tree = ast.parse(expr.strip(), mode="eval")
+        self.code = compile(tree, "<selection>", "eval")
+        self.names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+        self.type_col_name = type_col_name
+        self.type_name = None
+        for term in self.__get_and_terms(tree.body):
+            type_name = self.__get_type_name(term)
+            if type_name is not None:
+                self.type_name = type_name
+                break
+
+    def evaluate(self, eval_dict):
+        """
+        Evaluate the expression using the Series (and Index) in eval_dict, and
+        return the resulting Series.
+        """
+        type_col = eval_dict.get(self.type_col_name)
+        if self.type_name is None or not hasattr(type_col, "cat"):
+            return eval(self.code, {}, eval_dict)
+        categories = type_col.dtype.categories
+        if self.type_name not in categories or not type_col.index.is_unique:
+            return eval(self.code, {}, eval_dict)
+
+        type_mask = type_col.cat.codes == categories.get_loc(self.type_name)
+        if type_mask.all():
+            return eval(self.code, {}, eval_dict)
+        # Rows of other types are not selected, so only evaluate the rows of
+        # the type (using only the columns in the expression).
+        type_mask = type_mask.values
+        rows_eval_dict = {
+            name: eval_dict[name][type_mask] for name in self.names if name in eval_dict
+        }
+        selected = eval(self.code, {}, rows_eval_dict)
+        return selected.reindex(type_col.index, fill_value=False)
+
+    @classmethod
+    def __get_and_terms(cls, node):
+        """
+        Return the terms of the expression node if it is a "&" of terms.
+        """
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd):
+            return cls.__get_and_terms(node.left) + cls.__get_and_terms(node.right)
+        return [node]
+
+    def __get_type_name(self, node):
+        """
+        Return the type name if the expression node is a comparison of the type
+        column to a string, otherwise None.
+        """
+        if not (
+            isinstance(node, ast.Compare)
+            and len(node.ops) == 1
+            and isinstance(node.ops[0], ast.Eq)
+        ):
+            return None
+        left, right = node.left, node.comparators[0]
+        if isinstance(left, ast.Constant):
+            left, right = right, left
+        if (
+            isinstance(left, ast.Name)
+            and left.id == self.type_col_name
+            and isinstance(right, ast.Constant)
+            and isinstance(right.value, str)
+        ):
+            return right.value
+        return None
+
+
+# A graph returned by PropertyGraph.extract_subgraph(), along with the data
+# needed to determine if it can be reused or extended with new edges.
+_ExtractedGraph = namedtuple(
+    "_ExtractedGraph",
+    [
+        "selection",
+        "vertex_data_version",
+        "edge_data_version",
+        "num_edges",
+        "edge_prop_df",
+        "edge_attr",
+        "graph",
+    ],
+)
+
+
+# The IDs of a vertex or edge property DataFrame in sorted order, along with
+# their row positions, for looking up rows by ID. sorted_ids is None if the IDs
+# are not unique.
+_IdIndex = namedtuple(
+    "_IdIndex", ["data_version", "num_rows", "sorted_ids", "positions"]
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_selection_expression(expr, type_col_name):
+    """
+    Return the _SelectionExpression for expr, reusing it if expr was recently
+    compiled.
+    """
+    return _SelectionExpression(expr, type_col_name)
+
+
 # FIXME: remove leading EXPERIMENTAL__ when no longer experimental
 class EXPERIMENTAL__PropertySelection:
     """
@@ -123,7 +241,31 @@ class EXPERIMENTAL__PropertyGraph:
 
     _default_type_name = ""
 
+    # The number of graphs returned by extract_subgraph() to keep for reuse
+    _max_extracted_graphs = 4
+
     def __init__(self):
+        # Segments of vertex and edge data as (type_name, DataFrame) pairs that
+        # follow the rows of the property DataFrames below. Data for new
+        # vertices and for edges with automatically generated IDs cannot
+        # overlap existing rows, so it is stored as a dense DataFrame of only
+        # the columns of its batch instead of copying the table for every
+        # batch. The segments remain the stored form of the data: operations
+        # that read all of the properties concatenate them for that call only,
+        # operations that read some types, columns, or IDs only concatenate
+        # those, and they are only concatenated to the stored DataFrames by
+        # operations that modify the data in place. See the
+        # __vertex_prop_dataframe and __edge_prop_dataframe properties.
+        self.__vertex_prop_segments = []
+        self.__edge_prop_segments = []
+
+        # Incremented when vertex or edge data is changed in any way other than
+        # adding edges with automatically generated IDs, which only adds rows
+        # after the existing edges. Used to determine if graphs returned by
+        # extract_subgraph() can be reused.
+        self.__vertex_data_version = 0
+        self.__edge_data_version = 0
+
         # The dataframe containing the properties for each vertex.
         # Each vertex occupies a row, and individual properties are maintained
         # in individual columns. The table contains a column for each property
@@ -203,6 +345,14 @@ class EXPERIMENTAL__PropertyGraph:
         self.__vertex_type_value_counts = None
         self.__edge_type_value_counts = None
 
+        # Graphs returned by extract_subgraph() as _ExtractedGraph instances,
+        # keyed by the arguments used to extract them.
+        self.__extracted_graphs = {}
+
+        # _IdIndex instances used to look up vertex and edge data by ID
+        self.__vertex_id_index = None
+        self.__edge_id_index = None
+
     def _build_from_components(
         self,
         *,
@@ -228,6 +378,8 @@ class EXPERIMENTAL__PropertyGraph:
 
         Use only if you know what you're doing.
         """
+        self.__vertex_prop_segments = []
+        self.__edge_prop_segments = []
         self.__vertex_prop_dataframe = vertex_prop_dataframe
         self.__edge_prop_dataframe = edge_prop_dataframe
         if vertex_prop_eval_dict is None:
@@ -263,10 +415,9 @@ class EXPERIMENTAL__PropertyGraph:
         All the edges in the graph as a DataFrame containing
         sources and destinations. It does not return the edge properties.
         """
-        if self.__edge_prop_dataframe is not None:
-            return self.__edge_prop_dataframe[
-                [self.src_col_name, self.dst_col_name]
-            ].reset_index()
+        if self.__edge_prop_dataframe_ is not None:
+            columns = [self.src_col_name, self.dst_col_name]
+            return self.__get_edge_prop_columns(columns)[columns].reset_index()
         return None
 
     @property
@@ -274,8 +425,8 @@ class EXPERIMENTAL__PropertyGraph:
         """
         Names of all the vertex properties excluding type.
         """
-        if self.__vertex_prop_dataframe is not None:
-            props = list(self.__vertex_prop_dataframe.columns)
+        if self.__vertex_prop_dataframe_ is not None:
+            props = self.__get_column_names(self.__get_vertex_prop_dataframes())
             props.remove(self.type_col_name)  # should "type" be removed?
             return props
         return []
@@ -285,8 +436,8 @@ class EXPERIMENTAL__PropertyGraph:
         """
         List containing each edge property name in the PropertyGraph instance.
         """
-        if self.__edge_prop_dataframe is not None:
-            props = list(self.__edge_prop_dataframe.columns)
+        if self.__edge_prop_dataframe_ is not None:
+            props = self.__get_column_names(self.__get_edge_prop_dataframes())
             props.remove(self.src_col_name)
             props.remove(self.dst_col_name)
             props.remove(self.type_col_name)  # should "type" be removed?
@@ -338,16 +489,60 @@ class EXPERIMENTAL__PropertyGraph:
         """
         return self.__edge_prop_dataframe
 
+    @property
+    def __vertex_prop_dataframe(self):
+        """
+        The vertex property DataFrame, including any vertex data segments.
+        If there are segments, a new DataFrame is concatenated for every access
+        and is not stored, so it should only be read once per operation.
+        """
+        if not self.__vertex_prop_segments:
+            return self.__vertex_prop_dataframe_
+        return self.__concat_segments(
+            self.__vertex_prop_dataframe_,
+            self.__vertex_prop_segments,
+            self.__vertex_prop_dtypes,
+        )
+
+    @__vertex_prop_dataframe.setter
+    def __vertex_prop_dataframe(self, df):
+        # df replaces all of the vertex data, including any segments
+        self.__vertex_prop_segments = []
+        self.__vertex_prop_dataframe_ = df
+        self.__vertex_data_version += 1
+
+    @property
+    def __edge_prop_dataframe(self):
+        """
+        The edge property DataFrame, including any edge data segments.
+        If there are segments, a new DataFrame is concatenated for every access
+        and is not stored, so it should only be read once per operation.
+        """
+        if not self.__edge_prop_segments:
+            return self.__edge_prop_dataframe_
+        return self.__concat_segments(
+            self.__edge_prop_dataframe_,
+            self.__edge_prop_segments,
+            self.__edge_prop_dtypes,
+        )
+
+    @__edge_prop_dataframe.setter
+    def __edge_prop_dataframe(self, df):
+        # df replaces all of the edge data, including any segments
+        self.__edge_prop_segments = []
+        self.__edge_prop_dataframe_ = df
+        self.__edge_data_version += 1
+
     @property
     def _vertex_type_value_counts(self):
         """
         A Series of the counts of types in __vertex_prop_dataframe
         """
-        if self.__vertex_prop_dataframe is None:
+        if self.__vertex_prop_dataframe_ is None:
             return
         if self.__vertex_type_value_counts is None:
             # Types should all be strings; what should we do if we see NaN?
-            self.__vertex_type_value_counts = self.__vertex_prop_dataframe[
+            self.__vertex_type_value_counts = self.__get_vertex_prop_columns([])[
                 self.type_col_name
             ].value_counts(sort=False, dropna=False)
         return self.__vertex_type_value_counts
@@ -357,11 +552,11 @@ class EXPERIMENTAL__PropertyGraph:
         """
         Series of the counts of types in __edge_prop_dataframe
         """
-        if self.__edge_prop_dataframe is None:
+        if self.__edge_prop_dataframe_ is None:
             return
         if self.__edge_type_value_counts is None:
             # Types should all be strings; what should we do if we see NaN?
-            self.__edge_type_value_counts = self.__edge_prop_dataframe[
+            self.__edge_type_value_counts = self.__get_edge_prop_columns([])[
                 self.type_col_name
             ].value_counts(sort=False, dropna=False)
         return self.__edge_type_value_counts
@@ -408,9 +603,11 @@ class EXPERIMENTAL__PropertyGraph:
         """
         if type is None:
             if not include_edge_data:
-                if self.__vertex_prop_dataframe is None:
+                if self.__vertex_prop_dataframe_ is None:
                     return 0
-                return len(self.__vertex_prop_dataframe)
+                return len(self.__vertex_prop_dataframe_) + sum(
+                    len(df) for _, df in self.__vertex_prop_segments
+                )
             if self.__num_vertices is not None:
                 return self.__num_vertices
             self.__num_vertices = 0
@@ -429,14 +626,14 @@ class EXPERIMENTAL__PropertyGraph:
         value_counts = self._vertex_type_value_counts
         if type == self._default_type_name and include_edge_data:
             # The default type, "", can refer to both vertex and edge data
-            if self.__vertex_prop_dataframe is None:
+            if self.__vertex_prop_dataframe_ is None:
                 return self.get_num_vertices()
             return (
                 self.get_num_vertices()
-                - len(self.__vertex_prop_dataframe)
+                - self.get_num_vertices(include_edge_data=False)
                 + (value_counts[type] if type in value_counts else 0)
             )
-        if self.__vertex_prop_dataframe is None:
+        if self.__vertex_prop_dataframe_ is None:
             return 0
         return value_counts[type] if type in value_counts else 0
 
@@ -476,11 +673,13 @@ class EXPERIMENTAL__PropertyGraph:
         4
         """
         if type is None:
-            if self.__edge_prop_dataframe is not None:
-                return len(self.__edge_prop_dataframe)
+            if self.__edge_prop_dataframe_ is not None:
+                return len(self.__edge_prop_dataframe_) + sum(
+                    len(df) for _, df in self.__edge_prop_segments
+                )
             else:
                 return 0
-        if self.__edge_prop_dataframe is None:
+        if self.__edge_prop_dataframe_ is None:
             return 0
         value_counts = self._edge_type_value_counts
         return value_counts[type] if type in value_counts else 0
@@ -571,7 +770,9 @@ class EXPERIMENTAL__PropertyGraph:
         Union[cudf.Series, pd.Series]
             The string type names converted from the input numerals.
         """
-        return self.__vertex_prop_dataframe[self.type_col_name].dtype.categories[nums]
+        # Categories were only added, so the latest DataFrame has all types
+        df = self.__get_vertex_prop_dataframes()[-1]
+        return df[self.type_col_name].dtype.categories[nums]
 
     def edge_types_from_numerals(
         self, nums: Union[cudf.Series, pd.Series]
@@ -589,7 +790,9 @@ class EXPERIMENTAL__PropertyGraph:
         Union[cudf.Series, pd.Series]
             The string type names converted from the input numerals.
         """
-        return self.__edge_prop_dataframe[self.type_col_name].dtype.categories[nums]
+        # Categories were only added, so the latest DataFrame has all types
+        df = self.__get_edge_prop_dataframes()[-1]
+        return df[self.type_col_name].dtype.categories[nums]
 
     def add_vertex_data(
         self,
@@ -758,7 +961,11 @@ class EXPERIMENTAL__PropertyGraph:
         self.__vertex_type_value_counts = None  # Could update instead
 
         # Add `type_name` to the TYPE categorical dtype if necessary
-        is_first_data = self.__vertex_prop_dataframe is None
+        is_first_data = self.__vertex_prop_dataframe_ is None
+        # Data for new vertices can be added as a segment
+        is_append = is_first_data or not self.__contains_any_vertex(
+            dataframe.index if index_is_set else dataframe[vertex_col_name]
+        )
         if is_first_data:
             # Initialize the __vertex_prop_dataframe using the same type
             # as the incoming dataframe.
@@ -782,7 +989,20 @@ class EXPERIMENTAL__PropertyGraph:
             else:
                 cat_class = pd.CategoricalDtype
             cat_dtype = cat_class([type_name], ordered=False)
+        elif is_append:
+            # Add `type_name` to the latest DataFrame without concatenating
+            cat_dtype = self.__update_categorical_dtype(
+                (
+                    self.__vertex_prop_segments[-1][1]
+                    if self.__vertex_prop_segments
+                    else self.__vertex_prop_dataframe_
+                ),
+                TCN,
+                type_name,
+            )
         else:
+            # The data is joined to (and modifies) the stored DataFrame
+            self.__consolidate_vertex_data()
             cat_dtype = self.__update_categorical_dtype(
                 self.__vertex_prop_dataframe, TCN, type_name
             )
@@ -839,6 +1059,13 @@ class EXPERIMENTAL__PropertyGraph:
         # during merge to accommodate NaN values).
         if is_first_data:
             new_col_info = tmp_df.dtypes.items()
+        elif is_append:
+            # Every column of the vertex table has a saved dtype
+            new_col_info = [
+                (col, dtype)
+                for col, dtype in tmp_df.dtypes.items()
+                if col not in self.__vertex_prop_dtypes
+            ]
         else:
             new_col_info = self.__get_new_column_dtypes(
                 tmp_df, self.__vertex_prop_dataframe
@@ -849,8 +1076,13 @@ class EXPERIMENTAL__PropertyGraph:
             tmp_df.set_index(self.vertex_col_name, inplace=True)
         tmp_df = self.__update_dataframe_dtypes(tmp_df, self.__vertex_prop_dtypes)
 
-        if is_first_data:
-            self.__vertex_prop_dataframe = tmp_df
+        if is_append:
+            if is_first_data:
+                self.__vertex_prop_dataframe = tmp_df.iloc[:0]
+            # The eval dict is updated if the segments are consolidated
+            self.__vertex_prop_segments.append((type_name, tmp_df))
+            self.__vertex_data_version += 1
+            return
         else:
             # Join on vertex ids (the index)
             # TODO: can we automagically determine when we to use concat?
@@ -931,19 +1163,37 @@ class EXPERIMENTAL__PropertyGraph:
         6  vtype        96       7
         7  vtype        88       8
         """
-        if self.__vertex_prop_dataframe is not None:
-            df = self.__vertex_prop_dataframe
+        if self.__vertex_prop_dataframe_ is not None:
             if vertex_ids is not None:
                 if isinstance(vertex_ids, int):
                     vertex_ids = [vertex_ids]
 
+                dfs = self.__get_vertex_prop_dataframes()
+                self.__vertex_id_index = self.__get_id_index(
+                    dfs, self.__vertex_id_index, self.__vertex_data_version
+                )
+                positions = self.__get_id_positions(vertex_ids, self.__vertex_id_index)
                 try:
-                    df = df.loc[vertex_ids]
+                    if positions is not None:
+                        # Only concatenate the rows with the given IDs
+                        df = self.__take_rows(dfs, positions, self.__vertex_prop_dtypes)
+                    else:
+                        df = self.__vertex_prop_dataframe.loc[vertex_ids]
                 except TypeError:
                     raise TypeError(
                         "vertex_ids needs to be a list-like type "
                         f"compatible with DataFrame.loc[], got {type(vertex_ids)}"
                     )
+            elif types is not None and self.__vertex_prop_segments:
+                # Only concatenate the segments of the given types
+                df = self.__concat_segments(
+                    self.__vertex_prop_dataframe_,
+                    self.__vertex_prop_segments,
+                    self.__vertex_prop_dtypes,
+                    types=[types] if isinstance(types, str) else list(types),
+                )
+            else:
+                df = self.__vertex_prop_dataframe
 
             if types is not None:
                 if isinstance(types, str):
@@ -965,7 +1215,7 @@ class EXPERIMENTAL__PropertyGraph:
 
             # Preserve the dtype (vertex id type) to avoid cugraph algorithms
             # throwing errors due to a dtype mismatch
-            index_dtype = self.__vertex_prop_dataframe.index.dtype
+            index_dtype = df.index.dtype
             df_out.index = df_out.index.astype(index_dtype)
 
             return df_out
@@ -1170,7 +1420,9 @@ class EXPERIMENTAL__PropertyGraph:
         self.__edge_type_value_counts = None  # Could update instead
 
         # Add `type_name` to the categorical dtype if necessary
-        is_first_data = self.__edge_prop_dataframe is None
+        is_first_data = self.__edge_prop_dataframe_ is None
+        # Edges with new automatically generated IDs can be added as a segment
+        is_append = edge_id_col_name is None
         if is_first_data:
             self.__edge_prop_dataframe = self.__dataframe_type(
                 columns=[self.src_col_name, self.dst_col_name, TCN]
@@ -1195,7 +1447,20 @@ class EXPERIMENTAL__PropertyGraph:
                 cat_class = pd.CategoricalDtype
             cat_dtype = cat_class([type_name], ordered=False)
             self.__is_edge_id_autogenerated = edge_id_col_name is None
+        elif is_append:
+            # Add `type_name` to the latest DataFrame without concatenating
+            cat_dtype = self.__update_categorical_dtype(
+                (
+                    self.__edge_prop_segments[-1][1]
+                    if self.__edge_prop_segments
+                    else self.__edge_prop_dataframe_
+                ),
+                TCN,
+                type_name,
+            )
         else:
+            # The data is joined to (and modifies) the stored DataFrame
+            self.__consolidate_edge_data()
             cat_dtype = self.__update_categorical_dtype(
                 self.__edge_prop_dataframe, TCN, type_name
             )
@@ -1259,6 +1524,13 @@ class EXPERIMENTAL__PropertyGraph:
         # during merge to accommodate NaN values).
         if is_first_data:
             new_col_info = tmp_df.dtypes.items()
+        elif is_append:
+            # Every column of the edge table has a saved dtype
+            new_col_info = [
+                (col, dtype)
+                for col, dtype in tmp_df.dtypes.items()
+                if col not in self.__edge_prop_dtypes
+            ]
         else:
             new_col_info = self.__get_new_column_dtypes(
                 tmp_df, self.__edge_prop_dataframe
@@ -1267,7 +1539,13 @@ class EXPERIMENTAL__PropertyGraph:
 
         tmp_df = self.__update_dataframe_dtypes(tmp_df, self.__edge_prop_dtypes)
 
-        if is_first_data:
+        if is_append:
+            if is_first_data:
+                self.__edge_prop_dataframe = tmp_df.iloc[:0]
+            # The eval dict is updated if the segments are consolidated
+            self.__edge_prop_segments.append((type_name, tmp_df))
+            return
+        elif is_first_data:
             self.__edge_prop_dataframe = tmp_df
         else:
             # Join on edge ids (the index)
@@ -1332,19 +1610,37 @@ class EXPERIMENTAL__PropertyGraph:
         2     56          2     97  etype             c
         3     88          3     96  etype             d
         """
-        if self.__edge_prop_dataframe is not None:
-            df = self.__edge_prop_dataframe
+        if self.__edge_prop_dataframe_ is not None:
             if edge_ids is not None:
                 if isinstance(edge_ids, int):
                     edge_ids = [edge_ids]
 
+                dfs = self.__get_edge_prop_dataframes()
+                self.__edge_id_index = self.__get_id_index(
+                    dfs, self.__edge_id_index, self.__edge_data_version
+                )
+                positions = self.__get_id_positions(edge_ids, self.__edge_id_index)
                 try:
-                    df = df.loc[edge_ids]
+                    if positions is not None:
+                        # Only concatenate the rows with the given IDs
+                        df = self.__take_rows(dfs, positions, self.__edge_prop_dtypes)
+                    else:
+                        df = self.__edge_prop_dataframe.loc[edge_ids]
                 except TypeError:
                     raise TypeError(
                         "edge_ids needs to be a list-like type "
                         f"compatible with DataFrame.loc[], got {type(edge_ids)}"
                     )
+            elif types is not None and self.__edge_prop_segments:
+                # Only concatenate the segments of the given types
+                df = self.__concat_segments(
+                    self.__edge_prop_dataframe_,
+                    self.__edge_prop_segments,
+                    self.__edge_prop_dtypes,
+                    types=[types] if isinstance(types, str) else list(types),
+                )
+            else:
+                df = self.__edge_prop_dataframe
 
             if types is not None:
                 if isinstance(types, str):
@@ -1357,7 +1653,7 @@ class EXPERIMENTAL__PropertyGraph:
             # included/added since they are assumed to be needed by the caller.
             if columns is None:
                 # remove the "internal" weight column if one was added
-                all_columns = list(self.__edge_prop_dataframe.columns)
+                all_columns = list(df.columns)
                 if self.weight_col_name in all_columns:
                     all_columns.remove(self.weight_col_name)
                 df = df[all_columns]
@@ -1373,7 +1669,7 @@ class EXPERIMENTAL__PropertyGraph:
 
             # Preserve the dtype (edge id type) to avoid cugraph algorithms
             # throwing errors due to a dtype mismatch
-            index_dtype = self.__edge_prop_dataframe.index.dtype
+            index_dtype = df.index.dtype
             df_out.index = df_out.index.astype(index_dtype)
 
             return df_out
@@ -1392,7 +1688,9 @@ class EXPERIMENTAL__PropertyGraph:
             Series is passed, the index or keys are the columns to fill
             and the values are the fill value for the corresponding column.
         """
+        self.__consolidate_vertex_data()
         self.__vertex_prop_dataframe.fillna(val, inplace=True)
+        self.__vertex_data_version += 1
 
     def fillna_edges(self, val=0):
         """
@@ -1407,7 +1705,9 @@ class EXPERIMENTAL__PropertyGraph:
             and the values are the fill value for the corresponding column.
         """
 
+        self.__consolidate_edge_data()
         self.__edge_prop_dataframe.fillna(val, inplace=True)
+        self.__edge_data_version += 1
 
     def select_vertices(self, expr, from_previous_selection=None):
         """
@@ -1453,7 +1753,7 @@ class EXPERIMENTAL__PropertyGraph:
         >>> print (G.number_of_vertices())
         4
         """
-        # FIXME: check types
+        selection_expr = _compile_selection_expression(expr, self.type_col_name)
 
         # Check if the expr is to be evaluated in the context of properties
         # from only the previously selected vertices (as opposed to all
@@ -1462,23 +1762,29 @@ class EXPERIMENTAL__PropertyGraph:
             from_previous_selection is not None
             and from_previous_selection.vertex_selections is not None
         ):
-            previously_selected_rows = self.__vertex_prop_dataframe[
+            vertex_prop_df = self.__get_vertex_prop_columns(selection_expr.names)
+            previously_selected_rows = vertex_prop_df[
                 from_previous_selection.vertex_selections
             ]
 
-            rows_to_eval = self.__vertex_prop_dataframe.loc[
-                previously_selected_rows.index
-            ]
+            rows_to_eval = vertex_prop_df.loc[previously_selected_rows.index]
 
             locals = dict([(n, rows_to_eval[n]) for n in rows_to_eval.columns])
             locals[self.vertex_col_name] = rows_to_eval.index
+        elif self.__vertex_prop_segments:
+            # Only the columns used by the expression are concatenated
+            locals = {}
+            self._update_eval_dict(
+                locals,
+                self.__get_vertex_prop_columns(selection_expr.names),
+                self.vertex_col_name,
+            )
         else:
             locals = self.__vertex_prop_eval_dict
 
-        globals = {}
-        selected_col = eval(expr, globals, locals)
+        selected_col = selection_expr.evaluate(locals)
 
-        num_rows = len(self.__vertex_prop_dataframe)
+        num_rows = self.get_num_vertices(include_edge_data=False)
         # Ensure the column is the same size as the DataFrame, then replace any
         # NA values with False to represent rows that should not be selected.
         # This ensures the selected column can be applied to the entire
@@ -1486,7 +1792,7 @@ class EXPERIMENTAL__PropertyGraph:
         # a Graph from a query.
         if num_rows != len(selected_col):
             selected_col = selected_col.reindex(
-                self.__vertex_prop_dataframe.index, fill_value=False, copy=False
+                self.__get_vertex_prop_columns([]).index, fill_value=False, copy=False
             )
 
         return EXPERIMENTAL__PropertySelection(vertex_selection_series=selected_col)
@@ -1532,11 +1838,18 @@ class EXPERIMENTAL__PropertyGraph:
         src  dst
         0   96   88
         """
-        # FIXME: check types
-        globals = {}
-        locals = self.__edge_prop_eval_dict
-
-        selected_col = eval(expr, globals, locals)
+        selection_expr = _compile_selection_expression(expr, self.type_col_name)
+        if self.__edge_prop_segments:
+            # Only the columns used by the expression are concatenated
+            locals = {}
+            self._update_eval_dict(
+                locals,
+                self.__get_edge_prop_columns(selection_expr.names),
+                self.edge_id_col_name,
+            )
+        else:
+            locals = self.__edge_prop_eval_dict
+        selected_col = selection_expr.evaluate(locals)
         return EXPERIMENTAL__PropertySelection(edge_selection_series=selected_col)
 
     def extract_subgraph(
@@ -1628,54 +1941,6 @@ class EXPERIMENTAL__PropertyGraph:
                 f"PropertySelection, got {type(selection)}"
             )
 
-        # NOTE: the expressions passed in to extract specific edges and
-        # vertices assume the original dtypes in the user input have been
-        # preserved. However, merge operations on the DataFrames can change
-        # dtypes (eg. int64 to float64 in order to add NaN entries). This
-        # should not be a problem since the conversions do not change the
-        # values.
-        if selection is not None and selection.vertex_selections is not None:
-            selected_vertex_dataframe = self.__vertex_prop_dataframe[
-                selection.vertex_selections
-            ]
-        else:
-            selected_vertex_dataframe = None
-
-        if selection is not None and selection.edge_selections is not None:
-            selected_edge_dataframe = self.__edge_prop_dataframe[
-                selection.edge_selections
-            ]
-        else:
-            selected_edge_dataframe = self.__edge_prop_dataframe
-
-        # FIXME: check that self.__edge_prop_dataframe is set!
-
-        # If vertices were specified, select only the edges that contain the
-        # selected verts in both src and dst
-        if (
-            selected_vertex_dataframe is not None
-            and not selected_vertex_dataframe.empty
-        ):
-            has_srcs = selected_edge_dataframe[self.src_col_name].isin(
-                selected_vertex_dataframe.index
-            )
-            has_dsts = selected_edge_dataframe[self.dst_col_name].isin(
-                selected_vertex_dataframe.index
-            )
-            edges = selected_edge_dataframe[has_srcs & has_dsts]
-            # Alternative to benchmark
-            # edges = selected_edge_dataframe.merge(
-            #     selected_vertex_dataframe[[]],
-            #     left_on=self.src_col_name,
-            #     right_index=True,
-            # ).merge(
-            #     selected_vertex_dataframe[[]],
-            #     left_on=self.dst_col_name,
-            #     right_index=True,
-            # )
-        else:
-            edges = selected_edge_dataframe
-
         # Default create_using set here instead of function signature to
         # prevent cugraph from running on import. This may help diagnose errors
         create_kind = "cugraph"
@@ -1688,33 +1953,38 @@ class EXPERIMENTAL__PropertyGraph:
             rv = create_using()
             create_kind = "propertygraph"
         if create_kind == "cugraph":
-            # The __*_prop_dataframes have likely been merged several times and
-            # possibly had their dtypes converted in order to accommodate NaN
-            # values. Restore the original dtypes in the resulting edges df prior
-            # to creating a Graph.
-            edges = self.__update_dataframe_dtypes(edges, self.__edge_prop_dtypes)
-            return self.edge_props_to_graph(
-                edges,
-                create_using=create_using,
+            return self.__extract_graph(
+                create_using,
+                selection,
                 edge_weight_property=edge_weight_property,
                 default_edge_weight=default_edge_weight,
                 check_multi_edges=check_multi_edges,
                 renumber_graph=renumber_graph,
                 add_edge_data=add_edge_data,
             )
+
+        selected_vertex_dataframe = self.__get_selected_vertex_dataframe(selection)
+        edge_prop_df = self.__edge_prop_dataframe
+        edges = self.__get_selected_edges(
+            edge_prop_df, selection, selected_vertex_dataframe
+        )
+
         # Return a subgraph as PropertyGraph
         if (
             selected_vertex_dataframe is None
-            and self.__vertex_prop_dataframe is not None
+            and self.__vertex_prop_dataframe_ is not None
         ):
-            selected_vertex_dataframe = self.__vertex_prop_dataframe.copy()
+            selected_vertex_dataframe = self.__vertex_prop_dataframe
+            if selected_vertex_dataframe is self.__vertex_prop_dataframe_:
+                selected_vertex_dataframe = selected_vertex_dataframe.copy()
             num_vertices = self.__num_vertices
             vertex_type_value_counts = self.__vertex_type_value_counts
         else:
             num_vertices = None
             vertex_type_value_counts = None
-        if edges is not None and edges is self.__edge_prop_dataframe:
-            edges = edges.copy()
+        if edges is not None and edges is edge_prop_df:
+            if edges is self.__edge_prop_dataframe_:
+                edges = edges.copy()
             edge_type_value_counts = self.__edge_type_value_counts
         else:
             edge_type_value_counts = None
@@ -1804,17 +2074,14 @@ class EXPERIMENTAL__PropertyGraph:
             raise AttributeError("Graph G does not have attribute 'edge_data'")
 
         # Join on shared columns and the indices
-        cols = self.__edge_prop_dataframe.columns.intersection(
-            edge_info_df.columns
-        ).to_list()
+        edge_prop_df = self.__edge_prop_dataframe
+        cols = edge_prop_df.columns.intersection(edge_info_df.columns).to_list()
         cols.append(self.edge_id_col_name)
 
         # New result includes only properties from the src/dst edges identified
         # by edge IDs. All other data in df is merged based on src/dst values.
         # NOTE: results from MultiGraph graphs will have to include edge IDs!
-        edge_props_df = edge_info_df.merge(
-            self.__edge_prop_dataframe, on=cols, how="inner"
-        )
+        edge_props_df = edge_info_df.merge(edge_prop_df, on=cols, how="inner")
 
         # FIXME: also allow edge ID col to be passed in and renamed.
         new_df = df.rename(
@@ -1894,111 +2161,17 @@ class EXPERIMENTAL__PropertyGraph:
         2   56   97
         3   34   98
         """
-        # Don't mutate input data, and ensure DataFrame is not a view
-        edge_prop_df = edge_prop_df.copy()
-        # FIXME: check default_edge_weight is valid
-        if edge_weight_property:
-            if (
-                edge_weight_property not in edge_prop_df.columns
-                and edge_prop_df.index.name != edge_weight_property
-            ):
-                raise ValueError(
-                    "edge_weight_property "
-                    f'"{edge_weight_property}" was not found in '
-                    "edge_prop_df"
-                )
-
-            # Ensure a valid edge_weight_property can be used for applying
-            # weights to the subgraph, and if a default_edge_weight was
-            # specified, apply it to all NAs in the weight column.
-            # Also allow the type column to be specified as the edge weight
-            # property so that uniform_neighbor_sample can be called with
-            # the weights interpreted as types.
-            if edge_weight_property == self.type_col_name:
-                prop_col = edge_prop_df[self.type_col_name].cat.codes.astype("float32")
-                edge_prop_df["_temp_type_col"] = prop_col
-                edge_weight_property = "_temp_type_col"
-            elif edge_weight_property in edge_prop_df.columns:
-                prop_col = edge_prop_df[edge_weight_property]
-            else:
-                prop_col = edge_prop_df.index.to_series()
-            if prop_col.count() != prop_col.size:
-                if default_edge_weight is None:
-                    raise ValueError(
-                        f'edge_weight_property "{edge_weight_property}" '
-                        "contains NA values in the subgraph and "
-                        "default_edge_weight is not set"
-                    )
-                prop_col = prop_col.fillna(default_edge_weight)
-                if edge_weight_property in edge_prop_df.columns:
-                    edge_prop_df[edge_weight_property] = prop_col
-                else:
-                    edge_prop_df.index = prop_col
-            edge_attr = edge_weight_property
-
-        # If a default_edge_weight was specified but an edge_weight_property
-        # was not, a new edge weight column must be added.
-        elif default_edge_weight:
-            edge_attr = self.weight_col_name
-            edge_prop_df[edge_attr] = default_edge_weight
-        else:
-            edge_attr = None
-
-        # Set up the new Graph to return
-        if isinstance(create_using, cugraph.Graph):
-            # FIXME: extract more attrs from the create_using instance
-            attrs = {"directed": create_using.is_directed()}
-            G = type(create_using)(**attrs)
-        elif type(create_using) is type and issubclass(create_using, cugraph.Graph):
-            G = create_using()
-        else:
-            raise TypeError(
-                "create_using must be a cugraph.Graph "
-                "(or subclass) type or instance, got: "
-                f"{type(create_using)}"
-            )
-
-        # Prevent duplicate edges (if not allowed) since applying them to
-        # non-MultiGraphs would result in ambiguous edge properties.
-        if (
-            check_multi_edges
-            and not G.is_multigraph()
-            and self.is_multigraph(edge_prop_df)
-        ):
-            if create_using:
-                if type(create_using) is type:
-                    t = create_using.__name__
-                else:
-                    t = type(create_using).__name__
-                msg = f"'{t}' graph type specified by create_using"
-            else:
-                msg = "default Graph graph type"
-            raise RuntimeError(
-                "query resulted in duplicate edges which "
-                f"cannot be represented with the {msg}"
-            )
-
-        create_args = {
-            "source": self.src_col_name,
-            "destination": self.dst_col_name,
-            "edge_attr": edge_attr,
-            "renumber": renumber_graph,
-        }
-        if type(edge_prop_df) is cudf.DataFrame:
-            G.from_cudf_edgelist(edge_prop_df.reset_index(), **create_args)
-        else:
-            G.from_pandas_edgelist(edge_prop_df.reset_index(), **create_args)
-
-        if add_edge_data:
-            # Set the edge_data on the resulting Graph to a DataFrame
-            # containing the edges and the edge ID for each. Edge IDs are
-            # needed for future calls to annotate_dataframe() in order to
-            # associate edges with their properties, since the PG can contain
-            # multiple edges between vertrices with different properties.
-            # FIXME: also add vertex_data
-            G.edge_data = self.__create_property_lookup_table(edge_prop_df)
-
-        return G
+        edge_prop_df, edge_attr = self.__get_graph_edges(
+            edge_prop_df, edge_weight_property, default_edge_weight
+        )
+        return self.__create_graph(
+            edge_prop_df,
+            edge_attr,
+            create_using,
+            check_multi_edges=check_multi_edges,
+            renumber_graph=renumber_graph,
+            add_edge_data=add_edge_data,
+        )
 
     def renumber_vertices_by_type(self, prev_id_column=None):
         """
@@ -2042,15 +2215,18 @@ class EXPERIMENTAL__PropertyGraph:
         # Check if some vertex IDs exist only in edge data
         TCN = self.type_col_name
         default = self._default_type_name
-        if self.__edge_prop_dataframe is not None and self.get_num_vertices(
+        if self.__edge_prop_dataframe_ is not None and self.get_num_vertices(
             default, include_edge_data=True
         ) != self.get_num_vertices(default, include_edge_data=False):
             raise NotImplementedError(
                 "Currently unable to renumber vertices when some vertex "
                 "IDs only exist in edge data"
             )
-        if self.__vertex_prop_dataframe is None:
+        if self.__vertex_prop_dataframe_ is None:
             return None
+        # The vertex and edge DataFrames are modified in place
+        self.__consolidate_vertex_data()
+        self.__consolidate_edge_data()
         if (
             prev_id_column is not None
             and prev_id_column in self.__vertex_prop_dataframe
@@ -2087,6 +2263,7 @@ class EXPERIMENTAL__PropertyGraph:
             self.__edge_prop_dataframe[self.dst_col_name] = self.__edge_prop_dataframe[
                 self.dst_col_name
             ].map(mapper)
+            self.__edge_data_version += 1
         if prev_id_column is None:
             df.drop(columns=[self.vertex_col_name], inplace=True)
         else:
@@ -2144,8 +2321,10 @@ class EXPERIMENTAL__PropertyGraph:
         """
         TCN = self.type_col_name
 
-        if self.__edge_prop_dataframe is None:
+        if self.__edge_prop_dataframe_ is None:
             return None
+        # The edge DataFrame is modified in place
+        self.__consolidate_edge_data()
         if prev_id_column is not None and prev_id_column in self.__edge_prop_dataframe:
             raise ValueError(
                 f"Can't save previous IDs to existing column {prev_id_column!r}"
@@ -2454,6 +2633,536 @@ class EXPERIMENTAL__PropertyGraph:
         # then no duplicate edges
         return unique_pair_len != len(df)
 
+    def __concat_segments(
+        self, df, segments, dtypes, types=None, columns=None, sort_index=True
+    ):
+        """
+        Concatenate a property DataFrame and its (type_name, DataFrame) segments
+        into a single DataFrame. If types is given, only rows of those types are
+        included, and segments of other types only contribute their columns. If
+        columns is given, only those columns and the type column are included.
+        """
+        TCN = self.type_col_name
+        # Be consistent with joining on the index, which sorts it with pandas
+        is_sorted = (
+            sort_index
+            and self.__dataframe_type is not cudf.DataFrame
+            and (len(df) > 0) + sum(len(seg_df) > 0 for _, seg_df in segments) > 1
+        )
+        if types is None:
+            dfs = [df, *(seg_df for _, seg_df in segments)]
+        else:
+            if len(df) > 0:
+                df = df.loc[df[TCN].isin(types)]
+            dfs = [
+                df,
+                *(
+                    seg_df if type_name in types else seg_df.iloc[:0]
+                    for type_name, seg_df in segments
+                ),
+            ]
+        if columns is not None:
+            dfs = [
+                part[[col for col in part.columns if col == TCN or col in columns]]
+                for part in dfs
+            ]
+        index_name = df.index.name
+        # Categories were only added, so the latest dtype includes all types
+        cat_dtype = dfs[-1].dtypes[TCN]
+        dfs = [
+            df if df.dtypes[TCN] == cat_dtype else df.astype({TCN: cat_dtype})
+            for df in dfs
+        ]
+        if self.__dataframe_type is cudf.DataFrame:
+            df = cudf.concat(dfs)
+        else:
+            df = pd.concat(dfs)
+            if is_sorted:
+                df.sort_index(inplace=True)
+        df.index.name = index_name
+        # Columns that are missing from some DataFrames may have been upcast
+        return self.__update_dataframe_dtypes(df, dtypes)
+
+    def __get_vertex_prop_dataframes(self):
+        """
+        Return the stored vertex property DataFrame followed by the DataFrames
+        of the vertex data segments.
+        """
+        return [
+            self.__vertex_prop_dataframe_,
+            *(df for _, df in self.__vertex_prop_segments),
+        ]
+
+    def __get_edge_prop_dataframes(self):
+        """
+        Return the stored edge property DataFrame followed by the DataFrames of
+        the edge data segments.
+        """
+        return [
+            self.__edge_prop_dataframe_,
+            *(df for _, df in self.__edge_prop_segments),
+        ]
+
+    def __get_vertex_prop_columns(self, columns):
+        """
+        Return the vertex property DataFrame for reading the given columns. If
+        there are vertex data segments, only those columns and the type column
+        are concatenated.
+        """
+        if not self.__vertex_prop_segments:
+            return self.__vertex_prop_dataframe_
+        return self.__concat_segments(
+            self.__vertex_prop_dataframe_,
+            self.__vertex_prop_segments,
+            self.__vertex_prop_dtypes,
+            columns=columns,
+        )
+
+    def __get_edge_prop_columns(self, columns):
+        """
+        Return the edge property DataFrame for reading the given columns. If
+        there are edge data segments, only those columns and the type column
+        are concatenated.
+        """
+        if not self.__edge_prop_segments:
+            return self.__edge_prop_dataframe_
+        return self.__concat_segments(
+            self.__edge_prop_dataframe_,
+            self.__edge_prop_segments,
+            self.__edge_prop_dtypes,
+            columns=columns,
+        )
+
+    @staticmethod
+    def __get_column_names(dfs):
+        """
+        Return the names of the columns in any of dfs, in order of appearance.
+        """
+        names = {}
+        for df in dfs:
+            names.update(dict.fromkeys(df.columns))
+        return list(names)
+
+    def __take_rows(self, dfs, positions, dtypes):
+        """
+        Return the rows at positions (an array of row positions) of dfs, which
+        are the stored vertex or edge property DataFrame and its segments taken
+        in order, in the order of positions. Only those rows are concatenated.
+        """
+        if len(dfs) == 1:
+            return dfs[0].iloc[positions]
+        parts = []
+        orders = []
+        start = 0
+        for df in dfs:
+            order = ((positions >= start) & (positions < start + len(df))).nonzero()[0]
+            parts.append(df.iloc[positions[order] - start])
+            orders.append(order)
+            start += len(df)
+        df = self.__concat_segments(
+            parts[0],
+            [(None, part) for part in parts[1:]],
+            dtypes,
+            sort_index=False,
+        )
+        # concatenate dispatches to cupy for cupy arrays
+        return df.iloc[np.concatenate(orders).argsort()]
+
+    def __consolidate_vertex_data(self):
+        """
+        Concatenate the vertex data segments to the stored vertex property
+        DataFrame, then update the vertex eval dict. This is only done before
+        the stored DataFrame is modified in place.
+        """
+        if not self.__vertex_prop_segments:
+            return
+        df = self.__vertex_prop_dataframe
+        self.__vertex_prop_segments = []
+        self.__vertex_prop_dataframe_ = df
+        # Row positions may have changed
+        self.__vertex_id_index = None
+        self._update_eval_dict(self.__vertex_prop_eval_dict, df, self.vertex_col_name)
+
+    def __consolidate_edge_data(self):
+        """
+        Concatenate the edge data segments to the stored edge property
+        DataFrame, then update the edge eval dict. This is only done before the
+        stored DataFrame is modified in place.
+        """
+        if not self.__edge_prop_segments:
+            return
+        df = self.__edge_prop_dataframe
+        self.__edge_prop_segments = []
+        self.__edge_prop_dataframe_ = df
+        # Row positions may have changed
+        self.__edge_id_index = None
+        self._update_eval_dict(self.__edge_prop_eval_dict, df, self.edge_id_col_name)
+
+    def __get_selected_vertex_dataframe(self, selection):
+        """
+        Return the rows of the vertex property DataFrame in selection, or None
+        if selection does not select vertices.
+        """
+        # NOTE: the expressions passed in to extract specific edges and
+        # vertices assume the original dtypes in the user input have been
+        # preserved. However, merge operations on the DataFrames can change
+        # dtypes (eg. int64 to float64 in order to add NaN entries). This
+        # should not be a problem since the conversions do not change the
+        # values.
+        if selection is not None and selection.vertex_selections is not None:
+            return self.__vertex_prop_dataframe[selection.vertex_selections]
+        return None
+
+    def __get_selected_edges(self, edge_prop_df, selection, selected_vertex_dataframe):
+        """
+        Return the rows of edge_prop_df, which is all or part of the edge
+        property DataFrame, that are in selection and that connect selected
+        vertices (if any).
+        """
+        if selection is not None and selection.edge_selections is not None:
+            edge_prop_df = edge_prop_df[selection.edge_selections]
+
+        # FIXME: check that self.__edge_prop_dataframe is set!
+
+        # If vertices were specified, select only the edges that contain the
+        # selected verts in both src and dst
+        if (
+            selected_vertex_dataframe is not None
+            and not selected_vertex_dataframe.empty
+        ):
+            has_srcs = edge_prop_df[self.src_col_name].isin(
+                selected_vertex_dataframe.index
+            )
+            has_dsts = edge_prop_df[self.dst_col_name].isin(
+                selected_vertex_dataframe.index
+            )
+            edge_prop_df = edge_prop_df[has_srcs & has_dsts]
+            # Alternative to benchmark
+            # edge_prop_df = edge_prop_df.merge(
+            #     selected_vertex_dataframe[[]],
+            #     left_on=self.src_col_name,
+            #     right_index=True,
+            # ).merge(
+            #     selected_vertex_dataframe[[]],
+            #     left_on=self.dst_col_name,
+            #     right_index=True,
+            # )
+        return edge_prop_df
+
+    def __get_edges_after(self, num_edges):
+        """
+        Return the rows of the edge property DataFrame after the first
+        num_edges rows, only concatenating the rows after them.
+        """
+        parts = []
+        for df in self.__get_edge_prop_dataframes():
+            parts.append(df.iloc[num_edges:])
+            num_edges = max(num_edges - len(df), 0)
+        if len(parts) == 1:
+            return parts[0]
+        return self.__concat_segments(
+            parts[0],
+            [(None, part) for part in parts[1:]],
+            self.__edge_prop_dtypes,
+        )
+
+    def __extract_graph(
+        self,
+        create_using,
+        selection,
+        *,
+        edge_weight_property,
+        default_edge_weight,
+        check_multi_edges,
+        renumber_graph,
+        add_edge_data,
+    ):
+        """
+        Return a cugraph Graph for extract_subgraph().
+
+        Extracted graphs are cached. If the data has not changed since a graph
+        was extracted using the same arguments (and the same selection
+        instance), the cached graph is returned. If edges with automatically
+        generated IDs were added, and the selection does not select edges, a
+        new graph is created from the cached edges and only the new edges.
+        """
+        if isinstance(create_using, cugraph.Graph):
+            graph_kind = (type(create_using), create_using.is_directed())
+        else:
+            graph_kind = create_using
+        key = (
+            graph_kind,
+            id(selection),
+            edge_weight_property,
+            default_edge_weight,
+            check_multi_edges,
+            renumber_graph,
+            add_edge_data,
+        )
+        num_edges = self.get_num_edges()
+        # Remove the graph from the cache to re-insert it as the most recent
+        cached = self.__extracted_graphs.pop(key, None)
+        if cached is not None and (
+            cached.selection is not selection
+            or cached.vertex_data_version != self.__vertex_data_version
+            or cached.edge_data_version != self.__edge_data_version
+        ):
+            cached = None
+        if cached is not None and cached.num_edges == num_edges:
+            self.__extracted_graphs[key] = cached
+            return cached.graph
+        if cached is not None and (
+            selection is None or selection.edge_selections is None
+        ):
+            # Only edges were added, and they are after the cached edges
+            edge_prop_df = self.__get_edges_after(cached.num_edges)
+            cached_edge_prop_df = cached.edge_prop_df
+        else:
+            edge_prop_df = self.__edge_prop_dataframe
+            cached_edge_prop_df = None
+
+        edges = self.__get_selected_edges(
+            edge_prop_df,
+            selection,
+            self.__get_selected_vertex_dataframe(selection),
+        )
+        # The __*_prop_dataframes have likely been merged several times and
+        # possibly had their dtypes converted in order to accommodate NaN
+        # values. Restore the original dtypes in the resulting edges df prior
+        # to creating a Graph.
+        edges = self.__update_dataframe_dtypes(edges, self.__edge_prop_dtypes)
+        edges, edge_attr = self.__get_graph_edges(
+            edges, edge_weight_property, default_edge_weight
+        )
+        if cached_edge_prop_df is not None:
+            edges = self.__concat_segments(
+                cached_edge_prop_df, [(None, edges)], self.__edge_prop_dtypes
+            )
+        G = self.__create_graph(
+            edges,
+            edge_attr,
+            create_using,
+            check_multi_edges=check_multi_edges,
+            renumber_graph=renumber_graph,
+            add_edge_data=add_edge_data,
+        )
+        if self._max_extracted_graphs > 0:
+            while len(self.__extracted_graphs) >= self._max_extracted_graphs:
+                # Remove the least recently used graph
+                del self.__extracted_graphs[next(iter(self.__extracted_graphs))]
+            self.__extracted_graphs[key] = _ExtractedGraph(
+                selection=selection,
+                vertex_data_version=self.__vertex_data_version,
+                edge_data_version=self.__edge_data_version,
+                num_edges=num_edges,
+                edge_prop_df=edges,
+                edge_attr=edge_attr,
+                graph=G,
+            )
+        return G
+
+    def __get_graph_edges(
+        self, edge_prop_df, edge_weight_property, default_edge_weight
+    ):
+        """
+        Return a copy of edge_prop_df prepared for creating a Graph, and the
+        name of its edge weight column (or None).
+        """
+        # Don't mutate input data, and ensure DataFrame is not a view
+        edge_prop_df = edge_prop_df.copy()
+        # FIXME: check default_edge_weight is valid
+        if edge_weight_property:
+            if (
+                edge_weight_property not in edge_prop_df.columns
+                and edge_prop_df.index.name != edge_weight_property
+            ):
+                raise ValueError(
+                    "edge_weight_property "
+                    f'"{edge_weight_property}" was not found in '
+                    "edge_prop_df"
+                )
+
+            # Ensure a valid edge_weight_property can be used for applying
+            # weights to the subgraph, and if a default_edge_weight was
+            # specified, apply it to all NAs in the weight column.
+            # Also allow the type column to be specified as the edge weight
+            # property so that uniform_neighbor_sample can be called with
+            # the weights interpreted as types.
+            if edge_weight_property == self.type_col_name:
+                prop_col = edge_prop_df[self.type_col_name].cat.codes.astype("float32")
+                edge_prop_df["_temp_type_col"] = prop_col
+                edge_weight_property = "_temp_type_col"
+            elif edge_weight_property in edge_prop_df.columns:
+                prop_col = edge_prop_df[edge_weight_property]
+            else:
+                prop_col = edge_prop_df.index.to_series()
+            if prop_col.count() != prop_col.size:
+                if default_edge_weight is None:
+                    raise ValueError(
+                        f'edge_weight_property "{edge_weight_property}" '
+                        "contains NA values in the subgraph and "
+                        "default_edge_weight is not set"
+                    )
+                prop_col = prop_col.fillna(default_edge_weight)
+                if edge_weight_property in edge_prop_df.columns:
+                    edge_prop_df[edge_weight_property] = prop_col
+                else:
+                    edge_prop_df.index = prop_col
+            edge_attr = edge_weight_property
+
+        # If a default_edge_weight was specified but an edge_weight_property
+        # was not, a new edge weight column must be added.
+        elif default_edge_weight:
+            edge_attr = self.weight_col_name
+            edge_prop_df[edge_attr] = default_edge_weight
+        else:
+            edge_attr = None
+        return edge_prop_df, edge_attr
+
+    def __create_graph(
+        self,
+        edge_prop_df,
+        edge_attr,
+        create_using,
+        *,
+        check_multi_edges,
+        renumber_graph,
+        add_edge_data,
+    ):
+        """
+        Create a Graph of type create_using from the edges in edge_prop_df,
+        which was returned by __get_graph_edges().
+        """
+        # Set up the new Graph to return
+        if isinstance(create_using, cugraph.Graph):
+            # FIXME: extract more attrs from the create_using instance
+            attrs = {"directed": create_using.is_directed()}
+            G = type(create_using)(**attrs)
+        elif type(create_using) is type and issubclass(create_using, cugraph.Graph):
+            G = create_using()
+        else:
+            raise TypeError(
+                "create_using must be a cugraph.Graph "
+                "(or subclass) type or instance, got: "
+                f"{type(create_using)}"
+            )
+
+        # Prevent duplicate edges (if not allowed) since applying them to
+        # non-MultiGraphs would result in ambiguous edge properties.
+        if (
+            check_multi_edges
+            and not G.is_multigraph()
+            and self.is_multigraph(edge_prop_df)
+        ):
+            if create_using:
+                if type(create_using) is type:
+                    t = create_using.__name__
+                else:
+                    t = type(create_using).__name__
+                msg = f"'{t}' graph type specified by create_using"
+            else:
+                msg = "default Graph graph type"
+            raise RuntimeError(
+                "query resulted in duplicate edges which "
+                f"cannot be represented with the {msg}"
+            )
+
+        create_args = {
+            "source": self.src_col_name,
+            "destination": self.dst_col_name,
+            "edge_attr": edge_attr,
+            "renumber": renumber_graph,
+        }
+        if type(edge_prop_df) is cudf.DataFrame:
+            G.from_cudf_edgelist(edge_prop_df.reset_index(), **create_args)
+        else:
+            G.from_pandas_edgelist(edge_prop_df.reset_index(), **create_args)
+
+        if add_edge_data:
+            # Set the edge_data on the resulting Graph to a DataFrame
+            # containing the edges and the edge ID for each. Edge IDs are
+            # needed for future calls to annotate_dataframe() in order to
+            # associate edges with their properties, since the PG can contain
+            # multiple edges between vertrices with different properties.
+            # FIXME: also add vertex_data
+            G.edge_data = self.__create_property_lookup_table(edge_prop_df)
+
+        return G
+
+    @staticmethod
+    def __get_id_index(dfs, id_index, data_version):
+        """
+        Return an _IdIndex of the IDs (the index) of dfs, which are the stored
+        vertex or edge property DataFrame and its segments taken in order,
+        reusing id_index if it is for the same data. Since edges with
+        automatically generated IDs are added after the existing edges without
+        changing data_version, their IDs are added to id_index instead of
+        sorting all of the IDs again. Returns None if the IDs are not integers.
+        """
+        for df in dfs:
+            index_dtype = df.index.dtype
+            if not isinstance(index_dtype, np.dtype) or index_dtype.kind not in "iu":
+                return None
+
+        def get_ids(start):
+            # The IDs of the rows starting at row position start
+            ids = []
+            for df in dfs:
+                ids.append(df.index[start:].values.astype(np.int64))
+                start = max(start - len(df), 0)
+            # concatenate dispatches to cupy for cupy arrays
+            return np.concatenate(ids)
+
+        num_rows = sum(len(df) for df in dfs)
+        if (
+            id_index is not None
+            and id_index.data_version == data_version
+            and id_index.num_rows <= num_rows
+        ):
+            if id_index.num_rows == num_rows or id_index.sorted_ids is None:
+                return id_index._replace(num_rows=num_rows)
+            new_ids = get_ids(id_index.num_rows)
+            order = new_ids.argsort()
+            new_ids = new_ids[order]
+            if id_index.num_rows == 0 or new_ids[0] > id_index.sorted_ids[-1]:
+                return _IdIndex(
+                    data_version,
+                    num_rows,
+                    np.concatenate([id_index.sorted_ids, new_ids]),
+                    np.concatenate([id_index.positions, order + id_index.num_rows]),
+                )
+
+        ids = get_ids(0)
+        positions = ids.argsort()
+        sorted_ids = ids[positions]
+        if num_rows > 1 and (sorted_ids[1:] == sorted_ids[:-1]).any():
+            sorted_ids = positions = None
+        return _IdIndex(data_version, num_rows, sorted_ids, positions)
+
+    def __get_id_positions(self, ids, id_index):
+        """
+        Return the row positions of the rows with the given IDs (a list or
+        Series of integers) using id_index, or None if id_index can't be used
+        to look up all of the IDs (for example, if some are not present).
+        """
+        if (
+            id_index is None
+            or id_index.sorted_ids is None
+            or id_index.num_rows == 0
+            or not isinstance(ids, (list, tuple, self.__series_type))
+        ):
+            return None
+        ids = self.__series_type(ids)
+        if len(ids) == 0 or ids.dtype.kind not in "iu":
+            return None
+        ids = ids.values.astype(np.int64)
+        sorted_ids = id_index.sorted_ids
+        # Binary search, then check that each ID was found
+        locs = sorted_ids.searchsorted(ids).clip(0, len(sorted_ids) - 1)
+        if not (sorted_ids[locs] == ids).all():
+            return None
+        return id_index.positions[locs]
+
     def __create_property_lookup_table(self, edge_prop_df):
         """
         a DataFrame containing the src vertex, dst vertex, and edge_id
@@ -2470,16 +3179,27 @@ class EXPERIMENTAL__PropertyGraph:
         Returns a list of all Series objects that contain vertices from all
         tables.
         """
-        vpd = self.__vertex_prop_dataframe
-        epd = self.__edge_prop_dataframe
         vert_sers = []
-        if vpd is not None:
-            vert_sers.append(vpd.index.to_series())
-        if epd is not None:
-            vert_sers.append(epd[self.src_col_name])
-            vert_sers.append(epd[self.dst_col_name])
+        if self.__vertex_prop_dataframe_ is not None:
+            vert_sers.extend(
+                df.index.to_series() for df in self.__get_vertex_prop_dataframes()
+            )
+        if self.__edge_prop_dataframe_ is not None:
+            for df in self.__get_edge_prop_dataframes():
+                vert_sers.append(df[self.src_col_name])
+                vert_sers.append(df[self.dst_col_name])
         return vert_sers
 
+    def __contains_any_vertex(self, vertex_ids):
+        """
+        Returns True if any of the vertex_ids (a Series or Index) are in the
+        vertex property data.
+        """
+        return any(
+            vertex_ids.isin(df.index).any()
+            for df in self.__get_vertex_prop_dataframes()
+        )
+
     @staticmethod
     def __get_new_column_dtypes(from_df, to_df):
         """
@@ -12,6 +12,8 @@
 # limitations under the License.
 # Import FeatureStore class
 
+import os
+
 import pytest
 import numpy as np
 
@@ -75,6 +77,99 @@ def test_feature_storage_from_cudf():
     np.testing.assert_array_equal(output_fs, expected)
 
 
+@pytest.mark.sg
+def test_feature_storage_mmap_backend(tmp_path):
+    ar1 = np.random.randint(low=0, high=100, size=100_000)
+    ar2 = np.random.rand(10_000, 10).astype("float16")
+    df3 = cudf.DataFrame(ar2)
+    fs = FeatureStore(backend="mmap", mmap_dir=tmp_path)
+    fs.add_data(ar1, "type1", "feat1")
+    fs.add_data(ar2, "type2", "feat1")
+    fs.add_data(df3, "type2", "feat2")
+    assert len(list(tmp_path.iterdir())) == 3
+    assert isinstance(fs.fd["feat1"]["type1"], np.memmap)
+
+    indices_to_fetch = np.random.randint(low=0, high=len(ar1), size=1024)
+    output_fs = fs.get_data(indices_to_fetch, type_name="type1", feat_name="feat1")
+    expected = ar1[indices_to_fetch]
+    np.testing.assert_array_equal(output_fs, expected)
+
+    indices_to_fetch = np.random.randint(low=0, high=len(ar2), size=1024)
+    output_fs = fs.get_data(indices_to_fetch, type_name="type2", feat_name="feat1")
+    expected = ar2[indices_to_fetch]
+    np.testing.assert_array_equal(output_fs, expected)
+
+    output_fs = fs.get_data(indices_to_fetch, type_name="type2", feat_name="feat2")
+    np.testing.assert_array_equal(output_fs, expected)
+
+    # Names containing "." are written to separate files
+    fs.add_data(ar1[:10], "c", "a.b")
+    fs.add_data(ar1[10:20], "b.c", "a")
+    assert len(list(tmp_path.iterdir())) == 5
+    np.testing.assert_array_equal(fs.get_data(np.arange(10), "c", "a.b"), ar1[:10])
+    np.testing.assert_array_equal(fs.get_data(np.arange(10), "b.c", "a"), ar1[10:20])
+
+    # Files in a given mmap_dir are not deleted
+    fs.close()
+    assert len(list(tmp_path.iterdir())) == 5
+
+    with pytest.raises(ValueError):
+        FeatureStore(backend="numpy", mmap_dir=tmp_path)
+
+
+@pytest.mark.sg
+def test_feature_storage_mmap_add_data_again(tmp_path):
+    ar1 = np.random.rand(100_000, 4)
+    ar2 = np.random.rand(10, 4)
+    fs = FeatureStore(backend="mmap", mmap_dir=tmp_path)
+    fs.add_data(ar1, "n", "x")
+    old = fs.fd["x"]["n"]
+    view = fs.get_data(slice(None), "n", "x")
+
+    # Replacing the feature (or sharing mmap_dir) leaves old maps valid
+    fs.add_data(ar2, "n", "x")
+    FeatureStore(backend="mmap", mmap_dir=tmp_path).add_data(ar2, "n", "x")
+    np.testing.assert_array_equal(old[90_000], ar1[90_000])
+    np.testing.assert_array_equal(view[-1], ar1[-1])
+    np.testing.assert_array_equal(fs.get_data(np.arange(10), "n", "x"), ar2)
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+@pytest.mark.sg
+@pytest.mark.parametrize("backend", ["numpy", "mmap"])
+def test_feature_storage_get_multi_data(backend):
+    ar1 = np.random.randint(low=0, high=100, size=10_000)
+    ar2 = np.random.rand(10_000).astype("float32")
+    ar3 = np.random.rand(10_000, 10)
+    ar4 = np.random.rand(10_000, 10)
+    fs = FeatureStore(backend=backend)
+    fs.add_data(ar1, "type1", "feat1")
+    fs.add_data(ar2, "type1", "feat2")
+    fs.add_data(ar3, "type1", "feat3")
+    fs.add_data(ar4, "type1", "feat4")
+
+    indices_to_fetch = np.random.randint(low=0, high=len(ar1), size=1024)
+    output_fs = fs.get_multi_data(indices_to_fetch, "type1", ["feat1", "feat2"])
+    expected = np.stack([ar1[indices_to_fetch], ar2[indices_to_fetch]])
+    assert output_fs.dtype == expected.dtype
+    np.testing.assert_array_equal(output_fs, expected)
+
+    output_fs = fs.get_multi_data(indices_to_fetch, "type1", ["feat3", "feat4"])
+    expected = np.concatenate([ar3[indices_to_fetch], ar4[indices_to_fetch]])
+    np.testing.assert_array_equal(output_fs, expected)
+
+    with pytest.raises(ValueError):
+        fs.get_multi_data(indices_to_fetch, "type1", ["feat1", "feat3"])
+    with pytest.raises(IndexError):
+        fs.get_multi_data(np.array([len(ar1)]), "type1", ["feat1", "feat2"])
+
+    mmap_dir = fs.mmap_dir
+    fs.close()
+    if mmap_dir is not None:
+        # The temporary directory is deleted
+        assert not os.path.exists(mmap_dir)
+
+
 @pytest.mark.sg
 def test_feature_storage_pytorch_backend():
     try:
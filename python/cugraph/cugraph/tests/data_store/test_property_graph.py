@@ -1083,6 +1083,212 @@ def test_add_edge_data_with_ids(df_type, set_index):
         )
 
 
+@pytest.mark.sg
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_add_edge_data_many_batches(df_type):
+    """
+    add_edge_data() called many times with automatically generated edge IDs
+    gives the same result as adding all the edges at once.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    transactions = dataset1["transactions"]
+    transactions_df = df_type(columns=transactions[0], data=transactions[1])
+    relationships = dataset1["relationships"]
+    relationships_df = df_type(columns=relationships[0], data=relationships[1])
+
+    pG = PropertyGraph()
+    expected_pG = PropertyGraph()
+    expected_pG.add_edge_data(
+        transactions_df,
+        type_name="transactions",
+        vertex_col_names=("user_id", "merchant_id"),
+    )
+    for i in range(len(transactions_df)):
+        pG.add_edge_data(
+            transactions_df.iloc[i : i + 1],
+            type_name="transactions",
+            vertex_col_names=("user_id", "merchant_id"),
+        )
+    # Edge data is usable while more batches are added
+    assert pG.get_num_edges() == len(transactions_df)
+    expected_pG.add_edge_data(
+        relationships_df,
+        type_name="relationships",
+        vertex_col_names=("user_id_1", "user_id_2"),
+    )
+    for i in range(len(relationships_df)):
+        pG.add_edge_data(
+            relationships_df.iloc[i : i + 1],
+            type_name="relationships",
+            vertex_col_names=("user_id_1", "user_id_2"),
+        )
+
+    assert pG.get_num_edges() == expected_pG.get_num_edges()
+    assert pG.edge_types == expected_pG.edge_types
+    assert sorted(pG.edge_property_names) == sorted(expected_pG.edge_property_names)
+    assert type_is_categorical(pG)
+    expected = expected_pG.get_edge_data()
+    actual = pG.get_edge_data()[expected.columns]
+    if df_type is cudf.DataFrame:
+        actual = actual.to_pandas()
+        expected = expected.to_pandas()
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+    selection = pG.select_edges("_TYPE_ == 'relationships'")
+    expected_selection = expected_pG.select_edges("_TYPE_ == 'relationships'")
+    assert (
+        selection.edge_selections.values.tolist()
+        == expected_selection.edge_selections.values.tolist()
+    )
+
+
+@pytest.mark.sg
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_get_data_from_segments(df_type):
+    """
+    Reading the data of specific types, IDs, or columns of a PropertyGraph
+    that was added in several batches gives the same result as reading all of
+    the data, and reading all of the data does not store the combined data.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    pG = PropertyGraph()
+    for name, vertex_col_name in [
+        ("merchants", "merchant_id"),
+        ("users", "user_id"),
+    ]:
+        columns, data = dataset1[name]
+        pG.add_vertex_data(
+            df_type(columns=columns, data=data),
+            type_name=name,
+            vertex_col_name=vertex_col_name,
+        )
+    for name, vertex_col_names in [
+        ("transactions", ("user_id", "merchant_id")),
+        ("relationships", ("user_id_1", "user_id_2")),
+    ]:
+        columns, data = dataset1[name]
+        pG.add_edge_data(
+            df_type(columns=columns, data=data),
+            type_name=name,
+            vertex_col_names=vertex_col_names,
+        )
+
+    vertex_df = pG.get_vertex_data()
+    edge_df = pG.get_edge_data()
+    # The combined DataFrames are built for each read instead of being stored
+    assert pG._vertex_prop_dataframe is not pG._vertex_prop_dataframe
+    assert pG._edge_prop_dataframe is not pG._edge_prop_dataframe
+
+    def assert_data_equal(actual, expected):
+        if df_type is cudf.DataFrame:
+            actual = actual.to_pandas()
+            expected = expected.to_pandas()
+        pd.testing.assert_frame_equal(
+            actual.sort_values(by=actual.columns[0], ignore_index=True),
+            expected.sort_values(by=expected.columns[0], ignore_index=True),
+        )
+
+    TCN = pG.type_col_name
+    for types in [["users"], ["merchants", "users"], ["unknown"]]:
+        assert_data_equal(
+            pG.get_vertex_data(types=types),
+            vertex_df[vertex_df[TCN].isin(types)],
+        )
+    for types in [["transactions"], ["relationships"]]:
+        assert_data_equal(
+            pG.get_edge_data(types=types),
+            edge_df[edge_df[TCN].isin(types)],
+        )
+
+    # Rows are returned in the order of the IDs
+    vertex_ids = vertex_df[pG.vertex_col_name].iloc[[7, 0, 3]]
+    actual = pG.get_vertex_data(vertex_ids=vertex_ids)
+    assert actual[pG.vertex_col_name].values.tolist() == vertex_ids.values.tolist()
+    assert_data_equal(actual, vertex_df.iloc[[7, 0, 3]])
+    edge_ids = edge_df[pG.edge_id_col_name].iloc[[5, 1]]
+    actual = pG.get_edge_data(edge_ids=edge_ids)
+    assert actual[pG.edge_id_col_name].values.tolist() == edge_ids.values.tolist()
+    assert_data_equal(actual, edge_df.iloc[[5, 1]])
+
+    assert pG.get_num_vertices() == 9
+    assert pG.get_num_vertices("users") == 4
+    assert pG.get_num_edges("relationships") == 4
+    assert sorted(pG.vertex_property_names) == sorted(
+        set(vertex_df.columns) - {pG.vertex_col_name, TCN}
+    )
+    expr = "(_TYPE_ == 'relationships') & (relationship_type == 9)"
+    expected = (edge_df[TCN] == "relationships") & (edge_df["relationship_type"] == 9)
+    assert (
+        pG.select_edges(expr).edge_selections.values.tolist()
+        == expected.fillna(False).values.tolist()
+    )
+
+    # Adding data for existing vertices joins it to the combined data
+    columns, data = dataset1["taxpayers"]
+    pG.add_vertex_data(
+        df_type(columns=columns, data=data),
+        type_name="taxpayers",
+        vertex_col_name="payer_id",
+    )
+    vertex_df = pG.get_vertex_data()
+    assert pG._vertex_prop_dataframe is pG._vertex_prop_dataframe
+    assert_data_equal(
+        pG.get_vertex_data(types="users"), vertex_df[vertex_df[TCN] == "users"]
+    )
+
+
+@pytest.mark.sg
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_get_data_by_ids_after_adding_data(df_type):
+    """
+    get_vertex_data() and get_edge_data() with lists of IDs return the rows in
+    the order of the IDs given, including after more data has been added.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    pG = PropertyGraph()
+    pG.add_vertex_data(
+        df_type({"vid": [30, 10, 20], "x": [3, 1, 2]}),
+        type_name="a",
+        vertex_col_name="vid",
+    )
+    pG.add_edge_data(
+        df_type({"src": [10, 20, 30], "dst": [20, 30, 10], "w": [1, 2, 3]}),
+        type_name="e",
+        vertex_col_names=("src", "dst"),
+    )
+
+    def assert_ids(df, col_name, expected):
+        if df_type is cudf.DataFrame:
+            df = df.to_pandas()
+        assert df[col_name].tolist() == expected
+
+    assert_ids(pG.get_vertex_data([20, 30]), pG.vertex_col_name, [20, 30])
+    assert_ids(pG.get_edge_data([2, 0]), "w", [3, 1])
+
+    pG.add_vertex_data(
+        df_type({"vid": [25, 5], "x": [4, 5]}),
+        type_name="b",
+        vertex_col_name="vid",
+    )
+    pG.add_edge_data(
+        df_type({"src": [5, 25], "dst": [10, 20], "w": [4, 5]}),
+        type_name="e",
+        vertex_col_names=("src", "dst"),
+    )
+    assert_ids(pG.get_vertex_data([5, 30, 25]), "x", [5, 3, 4])
+    assert_ids(pG.get_edge_data([4, 1, 3]), "w", [5, 2, 4])
+    assert_ids(pG.get_edge_data(4), "w", [5])
+
+    # Missing IDs raise an error, as they did before any lookups
+    with pytest.raises(KeyError):
+        pG.get_vertex_data([5, 6])
+    with pytest.raises(KeyError):
+        pG.get_edge_data([0, 99])
+
+
 @pytest.mark.sg
 def test_add_edge_data_bad_args():
     """
@@ -1366,6 +1572,42 @@ def test_select_vertices_from_previous_selection(dataset1_PropertyGraph, as_pg_f
     assert_frame_equal(expected_edgelist, actual_edgelist, check_like=True)
 
 
+@pytest.mark.sg
+def test_select_by_type(dataset1_PropertyGraph):
+    """
+    Ensures selections that include a term for a single type only select
+    matching rows of that type, and that repeated selections are reused.
+    """
+    from cugraph.experimental import PropertyGraph
+    from cugraph.structure.property_graph import _compile_selection_expression
+
+    (pG, data) = dataset1_PropertyGraph
+    tcn = PropertyGraph.type_col_name
+
+    def get_selected(selections):
+        if isinstance(selections, cudf.Series):
+            selections = selections.to_pandas()
+        return sorted(selections[selections.fillna(False)].index.tolist())
+
+    _compile_selection_expression.cache_clear()
+    for _ in range(2):
+        selection = pG.select_edges(f"({tcn} == 'transactions') & (volume > 50)")
+        assert get_selected(selection.edge_selections) == [2, 3]
+        selection = pG.select_edges(f"(volume < 50) & ('transactions' == {tcn})")
+        assert get_selected(selection.edge_selections) == [0]
+        selection = pG.select_vertices(f"({tcn} == 'users') & (vertical == 1)")
+        assert get_selected(selection.vertex_selections) == [32431, 89216]
+    assert _compile_selection_expression.cache_info().hits == 3
+
+    selection = pG.select_edges(f"({tcn} == 'unknown') & (volume > 50)")
+    assert get_selected(selection.edge_selections) == []
+    selection = pG.select_edges(f"({tcn} == 'relationships') | (volume > 50)")
+    assert get_selected(selection.edge_selections) == [2, 3, 4, 5, 6, 7]
+
+    with pytest.raises(SyntaxError):
+        pG.select_edges(f"{tcn} == ")
+
+
 @pytest.mark.sg
 @pytest.mark.parametrize("as_pg_first", [False, True])
 def test_extract_subgraph_graph_without_vert_props(as_pg_first):
@@ -1538,6 +1780,54 @@ def test_extract_subgraph_bad_args(dataset1_PropertyGraph):
         pG.extract_subgraph(selection=selection, edge_weight_property="card_type")
 
 
+@pytest.mark.sg
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_extract_subgraph_reuses_graph(df_type):
+    """
+    Ensures an extracted graph is reused if the data has not changed, and is
+    updated with edges added after it was extracted.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    columns, data = dataset1["transactions"]
+    pG = PropertyGraph()
+    expected_pG = PropertyGraph()
+    for G in [pG, expected_pG]:
+        G.add_edge_data(
+            df_type(columns=columns, data=data[:2]),
+            type_name="transactions",
+            vertex_col_names=("user_id", "merchant_id"),
+        )
+    kwargs = {"edge_weight_property": "volume", "default_edge_weight": 0.0}
+    G = pG.extract_subgraph(**kwargs)
+    assert pG.extract_subgraph(**kwargs) is G
+    assert pG.extract_subgraph() is not G
+
+    def assert_graphs_equal(G, expected_G):
+        actual = G.edge_data
+        expected = expected_G.edge_data
+        if df_type is cudf.DataFrame:
+            actual = actual.to_pandas()
+            expected = expected.to_pandas()
+        pd.testing.assert_frame_equal(actual, expected)
+        assert G.number_of_edges() == expected_G.number_of_edges()
+
+    # New edges are added to the graph extracted with the same arguments
+    for G in [pG, expected_pG]:
+        G.add_edge_data(
+            df_type(columns=columns, data=data[2:]),
+            type_name="transactions",
+            vertex_col_names=("user_id", "merchant_id"),
+        )
+    G = pG.extract_subgraph(**kwargs)
+    assert_graphs_equal(G, expected_pG.extract_subgraph(**kwargs))
+    assert pG.extract_subgraph(**kwargs) is G
+
+    # Changing existing edge data extracts a new graph
+    pG.fillna_edges(1.0)
+    assert pG.extract_subgraph(**kwargs) is not G
+
+
 @pytest.mark.sg
 def test_extract_subgraph_default_edge_weight(dataset1_PropertyGraph):
     """
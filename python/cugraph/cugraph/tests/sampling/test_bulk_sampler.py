@@ -70,7 +70,8 @@ def test_bulk_sampler_simple(scratch_dir):
 
 
 @pytest.mark.sg
-def test_bulk_sampler_remainder(scratch_dir):
+@pytest.mark.parametrize("pipeline_writes", [False, True])
+def test_bulk_sampler_remainder(scratch_dir, pipeline_writes):
     el = karate.get_edgelist().reset_index().rename(columns={"index": "eid"})
     el["eid"] = el["eid"].astype("int32")
     el["etp"] = cupy.int32(0)
@@ -92,6 +93,7 @@ def test_bulk_sampler_remainder(scratch_dir):
         graph=G,
         seeds_per_call=7,
         batches_per_partition=2,
+        pipeline_writes=pipeline_writes,
         fanout_vals=[2, 2],
         with_replacement=False,
     )
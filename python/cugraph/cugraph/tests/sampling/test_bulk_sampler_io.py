@@ -17,7 +17,8 @@ import shutil
 import pytest
 
 import cudf
-from cugraph.gnn.data_loading.bulk_sampler_io import write_samples
+import pyarrow.parquet as pq
+from cugraph.gnn.data_loading.bulk_sampler_io import write_samples, read_batch_index
 from cugraph.utilities.utils import create_directory_with_overwrite
 
 
@@ -77,6 +78,55 @@ def test_bulk_sampler_io(scratch_dir):
     shutil.rmtree(samples_path)
 
 
+@pytest.mark.sg
+def test_bulk_sampler_io_index(scratch_dir):
+    results = cudf.DataFrame(
+        {
+            "sources": [0, 0, 1, 2, 2, 2, 3, 4, 5, 5, 6, 7],
+            "destinations": [1, 2, 3, 3, 3, 4, 1, 1, 6, 7, 2, 3],
+            "edge_id": None,
+            "edge_type": None,
+            "weight": None,
+            "hop_id": [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1],
+        }
+    )
+
+    offsets = cudf.DataFrame({"offsets": [0, 8, 10], "batch_id": [0, 1, 2]})
+
+    samples_path = os.path.join(scratch_dir, "test_bulk_sampler_io_index")
+    create_directory_with_overwrite(samples_path)
+
+    write_samples(results, offsets, None, 3, samples_path, write_index=True)
+
+    assert sorted(os.listdir(samples_path)) == [
+        "batch=0-2.index.json",
+        "batch=0-2.parquet",
+    ]
+
+    parquet_path = os.path.join(samples_path, "batch=0-2.parquet")
+    batch_index = read_batch_index(parquet_path)
+    assert batch_index["batch_offsets"] == [0, 8, 10, 12]
+    assert batch_index["renumber_map_offsets"] is None
+    assert "map" not in batch_index["columns"]
+
+    df = cudf.read_parquet(parquet_path)
+    assert df.columns.tolist() == batch_index["columns"]
+
+    metadata = pq.read_metadata(parquet_path)
+    row_group_offsets = batch_index["row_group_offsets"]
+    assert len(row_group_offsets) == metadata.num_row_groups + 1
+    assert row_group_offsets[0] == 0
+    assert row_group_offsets[-1] == len(df)
+    for i in range(metadata.num_row_groups):
+        num_rows = row_group_offsets[i + 1] - row_group_offsets[i]
+        assert num_rows == metadata.row_group(i).num_rows
+    for batch_id in range(3):
+        start, end = batch_index["batch_offsets"][batch_id : batch_id + 2]
+        assert (df.batch_id.iloc[start:end] == batch_id).all()
+
+    shutil.rmtree(samples_path)
+
+
 @pytest.mark.sg
 def test_bulk_sampler_io_empty_batch(scratch_dir):
     sources_array = [
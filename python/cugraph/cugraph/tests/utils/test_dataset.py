@@ -288,6 +288,68 @@ def test_unload():
     assert ds._edgelist is None
 
 
+def test_edgelist_cache(tmpdir):
+    karate_csv = Path(tmpdir.name) / "karate_copy.csv"
+    karate_csv.write_bytes((RAPIDS_DATASET_ROOT_DIR_PATH / "karate.csv").read_bytes())
+    ds = datasets.Dataset(
+        csv_file=karate_csv,
+        csv_col_names=["src", "dst", "wgt"],
+        csv_col_dtypes=["int32", "int32", "float32"],
+    )
+    cache_path = ds.get_cache_path()
+    assert cache_path.parent == datasets.get_download_dir() / "cache"
+    if cache_path.exists():
+        cache_path.unlink()
+
+    expected = ds.get_edgelist(use_cache=False)
+    assert not cache_path.exists()
+    ds.unload()
+    el = ds.get_edgelist()
+    assert cache_path.is_file()
+    cudf.testing.assert_frame_equal(el, expected)
+
+    # A second load reads the cache
+    ds.unload()
+    el = ds.get_edgelist()
+    assert list(el.dtypes.astype(str)) == ["int32", "int32", "float32"]
+    cudf.testing.assert_frame_equal(el, expected)
+
+    # Changing the datafile makes the cache stale
+    with open(karate_csv, "a") as f:
+        f.write("100 101 1.0\n")
+    ds.unload()
+    el = ds.get_edgelist()
+    assert len(el) == len(expected) + 1
+    ds.unload()
+    assert len(ds.get_edgelist()) == len(expected) + 1
+
+    # The cache is not used with different parse settings
+    ds = datasets.Dataset(
+        csv_file=karate_csv,
+        csv_col_names=["src", "dst", "wgt"],
+        csv_col_dtypes=["int32", "int32", "float32"],
+        csv_header=0,
+    )
+    assert ds.get_cache_path() == cache_path
+    assert len(ds.get_edgelist()) == len(expected)
+
+
+@pytest.mark.parametrize("chunk_size", [100, 1000, 2**28])
+def test_get_edgelist_chunks(chunk_size):
+    email_csv = RAPIDS_DATASET_ROOT_DIR_PATH / "email-Eu-core.csv"
+    ds = datasets.Dataset(
+        csv_file=email_csv,
+        csv_col_names=["src", "dst", "wgt"],
+        csv_col_dtypes=["int32", "int32", "float32"],
+    )
+    expected = ds.get_edgelist(use_cache=False)
+    chunks = list(ds.get_edgelist_chunks(chunk_size=chunk_size))
+    if chunk_size < email_csv.stat().st_size:
+        assert len(chunks) > 1
+    el = cudf.concat(chunks, ignore_index=True)
+    cudf.testing.assert_frame_equal(el, expected)
+
+
 @pytest.mark.parametrize("dataset", ALL_DATASETS)
 def test_node_and_edge_count(dataset):
     dataset_is_directed = dataset.metadata["is_directed"]
@@ -51,6 +51,11 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None, seed=No
         raise NotImplementedError(
             "Weighted implementation of betweenness centrality not currently supported"
         )
+    if G.is_multigraph():
+        # NetworkX splits the betweenness of parallel edges by edge key
+        raise NotImplementedError(
+            "edge_betweenness_centrality for multigraphs is not currently supported"
+        )
     G = _to_graph(G, weight)
     src_ids, dst_ids, values, _edge_ids = plc.edge_betweenness_centrality(
         resource_handle=plc.ResourceHandle(),
@@ -70,4 +75,4 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None, seed=No
 
 @edge_betweenness_centrality._can_run
 def _(G, k=None, normalized=True, weight=None, seed=None):
-    return weight is None
+    return weight is None and not G.is_multigraph()
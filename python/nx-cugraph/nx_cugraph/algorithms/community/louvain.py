@@ -12,6 +12,7 @@
 # limitations under the License.
 import sys
 
+import numpy as np
 import pylibcugraph as plc
 
 from nx_cugraph.convert import _to_undirected_graph
@@ -42,9 +43,14 @@ def louvain_communities(
         return [{key} for key in G._nodeiter_to_iter(range(len(G)))]
     if max_level is None:
         max_level = sys.maxsize
+    if G.is_multigraph():
+        # NetworkX sums the weights of parallel edges, which default to 1
+        plc_graph = G._get_plc_graph(weight, 1, np.float32)
+    else:
+        plc_graph = G._get_plc_graph()
     vertices, clusters, modularity = plc.louvain(
         resource_handle=plc.ResourceHandle(),
-        graph=G._get_plc_graph(),
+        graph=plc_graph,
         max_level=max_level,  # TODO: add this parameter to NetworkX
         resolution=resolution,
         # threshold=threshold,  # TODO: add this parameter to PLC
@@ -13,3 +13,5 @@
 from .graph import Graph
 
 from .digraph import DiGraph  # isort:skip
+from .multigraph import MultiGraph  # isort:skip
+from .multidigraph import MultiDiGraph  # isort:skip
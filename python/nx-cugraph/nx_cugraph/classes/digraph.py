@@ -46,9 +46,9 @@ class DiGraph(Graph):
     def number_of_edges(
         self, u: NodeKey | None = None, v: NodeKey | None = None
     ) -> int:
-        if u is not None or v is not None:
-            raise NotImplementedError
-        return self.row_indices.size
+        if u is None:
+            return self.row_indices.size
+        return super().number_of_edges(u, v)
 
     ##########################
     # NetworkX graph methods #
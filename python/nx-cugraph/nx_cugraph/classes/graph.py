@@ -12,8 +12,11 @@
 # limitations under the License.
 from __future__ import annotations
 
+import json
 import operator as op
 from copy import deepcopy
+from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 import cupy as cp
@@ -22,9 +25,11 @@ import numpy as np
 import pylibcugraph as plc
 
 import nx_cugraph as nxcg
+from nx_cugraph.utils import _LazyDict
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    import os
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     from nx_cugraph.typing import (
         AttrKey,
@@ -40,6 +45,9 @@ __all__ = ["Graph"]
 
 networkx_api = nxcg.utils.decorators.networkx_class(nx.Graph)
 
+# Version of the directory layout written by `Graph.save`
+_FILE_FORMAT_VERSION = 1
+
 
 class Graph:
     # Tell networkx to dispatch calls with this object to nx-cugraph
@@ -60,6 +68,13 @@ class Graph:
     key_to_id: dict[NodeKey, IndexValue] | None
     _id_to_key: dict[IndexValue, NodeKey] | None
     _N: int
+    # CSR and CSC forms are computed when first needed (such as to look up edges)
+    # as `(indptr, indices, perm)`, where `perm` maps positions in the compressed
+    # form to positions in the COO arrays, or is None if they are in CSR/CSC order.
+    _csr: tuple[cp.ndarray[IndexValue], cp.ndarray[IndexValue], cp.ndarray | None]
+    _csc: tuple[cp.ndarray[IndexValue], cp.ndarray[IndexValue], cp.ndarray | None]
+    # pylibcugraph graphs built by `_get_plc_graph` are reused by later calls
+    _plc_graphs: dict[tuple, plc.SGGraph]
 
     ####################
     # Creation methods #
@@ -83,27 +98,31 @@ class Graph:
         new_graph = object.__new__(cls)
         new_graph.row_indices = row_indices
         new_graph.col_indices = col_indices
-        new_graph.edge_values = {} if edge_values is None else dict(edge_values)
-        new_graph.edge_masks = {} if edge_masks is None else dict(edge_masks)
-        new_graph.node_values = {} if node_values is None else dict(node_values)
-        new_graph.node_masks = {} if node_masks is None else dict(node_masks)
+        new_graph.edge_values = _copy_datadict(edge_values)
+        new_graph.edge_masks = _copy_datadict(edge_masks)
+        new_graph.node_values = _copy_datadict(node_values)
+        new_graph.node_masks = _copy_datadict(node_masks)
         new_graph.key_to_id = None if key_to_id is None else dict(key_to_id)
         new_graph._id_to_key = None if id_to_key is None else dict(id_to_key)
         new_graph._N = op.index(N)  # Ensure N is integral
+        new_graph._csr = None
+        new_graph._csc = None
+        new_graph._plc_graphs = {}
         new_graph.graph = new_graph.graph_attr_dict_factory()
         new_graph.graph.update(attr)
         size = new_graph.row_indices.size
         # Easy and fast sanity checks
         if size != new_graph.col_indices.size:
             raise ValueError
+        # Values that have not been loaded yet (see `_LazyDict`) are not checked
         for attr in ["edge_values", "edge_masks"]:
             if datadict := getattr(new_graph, attr):
-                for key, val in datadict.items():
+                for key, val in _iter_loaded_items(datadict):
                     if val.shape[0] != size:
                         raise ValueError(key)
         for attr in ["node_values", "node_masks"]:
             if datadict := getattr(new_graph, attr):
-                for key, val in datadict.items():
+                for key, val in _iter_loaded_items(datadict):
                     if val.shape[0] != N:
                         raise ValueError(key)
         if new_graph.key_to_id is not None and len(new_graph.key_to_id) != N:
@@ -131,7 +150,7 @@ class Graph:
             # cp.repeat is slow to use here, so use numpy instead
             np.repeat(np.arange(N, dtype=np.int32), cp.diff(indptr).get())
         )
-        return cls.from_coo(
+        new_graph = cls.from_coo(
             N,
             row_indices,
             col_indices,
@@ -143,6 +162,9 @@ class Graph:
             id_to_key=id_to_key,
             **attr,
         )
+        # Keep the compressed form to look up edges
+        new_graph._csr = _compress_edges(row_indices, col_indices, N, indptr)
+        return new_graph
 
     @classmethod
     def from_csc(
@@ -163,7 +185,7 @@ class Graph:
             # cp.repeat is slow to use here, so use numpy instead
             np.repeat(np.arange(N, dtype=np.int32), cp.diff(indptr).get())
         )
-        return cls.from_coo(
+        new_graph = cls.from_coo(
             N,
             row_indices,
             col_indices,
@@ -175,6 +197,9 @@ class Graph:
             id_to_key=id_to_key,
             **attr,
         )
+        # Keep the compressed form to look up edges
+        new_graph._csc = _compress_edges(col_indices, row_indices, N, indptr)
+        return new_graph
 
     @classmethod
     def from_dcsr(
@@ -245,9 +270,9 @@ class Graph:
     def __new__(cls, incoming_graph_data=None, **attr) -> Graph:
         if incoming_graph_data is None:
             new_graph = cls.from_coo(0, cp.empty(0, np.int32), cp.empty(0, np.int32))
-        elif incoming_graph_data.__class__ is new_graph.__class__:
+        elif incoming_graph_data.__class__ is cls:
             new_graph = incoming_graph_data.copy()
-        elif incoming_graph_data.__class__ is new_graph.to_networkx_class():
+        elif incoming_graph_data.__class__ is cls.to_networkx_class():
             new_graph = nxcg.from_networkx(incoming_graph_data, preserve_all_attrs=True)
         else:
             raise NotImplementedError
@@ -347,6 +372,9 @@ class Graph:
         self._N = 0
         self.key_to_id = None
         self._id_to_key = None
+        self._csr = None
+        self._csc = None
+        self._plc_graphs.clear()
 
     @networkx_api
     def clear_edges(self) -> None:
@@ -354,6 +382,9 @@ class Graph:
         self.edge_masks.clear()
         self.row_indices = cp.empty(0, self.row_indices.dtype)
         self.col_indices = cp.empty(0, self.col_indices.dtype)
+        self._csr = None
+        self._csc = None
+        self._plc_graphs.clear()
 
     @networkx_api
     def copy(self, as_view: bool = False) -> Graph:
@@ -364,16 +395,10 @@ class Graph:
     def get_edge_data(
         self, u: NodeKey, v: NodeKey, default: EdgeValue | None = None
     ) -> dict[AttrKey, EdgeValue]:
-        if self.key_to_id is not None:
-            try:
-                u = self.key_to_id[u]
-                v = self.key_to_id[v]
-            except KeyError:
-                return default
-        index = cp.nonzero((self.row_indices == u) & (self.col_indices == v))[0]
-        if index.size == 0:
+        indices = self._get_edge_indices(u, v)
+        if not indices:
             return default
-        [index] = index.tolist()
+        [index] = indices
         if not self.edge_values:
             return {}
         return {
@@ -384,13 +409,7 @@ class Graph:
 
     @networkx_api
     def has_edge(self, u: NodeKey, v: NodeKey) -> bool:
-        if self.key_to_id is not None:
-            try:
-                u = self.key_to_id[u]
-                v = self.key_to_id[v]
-            except KeyError:
-                return False
-        return bool(((self.row_indices == u) & (self.col_indices == v)).any())
+        return bool(self._get_edge_indices(u, v))
 
     @networkx_api
     def has_node(self, n: NodeKey) -> bool:
@@ -408,9 +427,9 @@ class Graph:
     def number_of_edges(
         self, u: NodeKey | None = None, v: NodeKey | None = None
     ) -> int:
-        if u is not None or v is not None:
-            raise NotImplementedError
-        return self.size()
+        if u is None:
+            return self.size()
+        return len(self._get_edge_indices(u, v))
 
     @networkx_api
     def number_of_nodes(self) -> int:
@@ -442,12 +461,144 @@ class Graph:
     # edge_subgraph, edges, neighbors, nodes, remove_edge,
     # remove_edges_from, remove_node, remove_nodes_from, subgraph, update
 
+    ######################
+    # Saving and loading #
+    ######################
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save the graph to a directory that can be read quickly with `load`.
+
+        Each array is written to its own ``.npy`` file, and ``manifest.json``
+        describes the graph. Node keys (and edge keys of multigraphs) are saved
+        as arrays, so they must all be ints or all be strings. Attribute names
+        must be ints or strings, and ``G.graph`` must be JSON-serializable.
+
+        Parameters
+        ----------
+        path : str or path-like
+            Directory to write to; it is created if it doesn't exist.
+
+        See Also
+        --------
+        load
+        """
+        path = Path(path)
+        arrays = {
+            "row_indices": self.row_indices,
+            "col_indices": self.col_indices,
+        }
+        manifest = {
+            "format": "nx_cugraph",
+            "version": _FILE_FORMAT_VERSION,
+            "class": type(self).__name__,
+            "N": self._N,
+        }
+        try:
+            manifest["graph"] = json.loads(json.dumps(self.graph))
+        except TypeError as exc:
+            raise TypeError(
+                "Graph attributes (`G.graph`) must be JSON-serializable to save"
+            ) from exc
+        for name in ["edge_values", "edge_masks", "node_values", "node_masks"]:
+            manifest[name] = columns = []
+            for i, (attr, val) in enumerate(getattr(self, name).items()):
+                if not isinstance(attr, (int, str)):
+                    raise TypeError(
+                        f"Only int and str attribute names can be saved; got {attr!r}"
+                    )
+                columns.append([attr, f"{name}_{i}"])
+                arrays[f"{name}_{i}"] = val
+        if (id_to_key := self.id_to_key) is not None:
+            arrays["node_keys"] = _keys_to_array(
+                [id_to_key[node_id] for node_id in range(self._N)]
+            )
+        self._update_saved_arrays(arrays, manifest)
+        path.mkdir(parents=True, exist_ok=True)
+        for name, val in arrays.items():
+            np.save(path / f"{name}.npy", cp.asnumpy(val), allow_pickle=False)
+        # Write manifest last, so an incomplete save can't be loaded
+        with (path / "manifest.json").open("w") as f:
+            json.dump(manifest, f)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, *, mmap: bool = True) -> Graph:
+        """Load a graph that was saved with `save`.
+
+        Parameters
+        ----------
+        path : str or path-like
+            Directory written by `save`.
+        mmap : bool, default True
+            If True, node and edge attribute arrays are memory-mapped and only
+            copied to the GPU when first used, so attributes that are never used
+            are never read. If False, all arrays are read immediately.
+
+        Returns
+        -------
+        Graph
+            The class of the graph that was saved, which must be ``cls`` or a
+            subclass of ``cls``.
+
+        See Also
+        --------
+        save
+        """
+        path = Path(path)
+        with (path / "manifest.json").open() as f:
+            manifest = json.load(f)
+        if manifest.get("format") != "nx_cugraph":
+            raise ValueError(f"{path} is not a saved nx_cugraph graph")
+        if manifest["version"] > _FILE_FORMAT_VERSION:
+            raise ValueError(
+                f"Unable to load graph with file format version {manifest['version']}; "
+                f"the latest version supported is {_FILE_FORMAT_VERSION}"
+            )
+        klass = getattr(nxcg, manifest["class"], None)
+        if not isinstance(klass, type) or not issubclass(klass, cls):
+            raise TypeError(
+                f"Saved graph is {manifest['class']}, which is not a {cls.__name__}"
+            )
+        read = partial(_read_array, path, mmap_mode="r" if mmap else None)
+        datadicts = {}
+        for name in ["edge_values", "edge_masks", "node_values", "node_masks"]:
+            if mmap:
+                # Copy to the GPU when first used (`_LazyDict` calls the loaders)
+                datadicts[name] = _LazyDict(
+                    {
+                        attr: partial(_read_device_array, read, filename)
+                        for attr, filename in manifest[name]
+                    }
+                )
+            else:
+                datadicts[name] = {
+                    attr: cp.asarray(read(filename))
+                    for attr, filename in manifest[name]
+                }
+        try:
+            node_keys = read("node_keys").tolist()
+        except FileNotFoundError:
+            key_to_id = None
+        else:
+            key_to_id = dict(zip(node_keys, range(len(node_keys))))
+        rv = klass.from_coo(
+            manifest["N"],
+            cp.asarray(read("row_indices")),
+            cp.asarray(read("col_indices")),
+            datadicts["edge_values"],
+            datadicts["edge_masks"],
+            datadicts["node_values"],
+            datadicts["node_masks"],
+            key_to_id=key_to_id,
+            **klass._get_loaded_arrays(manifest, read),
+        )
+        rv.graph.update(manifest["graph"])
+        return rv
+
     ###################
     # Private methods #
     ###################
 
     def _copy(self, as_view: bool, cls: type[Graph], reverse: bool = False):
-        indptr = self.indptr
         row_indices = self.row_indices
         col_indices = self.col_indices
         edge_values = self.edge_values
@@ -457,7 +608,6 @@ class Graph:
         key_to_id = self.key_to_id
         id_to_key = None if key_to_id is None else self._id_to_key
         if not as_view:
-            indptr = indptr.copy()
             row_indices = row_indices.copy()
             col_indices = col_indices.copy()
             edge_values = {key: val.copy() for key, val in edge_values.items()}
@@ -468,10 +618,13 @@ class Graph:
                 key_to_id = key_to_id.copy()
                 if id_to_key is not None:
                     id_to_key = id_to_key.copy()
+        csr = self._csr
+        csc = self._csc
         if reverse:
             row_indices, col_indices = col_indices, row_indices
+            csr, csc = csc, csr
         rv = cls.from_coo(
-            indptr,
+            self._N,
             row_indices,
             col_indices,
             edge_values,
@@ -481,6 +634,14 @@ class Graph:
             key_to_id=key_to_id,
             id_to_key=id_to_key,
         )
+        # Compressed forms are never modified, so they can be shared
+        rv._csr = csr
+        rv._csc = csc
+        if as_view and not reverse and cls is type(self):
+            # Views have the same edges, so they can reuse pylibcugraph graphs.
+            # Copy the cache so that changing the edges of one does not affect
+            # the cache of the other.
+            rv._plc_graphs = dict(self._plc_graphs)
         if as_view:
             rv.graph = self.graph
         else:
@@ -495,10 +656,27 @@ class Graph:
         *,
         store_transposed: bool = False,
     ):
-        if edge_attr is None:
-            edge_array = None
-        elif edge_attr not in self.edge_values:
-            raise KeyError("Graph has no edge attribute {edge_attr!r}")
+        if edge_dtype is not None:
+            edge_dtype = np.dtype(edge_dtype)
+        cache_key = (
+            edge_attr,
+            edge_default,
+            edge_dtype,
+            self.is_directed(),
+            store_transposed,
+        )
+        if (plc_graph := self._plc_graphs.get(cache_key)) is not None:
+            return plc_graph
+        if edge_attr is None or edge_attr not in self.edge_values:
+            if edge_default is not None:
+                # Every edge has the default value
+                edge_array = cp.full(
+                    self.row_indices.size, edge_default, dtype=edge_dtype
+                )
+            elif edge_attr is None:
+                edge_array = None
+            else:
+                raise KeyError(f"Graph has no edge attribute {edge_attr!r}")
         elif edge_attr not in self.edge_masks:
             edge_array = self.edge_values[edge_attr]
         elif not self.edge_masks[edge_attr].all():
@@ -513,24 +691,90 @@ class Graph:
             # Mask is all True; don't need anymore
             del self.edge_masks[edge_attr]
             edge_array = self.edge_values[edge_attr]
-        # Should we cache PLC graph?
-        if edge_dtype is not None:
-            edge_dtype = np.dtype(edge_dtype)
-            if edge_array.dtype != edge_dtype:
-                edge_array = edge_array.astype(edge_dtype)
-        return plc.SGGraph(
+        if edge_dtype is not None and edge_array.dtype != edge_dtype:
+            edge_array = edge_array.astype(edge_dtype)
+        src_indices, dst_indices, edge_array = self._get_plc_edges(edge_array)
+        self._plc_graphs[cache_key] = plc_graph = plc.SGGraph(
             resource_handle=plc.ResourceHandle(),
             graph_properties=plc.GraphProperties(
-                is_multigraph=self.is_multigraph(),
+                # Parallel edges of multigraphs are combined by `_get_plc_edges`
+                is_multigraph=False,
                 is_symmetric=not self.is_directed(),
             ),
-            src_or_offset_array=self.row_indices,
-            dst_or_index_array=self.col_indices,
+            src_or_offset_array=src_indices,
+            dst_or_index_array=dst_indices,
             weight_array=edge_array,
             store_transposed=store_transposed,
             renumber=False,
             do_expensive_check=False,
         )
+        return plc_graph
+
+    def _get_csr(
+        self,
+    ) -> tuple[cp.ndarray[IndexValue], cp.ndarray[IndexValue], cp.ndarray | None]:
+        """Get ``(indptr, col_indices, perm)`` of the CSR form of the graph.
+
+        Column indices are sorted within each row, and ``perm`` maps positions
+        in the CSR form to positions in the COO arrays (None if the same).
+        """
+        if self._csr is None:
+            self._csr = _compress_edges(self.row_indices, self.col_indices, self._N)
+        return self._csr
+
+    def _get_csc(
+        self,
+    ) -> tuple[cp.ndarray[IndexValue], cp.ndarray[IndexValue], cp.ndarray | None]:
+        """Get ``(indptr, row_indices, perm)`` of the CSC form of the graph.
+
+        Row indices are sorted within each column, and ``perm`` maps positions
+        in the CSC form to positions in the COO arrays (None if the same).
+        """
+        if self._csc is None:
+            self._csc = _compress_edges(self.col_indices, self.row_indices, self._N)
+        return self._csc
+
+    def _get_edge_indices(self, u: NodeKey, v: NodeKey) -> list[int]:
+        """Get the positions in the COO arrays of all edges from u to v.
+
+        This uses binary search of the CSR (or CSC) form of the graph.
+        """
+        if u not in self or v not in self:
+            return []
+        if self.key_to_id is not None:
+            u = self.key_to_id[u]
+            v = self.key_to_id[v]
+        if self._csr is None and self._csc is not None:
+            # Use the compressed form we already have
+            indptr, indices, perm = self._csc
+            u, v = v, u
+        else:
+            indptr, indices, perm = self._get_csr()
+        start, stop = indptr[u : u + 2].tolist()
+        lo, hi = cp.searchsorted(
+            indices[start:stop], cp.array([v, v + 1], indices.dtype)
+        ).tolist()
+        if perm is None:
+            return list(range(start + lo, start + hi))
+        return sorted(perm[start + lo : start + hi].tolist())
+
+    def _update_saved_arrays(self, arrays: dict, manifest: dict) -> None:
+        """Add arrays and metadata of subclasses to save with `save`."""
+
+    @classmethod
+    def _get_loaded_arrays(
+        cls, manifest: dict, read: Callable[[str], np.ndarray]
+    ) -> dict:
+        """Get extra keyword arguments for `from_coo` of subclasses for `load`."""
+        return {}
+
+    def _get_plc_edges(
+        self, edge_array: cp.ndarray[EdgeValue] | None
+    ) -> tuple[
+        cp.ndarray[IndexValue], cp.ndarray[IndexValue], cp.ndarray[EdgeValue] | None
+    ]:
+        """Get the source, destination, and weight arrays to give to pylibcugraph."""
+        return self.row_indices, self.col_indices, edge_array
 
     def _nodeiter_to_iter(self, node_ids: Iterable[IndexValue]) -> Iterable[NodeKey]:
         """Convert an iterable of node IDs to an iterable of node keys."""
@@ -598,3 +842,68 @@ class Graph:
     #     if dtype is None:
     #         return cp.array(list(val_iter))
     #     return cp.fromiter(val_iter, dtype)
+
+
+def _copy_datadict(datadict: Mapping | None) -> dict | _LazyDict:
+    """Shallow copy a dict of values or masks without loading lazy values."""
+    if datadict is None:
+        return {}
+    if isinstance(datadict, _LazyDict):
+        return datadict.copy()
+    return dict(datadict)
+
+
+def _iter_loaded_items(datadict: Mapping) -> Iterable[tuple]:
+    if isinstance(datadict, _LazyDict):
+        return datadict.loaded_items()
+    return datadict.items()
+
+
+def _compress_edges(
+    major_indices: cp.ndarray[IndexValue],
+    minor_indices: cp.ndarray[IndexValue],
+    N: int,
+    indptr: cp.ndarray[IndexValue] | None = None,
+) -> tuple[cp.ndarray[IndexValue], cp.ndarray[IndexValue], cp.ndarray | None]:
+    """Compress COO indices to CSR (or CSC) with sorted minor indices.
+
+    ``indptr`` may be given if ``major_indices`` are already sorted.
+    Returns ``(indptr, minor_indices, perm)``; see `Graph._get_csr`.
+    """
+    perm = None
+    if major_indices.size > 1:
+        major_diff = major_indices[1:] - major_indices[:-1].astype(np.int64)
+        is_sorted = (major_diff > 0) | (
+            (major_diff == 0) & (minor_indices[1:] >= minor_indices[:-1])
+        )
+        if not is_sorted.all():
+            perm = cp.lexsort(cp.stack([minor_indices, major_indices]))
+            major_indices = major_indices[perm]
+            minor_indices = minor_indices[perm]
+            indptr = None
+    if indptr is None:
+        indptr = cp.searchsorted(
+            major_indices, cp.arange(N + 1, dtype=major_indices.dtype)
+        )
+    return indptr, minor_indices, perm
+
+
+def _keys_to_array(keys: list[NodeKey]) -> np.ndarray:
+    """Store node or edge keys compactly (instead of pickling) to save them."""
+    key_types = set(map(type, keys))
+    if key_types <= {int}:
+        return np.array(keys, np.int64)
+    if key_types <= {str}:
+        return np.array(keys, str)
+    raise TypeError(
+        "Only graphs whose keys are all ints or all strings can be saved; "
+        f"got keys of type {sorted(key_type.__name__ for key_type in key_types)}"
+    )
+
+
+def _read_array(path: Path, name: str, mmap_mode: str | None = None) -> np.ndarray:
+    return np.load(path / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+
+
+def _read_device_array(read: Callable[[str], np.ndarray], name: str) -> cp.ndarray:
+    return cp.asarray(read(name))
@@ -0,0 +1,240 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import cupy as cp
+import networkx as nx
+import numpy as np
+
+import nx_cugraph as nxcg
+
+from .graph import Graph, _keys_to_array
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from nx_cugraph.typing import (
+        AttrKey,
+        EdgeKey,
+        EdgeValue,
+        IndexValue,
+        NodeKey,
+        NodeValue,
+    )
+
+__all__ = ["MultiGraph"]
+
+networkx_api = nxcg.utils.decorators.networkx_class(nx.MultiGraph)
+
+
+class MultiGraph(Graph):
+    # networkx properties
+    edge_key_dict_factory: ClassVar[type] = dict
+
+    # Not networkx properties
+    # In a MultiGraph, each edge is identified by `(row, col, key)`, and `key` can
+    # be any hashable Python object in NetworkX (by default, 0, 1, 2, etc.).
+    # The common case of integer keys is stored compactly in the `edge_indices`
+    # array; otherwise, `edge_keys` is a list of the key of each edge. If both
+    # are None, then keys are the default keys, which are assigned in edge order.
+    edge_indices: cp.ndarray[IndexValue] | None
+    edge_keys: list[EdgeKey] | None
+
+    ####################
+    # Creation methods #
+    ####################
+
+    @classmethod
+    def from_coo(
+        cls,
+        N: int,
+        row_indices: cp.ndarray[IndexValue],
+        col_indices: cp.ndarray[IndexValue],
+        edge_values: dict[AttrKey, cp.ndarray[EdgeValue]] | None = None,
+        edge_masks: dict[AttrKey, cp.ndarray[bool]] | None = None,
+        node_values: dict[AttrKey, cp.ndarray[NodeValue]] | None = None,
+        node_masks: dict[AttrKey, cp.ndarray[bool]] | None = None,
+        *,
+        key_to_id: dict[NodeKey, IndexValue] | None = None,
+        id_to_key: dict[IndexValue, NodeKey] | None = None,
+        edge_indices: cp.ndarray[IndexValue] | None = None,
+        edge_keys: list[EdgeKey] | None = None,
+        **attr,
+    ) -> MultiGraph:
+        new_graph = super().from_coo(
+            N,
+            row_indices,
+            col_indices,
+            edge_values,
+            edge_masks,
+            node_values,
+            node_masks,
+            key_to_id=key_to_id,
+            id_to_key=id_to_key,
+            **attr,
+        )
+        new_graph.edge_indices = edge_indices
+        new_graph.edge_keys = edge_keys
+        # Easy and fast sanity checks
+        size = new_graph.row_indices.size
+        if new_graph.edge_indices is not None and new_graph.edge_indices.size != size:
+            raise ValueError
+        if new_graph.edge_keys is not None and len(new_graph.edge_keys) != size:
+            raise ValueError
+        return new_graph
+
+    #################
+    # Class methods #
+    #################
+
+    @classmethod
+    @networkx_api
+    def is_multigraph(cls) -> bool:
+        return True
+
+    @classmethod
+    @networkx_api
+    def to_directed_class(cls) -> type[nxcg.MultiDiGraph]:
+        return nxcg.MultiDiGraph
+
+    @classmethod
+    def to_networkx_class(cls) -> type[nx.MultiGraph]:
+        return nx.MultiGraph
+
+    @classmethod
+    @networkx_api
+    def to_undirected_class(cls) -> type[MultiGraph]:
+        return MultiGraph
+
+    ##########################
+    # NetworkX graph methods #
+    ##########################
+
+    @networkx_api
+    def clear(self) -> None:
+        super().clear()
+        self.edge_indices = None
+        self.edge_keys = None
+
+    @networkx_api
+    def clear_edges(self) -> None:
+        super().clear_edges()
+        self.edge_indices = None
+        self.edge_keys = None
+
+    @networkx_api
+    def get_edge_data(
+        self,
+        u: NodeKey,
+        v: NodeKey,
+        key: EdgeKey | None = None,
+        default: EdgeValue | None = None,
+    ) -> dict[EdgeKey, dict[AttrKey, EdgeValue]] | dict[AttrKey, EdgeValue]:
+        indices = self._get_edge_indices(u, v)
+        if not indices:
+            return default
+        edge_keys = self._get_edge_keys(indices)
+        if key is not None:
+            try:
+                indices = [indices[edge_keys.index(key)]]
+            except ValueError:
+                return default
+            edge_keys = [key]
+        rv = {
+            edge_key: {
+                attr: val[index].tolist()
+                for attr, val in self.edge_values.items()
+                if attr not in self.edge_masks or self.edge_masks[attr][index]
+            }
+            for edge_key, index in zip(edge_keys, indices)
+        }
+        if key is not None:
+            return rv[key]
+        return rv
+
+    @networkx_api
+    def has_edge(self, u: NodeKey, v: NodeKey, key: EdgeKey | None = None) -> bool:
+        if key is None:
+            return super().has_edge(u, v)
+        return self.get_edge_data(u, v, key) is not None
+
+    ###################
+    # Private methods #
+    ###################
+
+    def _copy(self, as_view: bool, cls: type[Graph], reverse: bool = False):
+        rv = super()._copy(as_view, cls, reverse)
+        edge_indices = self.edge_indices
+        edge_keys = self.edge_keys
+        if not as_view:
+            if edge_indices is not None:
+                edge_indices = edge_indices.copy()
+            if edge_keys is not None:
+                edge_keys = edge_keys.copy()
+        rv.edge_indices = edge_indices
+        rv.edge_keys = edge_keys
+        return rv
+
+    def _update_saved_arrays(self, arrays: dict, manifest: dict) -> None:
+        if self.edge_indices is not None:
+            arrays["edge_indices"] = self.edge_indices
+        if self.edge_keys is not None:
+            arrays["edge_keys"] = _keys_to_array(self.edge_keys)
+
+    @classmethod
+    def _get_loaded_arrays(
+        cls, manifest: dict, read: Callable[[str], np.ndarray]
+    ) -> dict:
+        rv = {}
+        try:
+            rv["edge_indices"] = cp.asarray(read("edge_indices"))
+        except FileNotFoundError:
+            pass
+        try:
+            rv["edge_keys"] = read("edge_keys").tolist()
+        except FileNotFoundError:
+            pass
+        return rv
+
+    def _get_edge_keys(self, indices: list[int]) -> list[EdgeKey]:
+        """Get the keys of the edges at the given positions of the COO arrays."""
+        if self.edge_keys is not None:
+            return [self.edge_keys[index] for index in indices]
+        if self.edge_indices is not None:
+            return self.edge_indices[indices].tolist()
+        # Default keys of parallel edges are 0, 1, 2, etc. in edge order
+        return list(range(len(indices)))
+
+    def _get_plc_edges(
+        self, edge_array: cp.ndarray[EdgeValue] | None
+    ) -> tuple[
+        cp.ndarray[IndexValue], cp.ndarray[IndexValue], cp.ndarray[EdgeValue] | None
+    ]:
+        # Combine parallel edges into a single edge and sum their weights. This
+        # matches unweighted NetworkX algorithms such as betweenness centrality,
+        # which treat parallel edges as one edge, and louvain, which sums the
+        # weights of parallel edges (so they must be given weights to sum).
+        if self.row_indices.size == 0:
+            return self.row_indices, self.col_indices, edge_array
+        N = self._N
+        edge_ids = self.row_indices.astype(np.int64) * N + self.col_indices
+        edge_ids, inverse = cp.unique(edge_ids, return_inverse=True)
+        src_indices = (edge_ids // N).astype(self.row_indices.dtype)
+        dst_indices = (edge_ids % N).astype(self.col_indices.dtype)
+        if edge_array is not None:
+            edge_array = cp.bincount(
+                inverse, weights=edge_array, minlength=edge_ids.size
+            ).astype(edge_array.dtype)
+        return src_indices, dst_indices, edge_array
@@ -16,6 +16,7 @@ import itertools
 import operator as op
 from collections import Counter
 from collections.abc import Mapping
+from functools import partial
 from typing import TYPE_CHECKING
 
 import cupy as cp
@@ -23,9 +24,19 @@ import networkx as nx
 import numpy as np
 
 import nx_cugraph as nxcg
+from nx_cugraph.utils import _LazyDict
 
 if TYPE_CHECKING:
-    from nx_cugraph.typing import AttrKey, Dtype, EdgeValue, NodeValue
+    from collections.abc import Callable, Iterable
+
+    from nx_cugraph.typing import (
+        AttrKey,
+        Dtype,
+        EdgeValue,
+        IndexValue,
+        NodeKey,
+        NodeValue,
+    )
 
 __all__ = [
     "from_networkx",
@@ -35,6 +46,15 @@ __all__ = [
 concat = itertools.chain.from_iterable
 # A "required" attribute is one that all edges or nodes must have or KeyError is raised
 REQUIRED = ...
+# Graphs with at least this many (directed) edges and requested edge attributes are
+# converted with `_EdgeBuffers`, which fills all arrays in a single chunked pass.
+_BULK_EDGE_THRESHOLD = 2**16
+_BULK_CHUNK_SIZE = 2**18
+# Maximum number of edges to copy from device to host at a time in `to_networkx`
+_TO_NETWORKX_CHUNK_SIZE = 2**20
+# Integer node keys are renumbered with a lookup table if the range of the keys is
+# at most this many times the number of nodes; otherwise, with binary search.
+_LOOKUP_TABLE_FACTOR = 8
 
 
 def from_networkx(
@@ -122,8 +142,6 @@ def from_networkx(
             graph = G
         else:
             raise TypeError(f"Expected networkx.Graph; got {type(graph)}")
-    elif graph.is_multigraph():
-        raise NotImplementedError("MultiGraph support is not yet implemented")
 
     if preserve_all_attrs:
         preserve_edge_attrs = True
@@ -144,12 +162,23 @@ def from_networkx(
         else:
             node_attrs = {node_attrs: None}
 
-    if graph.__class__ in {nx.Graph, nx.DiGraph}:
+    if graph.__class__ in {nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph}:
         # This is a NetworkX private attribute, but is much faster to use
         adj = graph._adj
     else:
         adj = graph.adj
-    if isinstance(adj, nx.classes.coreviews.FilterAdjacency):
+    if is_multigraph := graph.is_multigraph():
+        # Map `(neighbor, edge_key)` to edge data in each row so that multigraph
+        # edges and their attributes are handled the same as for graphs below.
+        adj = {
+            u: {
+                (v, edge_key): edgedata
+                for v, keydict in rowdata.items()
+                for edge_key, edgedata in keydict.items()
+            }
+            for u, rowdata in adj.items()
+        }
+    elif isinstance(adj, nx.classes.coreviews.FilterAdjacency):
         adj = {k: dict(v) for k, v in adj.items()}
 
     N = len(adj)
@@ -244,72 +273,65 @@ def from_networkx(
                 # All nodes have these attributes
                 node_attrs[attr] = REQUIRED
 
-    key_to_id = dict(zip(adj, range(N)))
-    col_iter = concat(adj.values())
-    try:
-        no_renumber = all(k == v for k, v in key_to_id.items())
-    except Exception:
-        no_renumber = False
-    if no_renumber:
-        key_to_id = None
-    else:
-        col_iter = map(key_to_id.__getitem__, col_iter)
-    col_indices = cp.fromiter(col_iter, np.int32)
+    key_to_id, keys_to_ids = _renumber(list(adj))
 
-    edge_values = {}
-    edge_masks = {}
+    degrees = np.fromiter(map(len, adj.values()), np.int32, N)
+    num_edges = int(degrees.sum())
     if edge_attrs:
         if edge_dtypes is None:
             edge_dtypes = {}
         elif not isinstance(edge_dtypes, Mapping):
             edge_dtypes = dict.fromkeys(edge_attrs, edge_dtypes)
+
+    # Fill column indices and all edge attributes in a single pass over `adj` for
+    # large graphs with several edge arrays; otherwise, iterate once per array.
+    use_buffers = (
+        num_edges >= _BULK_EDGE_THRESHOLD
+        and edge_attrs
+        and not preserve_edge_attrs
+        and not is_multigraph
+        and (len(edge_attrs) > 1 or None in edge_attrs.values())
+    )
+    edge_indices = edge_keys = None
+    if is_multigraph:
+        edge_keys = list(map(op.itemgetter(1), concat(adj.values())))
+        if set(map(type, edge_keys)) <= {int} and (
+            not edge_keys or -(2**31) <= min(edge_keys) and max(edge_keys) < 2**31
+        ):
+            # Store integer edge keys (the default) compactly in an array
+            edge_indices = cp.array(edge_keys, np.int32)
+            edge_keys = None
+    if not use_buffers:
+        col_iter = concat(adj.values())
+        if is_multigraph:
+            col_iter = map(op.itemgetter(0), col_iter)
+        col_indices = cp.asarray(keys_to_ids(col_iter, num_edges))
+
+    edge_values = {}
+    edge_masks = {}
+    if use_buffers:
+        buffers = _EdgeBuffers(num_edges, edge_attrs, edge_dtypes)
+        buffers.fill(adj, degrees, keys_to_ids)
+        col_indices = cp.asarray(buffers.col_indices)
+        edge_values = {key: cp.asarray(val) for key, val in buffers.values.items()}
+        edge_masks = {key: cp.asarray(val) for key, val in buffers.masks.items()}
+    elif edge_attrs and preserve_edge_attrs:
+        # Only extract the values of preserved attributes when they are first used
+        edge_values, edge_masks = _lazy_columns(
+            partial(_edge_column, adj), edge_attrs, edge_dtypes, num_edges
+        )
+    elif edge_attrs:
         for edge_attr, edge_default in edge_attrs.items():
-            dtype = edge_dtypes.get(edge_attr)
-            if edge_default is None:
-                vals = []
-                append = vals.append
-                iter_mask = (
-                    append(
-                        edgedata[edge_attr]
-                        if (present := edge_attr in edgedata)
-                        else False
-                    )
-                    or present
-                    for rowdata in adj.values()
-                    for edgedata in rowdata.values()
-                )
-                edge_masks[edge_attr] = cp.fromiter(iter_mask, bool)
-                edge_values[edge_attr] = cp.array(vals, dtype)
-                # if vals.ndim > 1: ...
-            else:
-                if edge_default is REQUIRED:
-                    # Using comprehensions should be fast starting in Python 3.11
-                    # iter_values = (
-                    #     edgedata[edge_attr]
-                    #     for rowdata in adj.values()
-                    #     for edgedata in rowdata.values()
-                    # )
-                    iter_values = map(
-                        op.itemgetter(edge_attr), concat(map(dict.values, adj.values()))
-                    )
-                else:
-                    iter_values = (
-                        edgedata.get(edge_attr, edge_default)
-                        for rowdata in adj.values()
-                        for edgedata in rowdata.values()
-                    )
-                if dtype is None:
-                    edge_values[edge_attr] = cp.array(list(iter_values))
-                else:
-                    edge_values[edge_attr] = cp.fromiter(iter_values, dtype)
-                # if vals.ndim > 1: ...
+            vals, mask = _edge_column(
+                adj, edge_attr, edge_default, edge_dtypes.get(edge_attr)
+            )
+            edge_values[edge_attr] = vals
+            if mask is not None:
+                edge_masks[edge_attr] = mask
 
     row_indices = cp.array(
         # cp.repeat is slow to use here, so use numpy instead
-        np.repeat(
-            np.arange(N, dtype=np.int32),
-            np.fromiter(map(len, adj.values()), np.int32),
-        )
+        np.repeat(np.arange(N, dtype=np.int32), degrees)
     )
 
     node_values = {}
@@ -320,56 +342,354 @@ def from_networkx(
             node_dtypes = {}
         elif not isinstance(node_dtypes, Mapping):
             node_dtypes = dict.fromkeys(node_attrs, node_dtypes)
-        for node_attr, node_default in node_attrs.items():
-            # Iterate over `adj` to ensure consistent order
-            dtype = node_dtypes.get(node_attr)
-            if node_default is None:
-                vals = []
-                append = vals.append
-                iter_mask = (
-                    append(
-                        nodedata[node_attr]
-                        if (present := node_attr in (nodedata := nodes[node_id]))
-                        else False
-                    )
-                    or present
-                    for node_id in adj
+        if preserve_node_attrs:
+            # Only extract the values of preserved attributes when they are first used
+            node_values, node_masks = _lazy_columns(
+                partial(_node_column, adj, nodes), node_attrs, node_dtypes, N
+            )
+        else:
+            for node_attr, node_default in node_attrs.items():
+                vals, mask = _node_column(
+                    adj, nodes, node_attr, node_default, node_dtypes.get(node_attr)
                 )
-                node_masks[node_attr] = cp.fromiter(iter_mask, bool)
-                node_values[node_attr] = cp.array(vals, dtype)
-                # if vals.ndim > 1: ...
-            else:
-                if node_default is REQUIRED:
-                    iter_values = (nodes[node_id][node_attr] for node_id in adj)
-                else:
-                    iter_values = (
-                        nodes[node_id].get(node_attr, node_default) for node_id in adj
-                    )
-                if dtype is None:
-                    node_values[node_attr] = cp.array(list(iter_values))
-                else:
-                    node_values[node_attr] = cp.fromiter(iter_values, dtype)
-                # if vals.ndim > 1: ...
-
-    if graph.is_directed() or as_directed:
-        klass = nxcg.DiGraph
+                node_values[node_attr] = vals
+                if mask is not None:
+                    node_masks[node_attr] = mask
+
+    if is_multigraph:
+        if graph.is_directed() or as_directed:
+            klass = nxcg.MultiDiGraph
+        else:
+            klass = nxcg.MultiGraph
+        rv = klass.from_coo(
+            N,
+            row_indices,
+            col_indices,
+            edge_values,
+            edge_masks,
+            node_values,
+            node_masks,
+            key_to_id=key_to_id,
+            edge_indices=edge_indices,
+            edge_keys=edge_keys,
+        )
     else:
-        klass = nxcg.Graph
-    rv = klass.from_coo(
-        N,
-        row_indices,
-        col_indices,
-        edge_values,
-        edge_masks,
-        node_values,
-        node_masks,
-        key_to_id=key_to_id,
-    )
+        if graph.is_directed() or as_directed:
+            klass = nxcg.DiGraph
+        else:
+            klass = nxcg.Graph
+        rv = klass.from_coo(
+            N,
+            row_indices,
+            col_indices,
+            edge_values,
+            edge_masks,
+            node_values,
+            node_masks,
+            key_to_id=key_to_id,
+        )
     if preserve_graph_attrs:
         rv.graph.update(graph.graph)  # deepcopy?
     return rv
 
 
+def _renumber(
+    node_keys: list[NodeKey],
+) -> tuple[
+    dict[NodeKey, IndexValue] | None,
+    Callable[[Iterable[NodeKey], int], np.ndarray[IndexValue]],
+]:
+    """Number nodes in order and get a function that maps node keys to node IDs.
+
+    Returns ``(key_to_id, keys_to_ids)``, where ``key_to_id`` is None if node keys
+    are already ``0, 1, ..., N - 1``, and ``keys_to_ids(keys, count)`` converts an
+    iterable of ``count`` node keys to an array of node IDs.
+
+    Integer node keys are collected into an array and converted with a lookup
+    table (or binary search if the keys are sparse) instead of a dict lookup per
+    key, which is much faster for many edges. Other keys use ``key_to_id``.
+    """
+    N = len(node_keys)
+    key_array = None
+    if N > 0 and set(map(type, node_keys)) <= {int}:
+        try:
+            key_array = np.array(node_keys, np.int64)
+        except OverflowError:
+            pass
+    if key_array is None:
+        key_to_id = dict(zip(node_keys, range(N)))
+        try:
+            no_renumber = all(k == v for k, v in key_to_id.items())
+        except Exception:
+            no_renumber = False
+        if no_renumber:
+            return None, partial(_keys_to_ids, None)
+        return key_to_id, partial(_keys_to_ids, key_to_id.__getitem__)
+    ids = np.arange(N, dtype=np.int32)
+    if (key_array == ids).all():
+        return None, partial(_keys_to_ids, None)
+    key_to_id = dict(zip(node_keys, range(N)))
+    min_key = int(key_array.min())
+    num_keys = int(key_array.max()) - min_key + 1
+    if num_keys <= _LOOKUP_TABLE_FACTOR * N:
+        table = np.empty(num_keys, np.int32)
+        table[key_array - min_key] = ids
+        return key_to_id, partial(_int_keys_to_ids, table.__getitem__, min_key)
+    sorter = np.argsort(key_array).astype(np.int32)
+    sorted_keys = key_array[sorter]
+
+    def search(keys: np.ndarray[np.int64]) -> np.ndarray[IndexValue]:
+        return sorter[np.searchsorted(sorted_keys, keys)]
+
+    return key_to_id, partial(_int_keys_to_ids, search, 0)
+
+
+def _keys_to_ids(
+    key_to_id: Callable[[NodeKey], IndexValue] | None,
+    keys: Iterable[NodeKey],
+    count: int = -1,
+) -> np.ndarray[IndexValue]:
+    if key_to_id is not None:
+        keys = map(key_to_id, keys)
+    return np.fromiter(keys, np.int32, count)
+
+
+def _int_keys_to_ids(
+    lookup: Callable[[np.ndarray[np.int64]], np.ndarray[IndexValue]],
+    offset: int,
+    keys: Iterable[int],
+    count: int = -1,
+) -> np.ndarray[IndexValue]:
+    keys = np.fromiter(keys, np.int64, count)
+    if offset:
+        keys -= offset
+    return lookup(keys)
+
+
+def _edge_column(
+    adj: Mapping,
+    edge_attr: AttrKey,
+    edge_default: EdgeValue | None,
+    dtype: Dtype | None,
+) -> tuple[cp.ndarray[EdgeValue], cp.ndarray[bool] | None]:
+    """Get the values (and mask if ``edge_default`` is None) of an edge attribute."""
+    if edge_default is None:
+        vals = []
+        append = vals.append
+        iter_mask = (
+            append(edgedata[edge_attr] if (present := edge_attr in edgedata) else False)
+            or present
+            for rowdata in adj.values()
+            for edgedata in rowdata.values()
+        )
+        mask = cp.fromiter(iter_mask, bool)
+        return cp.array(vals, dtype), mask
+        # if vals.ndim > 1: ...
+    if edge_default is REQUIRED:
+        # Using comprehensions should be fast starting in Python 3.11
+        # iter_values = (
+        #     edgedata[edge_attr]
+        #     for rowdata in adj.values()
+        #     for edgedata in rowdata.values()
+        # )
+        iter_values = map(
+            op.itemgetter(edge_attr), concat(map(dict.values, adj.values()))
+        )
+    else:
+        iter_values = (
+            edgedata.get(edge_attr, edge_default)
+            for rowdata in adj.values()
+            for edgedata in rowdata.values()
+        )
+    if dtype is None:
+        return cp.array(list(iter_values)), None
+    return cp.fromiter(iter_values, dtype), None
+    # if vals.ndim > 1: ...
+
+
+def _node_column(
+    adj: Mapping,
+    nodes: Mapping,
+    node_attr: AttrKey,
+    node_default: NodeValue | None,
+    dtype: Dtype | None,
+) -> tuple[cp.ndarray[NodeValue], cp.ndarray[bool] | None]:
+    """Get the values (and mask if ``node_default`` is None) of a node attribute."""
+    # Iterate over `adj` to ensure consistent order
+    if node_default is None:
+        vals = []
+        append = vals.append
+        iter_mask = (
+            append(
+                nodedata[node_attr]
+                if (present := node_attr in (nodedata := nodes[node_id]))
+                else False
+            )
+            or present
+            for node_id in adj
+        )
+        mask = cp.fromiter(iter_mask, bool)
+        return cp.array(vals, dtype), mask
+        # if vals.ndim > 1: ...
+    if node_default is REQUIRED:
+        iter_values = (nodes[node_id][node_attr] for node_id in adj)
+    else:
+        iter_values = (nodes[node_id].get(node_attr, node_default) for node_id in adj)
+    if dtype is None:
+        return cp.array(list(iter_values)), None
+    return cp.fromiter(iter_values, dtype), None
+    # if vals.ndim > 1: ...
+
+
+def _lazy_columns(
+    get_column: Callable[
+        [AttrKey, EdgeValue | NodeValue | None, Dtype | None],
+        tuple[cp.ndarray, cp.ndarray[bool] | None],
+    ],
+    attrs: dict[AttrKey, EdgeValue | NodeValue | None],
+    dtypes: dict[AttrKey, Dtype | None],
+    size: int,
+) -> tuple[_LazyDict, _LazyDict]:
+    """Create values and masks that are extracted from a networkx graph when used.
+
+    The values and mask of an attribute are extracted together the first time
+    either is accessed, and are memoized so copies of the returned dicts share them.
+    The networkx graph should not be mutated while attributes may still be loaded.
+    """
+    columns = {}
+
+    def load(attr):
+        if attr not in columns:
+            msg = (
+                f"Unable to load attribute {attr!r}, because the networkx graph "
+                "was mutated after it was converted"
+            )
+            try:
+                vals, mask = get_column(attr, attrs[attr], dtypes.get(attr))
+            except KeyError as exc:
+                # A required attribute went missing
+                raise RuntimeError(msg) from exc
+            if vals.shape[0] != size:
+                raise RuntimeError(msg)
+            columns[attr] = vals, mask
+        return columns[attr]
+
+    def load_values(attr):
+        return load(attr)[0]
+
+    def load_mask(attr):
+        return load(attr)[1]
+
+    values = _LazyDict({attr: partial(load_values, attr) for attr in attrs})
+    masks = _LazyDict(
+        {
+            attr: partial(load_mask, attr)
+            for attr, default in attrs.items()
+            if default is None
+        }
+    )
+    return values, masks
+
+
+class _EdgeBuffers:
+    """Preallocated host arrays for column indices and edge attributes.
+
+    The adjacency is walked once in chunks of about ``chunk_size`` edges, and each
+    chunk fills the column indices and all requested attributes together. This
+    avoids iterating over ``adj`` once per attribute and building large Python
+    lists. Attributes without a dtype are converted per chunk and concatenated.
+    """
+
+    __slots__ = ("edge_attrs", "col_indices", "values", "masks", "_chunks")
+
+    def __init__(
+        self,
+        num_edges: int,
+        edge_attrs: dict[AttrKey, EdgeValue | None],
+        edge_dtypes: dict[AttrKey, Dtype | None],
+    ):
+        self.edge_attrs = edge_attrs
+        self.col_indices = np.empty(num_edges, np.int32)
+        self.values = {}
+        self.masks = {}
+        self._chunks = {}
+        for edge_attr, edge_default in edge_attrs.items():
+            dtype = edge_dtypes.get(edge_attr)
+            if dtype is None:
+                self._chunks[edge_attr] = []
+            else:
+                self.values[edge_attr] = np.empty(num_edges, dtype)
+            if edge_default is None:
+                self.masks[edge_attr] = np.empty(num_edges, bool)
+
+    def fill(
+        self,
+        adj: Mapping,
+        degrees: np.ndarray[IndexValue],
+        keys_to_ids: Callable[[Iterable[NodeKey], int], np.ndarray[IndexValue]],
+        chunk_size: int | None = None,
+    ) -> None:
+        if chunk_size is None:
+            chunk_size = _BULK_CHUNK_SIZE
+        # Split rows into chunks of about `chunk_size` edges using the row degrees
+        indptr = np.zeros(degrees.size + 1, np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+        bounds = np.searchsorted(
+            indptr, np.arange(chunk_size, indptr[-1], chunk_size), side="right"
+        )
+        row_bounds = [0, *np.unique(bounds).tolist(), degrees.size]
+        # `dict.values` is much faster than a generic method call if we can use it
+        get_values = dict.values if isinstance(adj, dict) else op.methodcaller("values")
+        rows_iter = iter(adj.values())
+        for row_start, row_stop in zip(row_bounds[:-1], row_bounds[1:]):
+            start = int(indptr[row_start])
+            count = int(indptr[row_stop]) - start
+            rows = list(itertools.islice(rows_iter, row_stop - row_start))
+            if count:
+                self._fill_chunk(start, count, rows, get_values, keys_to_ids)
+        for edge_attr, chunks in self._chunks.items():
+            self.values[edge_attr] = (
+                np.concatenate(chunks) if len(chunks) != 1 else chunks[0]
+            )
+        self._chunks = {}
+
+    def _fill_chunk(
+        self,
+        start: int,
+        count: int,
+        rows: list[Mapping],
+        get_values: Callable[[Mapping], Iterable[dict]],
+        keys_to_ids: Callable[[Iterable[NodeKey], int], np.ndarray[IndexValue]],
+    ) -> None:
+        stop = start + count
+        self.col_indices[start:stop] = keys_to_ids(concat(rows), count)
+        edgedatas = list(concat(map(get_values, rows)))
+        for edge_attr, edge_default in self.edge_attrs.items():
+            # Use `map` with dict methods so iteration happens in C
+            attr_iter = itertools.repeat(edge_attr, count)
+            if edge_default is None:
+                self.masks[edge_attr][start:stop] = np.fromiter(
+                    map(dict.__contains__, edgedatas, attr_iter), bool, count
+                )
+                iter_values = map(
+                    dict.get,
+                    edgedatas,
+                    itertools.repeat(edge_attr),
+                    itertools.repeat(False),
+                )
+            elif edge_default is REQUIRED:
+                iter_values = map(op.itemgetter(edge_attr), edgedatas)
+            else:
+                iter_values = map(
+                    dict.get, edgedatas, attr_iter, itertools.repeat(edge_default)
+                )
+            if edge_attr in self._chunks:
+                self._chunks[edge_attr].append(np.array(list(iter_values)))
+            else:
+                vals = self.values[edge_attr]
+                vals[start:stop] = np.fromiter(iter_values, vals.dtype, count)
+
+
 def _iter_attr_dicts(
     values: dict[AttrKey, cp.ndarray[EdgeValue | NodeValue]],
     masks: dict[AttrKey, cp.ndarray[bool]],
@@ -416,26 +736,39 @@ def to_networkx(G: nxcg.Graph) -> nx.Graph:
     from_networkx : The opposite; convert networkx graph to nx_cugraph graph
     """
     rv = G.to_networkx_class()()
+    # For plain networkx graphs, fill `_node` and `_adj` (and `_pred`) directly,
+    # which skips the checks done by `add_nodes_from` and `add_edges_from`.
+    # This uses private attributes in NetworkX, but is much faster.
+    fill_adj = rv.__class__ in {nx.Graph, nx.DiGraph}
     id_to_key = G.id_to_key
 
     node_values = G.node_values
     node_masks = G.node_masks
+    node_iter = range(len(G))
+    if id_to_key is not None:
+        node_iter = map(id_to_key.__getitem__, node_iter)
     if node_values:
-        node_iter = range(len(G))
-        if id_to_key is not None:
-            node_iter = map(id_to_key.__getitem__, node_iter)
         full_node_dicts = _iter_attr_dicts(node_values, node_masks)
-        rv.add_nodes_from(zip(node_iter, full_node_dicts))
-    elif id_to_key is not None:
-        rv.add_nodes_from(id_to_key.values())
     else:
-        rv.add_nodes_from(range(len(G)))
+        full_node_dicts = iter(dict, None)  # Create a new empty dict for each node
+    if fill_adj:
+        nodes = list(node_iter)
+        rv._node.update(zip(nodes, full_node_dicts))
+        rv._adj.update(zip(nodes, iter(dict, None)))
+        if rv.is_directed():
+            rv._pred.update(zip(nodes, iter(dict, None)))
+    else:
+        rv.add_nodes_from(zip(node_iter, full_node_dicts))
 
     row_indices = G.row_indices
     col_indices = G.col_indices
     edge_values = G.edge_values
     edge_masks = G.edge_masks
-    if edge_values and not G.is_directed():
+    edge_indices = edge_keys = None
+    if G.is_multigraph():
+        edge_indices = G.edge_indices
+        edge_keys = G.edge_keys
+    if not G.is_directed():
         # Only add upper triangle of the adjacency matrix so we don't double-add edges
         mask = row_indices <= col_indices
         row_indices = row_indices[mask]
@@ -443,16 +776,55 @@ def to_networkx(G: nxcg.Graph) -> nx.Graph:
         edge_values = {k: v[mask] for k, v in edge_values.items()}
         if edge_masks:
             edge_masks = {k: v[mask] for k, v in edge_masks.items()}
-    row_indices = row_iter = row_indices.tolist()
-    col_indices = col_iter = col_indices.tolist()
-    if id_to_key is not None:
-        row_iter = map(id_to_key.__getitem__, row_indices)
-        col_iter = map(id_to_key.__getitem__, col_indices)
-    if edge_values:
-        full_edge_dicts = _iter_attr_dicts(edge_values, edge_masks)
-        rv.add_edges_from(zip(row_iter, col_iter, full_edge_dicts))
-    else:
-        rv.add_edges_from(zip(row_iter, col_iter))
+        if edge_indices is not None:
+            edge_indices = edge_indices[mask]
+        if edge_keys is not None:
+            edge_keys = list(itertools.compress(edge_keys, mask.tolist()))
+    # Copy edges to host in bounded chunks to limit peak host memory.
+    # Edges are added in the order of the COO arrays, which is CSR order
+    # for graphs created by `from_networkx`.
+    chunk_size = _TO_NETWORKX_CHUNK_SIZE
+    for start in range(0, row_indices.size, chunk_size):
+        stop = start + chunk_size
+        row_iter = row_indices[start:stop].tolist()
+        col_iter = col_indices[start:stop].tolist()
+        if id_to_key is not None:
+            row_iter = map(id_to_key.__getitem__, row_iter)
+            col_iter = map(id_to_key.__getitem__, col_iter)
+        if edge_values:
+            full_edge_dicts = _iter_attr_dicts(
+                {k: v[start:stop] for k, v in edge_values.items()},
+                {k: v[start:stop] for k, v in edge_masks.items()},
+            )
+        else:
+            full_edge_dicts = iter(dict, None)  # Create a new empty dict for each edge
+        if edge_indices is not None:
+            # Edge keys of multigraphs
+            rv.add_edges_from(
+                zip(
+                    row_iter,
+                    col_iter,
+                    edge_indices[start:stop].tolist(),
+                    full_edge_dicts,
+                )
+            )
+        elif edge_keys is not None:
+            rv.add_edges_from(
+                zip(row_iter, col_iter, edge_keys[start:stop], full_edge_dicts)
+            )
+        elif not fill_adj:
+            rv.add_edges_from(zip(row_iter, col_iter, full_edge_dicts))
+        elif rv.is_directed():
+            succ = rv._succ
+            pred = rv._pred
+            for u, v, edgedata in zip(row_iter, col_iter, full_edge_dicts):
+                succ[u][v] = edgedata
+                pred[v][u] = edgedata
+        else:
+            adj = rv._adj
+            for u, v, edgedata in zip(row_iter, col_iter, full_edge_dicts):
+                adj[u][v] = edgedata
+                adj[v][u] = edgedata
 
     rv.graph.update(G.graph)
     return rv
@@ -108,6 +108,105 @@ def bench_cycle_graph(gpubenchmark, N, attr_kind, create_using):
     _bench_helper(gpubenchmark, N, attr_kind, create_using, nx.cycle_graph)
 
 
+@pytest.mark.parametrize("N", [10**6])
+@pytest.mark.parametrize("attr_kind", ["required_dtype", "full", "half_missing"])
+@pytest.mark.parametrize("create_using", [nx.Graph, nx.DiGraph])
+@pytest.mark.parametrize("use_buffers", [True, False])
+def bench_cycle_graph_many_edge_attrs(
+    gpubenchmark, monkeypatch, N, attr_kind, create_using, use_buffers
+):
+    # Compare filling all edge attributes in one pass to one pass per attribute
+    threshold = 0 if use_buffers else float("inf")
+    monkeypatch.setattr(nxcg.convert, "_BULK_EDGE_THRESHOLD", threshold)
+    G = nx.cycle_graph(N, create_using=create_using)
+    skip = True
+    for *_ids, edgedict in G.edges(data=True):
+        skip = not skip
+        edgedict["x"] = random.randint(0, 100000)
+        edgedict["y"] = random.random()
+        if not skip:
+            edgedict["z"] = random.randint(0, 100000)
+    if attr_kind == "required_dtype":
+        gpubenchmark(
+            nxcg.from_networkx,
+            G,
+            edge_attrs={"x": ..., "y": ..., "z": 0},
+            edge_dtypes={"x": np.int32, "y": np.float64, "z": np.int32},
+        )
+    elif attr_kind == "half_missing":
+        gpubenchmark(nxcg.from_networkx, G, edge_attrs={"x": None, "z": None})
+    else:  # full
+        gpubenchmark(nxcg.from_networkx, G, edge_attrs={"x": 0, "y": 0, "z": 0})
+
+
+@pytest.mark.parametrize("N", [1, 10**6])
+@pytest.mark.parametrize(
+    "attr_kind",
+    [
+        "required_dtype",
+        "required",
+        "full",
+        "half_missing",
+        "half_default",
+        "preserve",
+        None,
+    ],
+)
+@pytest.mark.parametrize("create_using", [nx.MultiGraph, nx.MultiDiGraph])
+def bench_cycle_multigraph(gpubenchmark, N, attr_kind, create_using):
+    # Add a parallel edge to every other edge of the cycle
+    G = nx.cycle_graph(N, create_using=create_using)
+    G.add_edges_from(list(G.edges)[::2])
+    if attr_kind:
+        skip = True
+        for *_ids, edgedict in G.edges(data=True):
+            skip = not skip
+            if skip and attr_kind not in {"full", "required", "required_dtype"}:
+                continue
+            edgedict["x"] = random.randint(0, 100000)
+        if attr_kind == "preserve":
+            gpubenchmark(nxcg.from_networkx, G, preserve_edge_attrs=True)
+        elif attr_kind == "half_missing":
+            gpubenchmark(nxcg.from_networkx, G, edge_attrs={"x": None})
+        elif attr_kind == "required":
+            gpubenchmark(nxcg.from_networkx, G, edge_attrs={"x": ...})
+        elif attr_kind == "required_dtype":
+            gpubenchmark(
+                nxcg.from_networkx,
+                G,
+                edge_attrs={"x": ...},
+                edge_dtypes={"x": np.int32},
+            )
+        else:  # full, half_default
+            gpubenchmark(nxcg.from_networkx, G, edge_attrs={"x": 0})
+    else:
+        gpubenchmark(nxcg.from_networkx, G)
+
+
+@pytest.mark.parametrize("N", [1, 10**6])
+@pytest.mark.parametrize("create_using", [nx.MultiGraph, nx.MultiDiGraph])
+def bench_cycle_multigraph_to_networkx(gpubenchmark, N, create_using):
+    G = nx.cycle_graph(N, create_using=create_using)
+    G.add_edges_from(list(G.edges)[::2], x=1)
+    Gcg = nxcg.from_networkx(G, preserve_edge_attrs=True)
+    gpubenchmark(nxcg.to_networkx, Gcg)
+
+
+@pytest.mark.parametrize("N", [1, 10**6])
+@pytest.mark.parametrize("key_kind", ["int_gaps", "int_sparse", "str"])
+@pytest.mark.parametrize("create_using", [nx.Graph, nx.DiGraph])
+def bench_cycle_graph_relabeled(gpubenchmark, N, key_kind, create_using):
+    G = nx.cycle_graph(N, create_using=create_using)
+    if key_kind == "int_gaps":
+        mapping = {i: 3 * i + 1 for i in range(N)}
+    elif key_kind == "int_sparse":
+        mapping = {i: 2**40 * i for i in range(N)}
+    else:
+        mapping = {i: f"node {i}" for i in range(N)}
+    G = nx.relabel_nodes(G, mapping)
+    gpubenchmark(nxcg.from_networkx, G)
+
+
 @pytest.mark.skipif("not cugraph")
 @pytest.mark.parametrize("N", [1, 10**6])
 @pytest.mark.parametrize("attr_kind", ["full", None])
@@ -10,6 +10,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import itertools
+
 import cupy as cp
 import networkx as nx
 import pytest
@@ -201,3 +203,239 @@ def test_convert():
         interface.BackendInterface.convert_from_nx(G, edge_attrs={"x": 1}, weight="x")
     with pytest.raises(TypeError, match="Expected networkx.Graph"):
         nxcg.from_networkx({})
+
+
+@pytest.mark.parametrize("graph_class", [nx.Graph, nx.DiGraph])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"preserve_edge_attrs": True},
+        {"edge_attrs": {"x": None, "y": None}},
+        {"edge_attrs": {"x": 0, "y": None}},
+        {"edge_attrs": {"x": 0, "y": 0.5}, "edge_dtypes": {"x": int, "y": float}},
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_convert_edge_buffers(monkeypatch, graph_class, kwargs, chunk_size):
+    G = nx.complete_graph(["a", "b", "c", "d", "e"], create_using=graph_class)
+    for i, (_u, _v, edgedata) in enumerate(G.edges(data=True)):
+        edgedata["x"] = i
+        if i % 3 == 0:
+            edgedata["y"] = i / 2
+    expected = nxcg.from_networkx(G, **kwargs)
+    monkeypatch.setattr(nxcg.convert, "_BULK_EDGE_THRESHOLD", 0)
+    monkeypatch.setattr(nxcg.convert, "_BULK_CHUNK_SIZE", chunk_size)
+    Gcg = nxcg.from_networkx(G, **kwargs)
+    assert Gcg.key_to_id == expected.key_to_id
+    cp.testing.assert_array_equal(Gcg.row_indices, expected.row_indices)
+    cp.testing.assert_array_equal(Gcg.col_indices, expected.col_indices)
+    assert sorted(Gcg.edge_values) == sorted(expected.edge_values)
+    assert sorted(Gcg.edge_masks) == sorted(expected.edge_masks)
+    for key, val in expected.edge_values.items():
+        assert Gcg.edge_values[key].dtype == val.dtype
+        cp.testing.assert_array_equal(Gcg.edge_values[key], val)
+    for key, val in expected.edge_masks.items():
+        cp.testing.assert_array_equal(Gcg.edge_masks[key], val)
+
+    # Missing required attributes still raise KeyError. Use more than one attribute
+    # so the graph is converted with `_EdgeBuffers`.
+    fill = nxcg.convert._EdgeBuffers.fill
+    num_fills = 0
+
+    def counting_fill(self, *args, **kwargs):
+        nonlocal num_fills
+        num_fills += 1
+        return fill(self, *args, **kwargs)
+
+    monkeypatch.setattr(nxcg.convert._EdgeBuffers, "fill", counting_fill)
+    with pytest.raises(KeyError, match="y"):
+        nxcg.from_networkx(G, edge_attrs={"x": ..., "y": ...})
+    assert num_fills == 1
+
+
+@pytest.mark.skipif(
+    not hasattr(nx.Graph(), "__networkx_cache__"),
+    reason="networkx graphs have no cache to clear when mutated",
+)
+def test_convert_from_nx_cache(monkeypatch):
+    monkeypatch.setattr(interface.BackendInterface, "cache_converted_graphs", True)
+    monkeypatch.setattr(interface.BackendInterface, "cache_maxsize", 2)
+    convert_from_nx = interface.BackendInterface.convert_from_nx
+    G = nx.path_graph(4)
+    Gcg = convert_from_nx(G, edge_attrs={"x": 1}, name="a", graph_name="G")
+    assert convert_from_nx(G, edge_attrs={"x": 1}, name="b") is Gcg
+    assert convert_from_nx(G, weight="x") is Gcg  # Same as edge_attrs={"x": 1}
+    assert convert_from_nx(G, edge_attrs={"x": 0}) is not Gcg
+    assert convert_from_nx(G, edge_attrs={"x": 1}, as_directed=True) is not Gcg
+    # Least recently used graph was evicted
+    assert convert_from_nx(G, edge_attrs={"x": 1}) is not Gcg
+    # Equal defaults of different types are cached separately
+    Gint = convert_from_nx(G, edge_attrs={"x": 1})
+    Gfloat = convert_from_nx(G, edge_attrs={"x": 1.0})
+    assert Gfloat is not Gint
+    assert convert_from_nx(G, edge_attrs={"x": 1.0}) is Gfloat
+    assert Gint.edge_values["x"].dtype.kind == "i"
+    assert Gfloat.edge_values["x"].dtype.kind == "f"
+    cp.testing.assert_array_equal(Gfloat.edge_values["x"], 1.0)
+    assert convert_from_nx(G, edge_attrs={"x": True}) is not Gint
+    Gcg = convert_from_nx(G)
+    assert convert_from_nx(G) is Gcg
+    # Mutating the graph clears the cache
+    G.add_edge(3, 4)
+    Gcg2 = convert_from_nx(G)
+    assert Gcg2 is not Gcg
+    assert Gcg2.number_of_nodes() == 5
+    # Opt-in
+    monkeypatch.setattr(interface.BackendInterface, "cache_converted_graphs", False)
+    assert convert_from_nx(G) is not Gcg2
+
+
+@pytest.mark.parametrize("graph_class", [nx.Graph, nx.DiGraph])
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+@pytest.mark.parametrize("preserve_all_attrs", [True, False])
+def test_to_networkx_chunks(monkeypatch, graph_class, chunk_size, preserve_all_attrs):
+    monkeypatch.setattr(nxcg.convert, "_TO_NETWORKX_CHUNK_SIZE", chunk_size)
+    G = nx.complete_graph(4, create_using=graph_class)
+    nx.add_path(G, [3, 4, 5, 6])
+    G = nx.relabel_nodes(G, {n: f"n{n}" for n in G})
+    G.add_edge("n0", "n0", x=1)
+    G.add_node("isolated", y=2)
+    for i, (_u, _v, edgedata) in enumerate(G.edges(data=True)):
+        if i % 2 == 0:
+            edgedata["x"] = i
+    Gcg = nxcg.from_networkx(G, preserve_all_attrs=preserve_all_attrs)
+    H = nxcg.to_networkx(Gcg)
+    assert type(H) is graph_class
+    assert list(H) == list(G)
+    if preserve_all_attrs:
+        assert H.nodes == G.nodes
+        assert H.adj == G.adj
+        if G.is_directed():
+            assert H.pred == G.pred
+    else:
+        assert set(H.edges) == set(G.edges)
+        assert all(not nodedata for nodedata in H.nodes.values())
+    if G.is_directed():
+        assert {v: set(preds) for v, preds in H.pred.items()} == {
+            v: set(preds) for v, preds in G.pred.items()
+        }
+        assert all(H.succ[u][v] is H.pred[v][u] for u, v in H.edges)
+    else:
+        assert all(H.adj[u][v] is H.adj[v][u] for u, v in H.edges)
+
+
+def test_convert_preserved_attrs_are_lazy():
+    G = nx.Graph()
+    G.add_edge(0, 1, x=2, y=3)
+    G.add_edge(1, 2, x=4)
+    G.add_node(0, foo=10)
+    Gcg = nxcg.from_networkx(G, preserve_all_attrs=True)
+    assert sorted(Gcg.edge_values) == ["x", "y"]
+    assert list(Gcg.edge_masks) == ["y"]
+    assert list(Gcg.node_values) == list(Gcg.node_masks) == ["foo"]
+    # Nothing has been extracted yet
+    assert list(Gcg.edge_values.loaded_items()) == []
+    assert list(Gcg.node_values.loaded_items()) == []
+    cp.testing.assert_array_equal(Gcg.edge_values["x"], [2, 2, 4, 4])
+    assert [key for key, _ in Gcg.edge_values.loaded_items()] == ["x"]
+    # Values and mask of an attribute are extracted together and shared by copies
+    H = Gcg.copy(as_view=True)
+    cp.testing.assert_array_equal(H.edge_masks["y"], [True, True, False, False])
+    assert Gcg.edge_values["y"] is H.edge_values["y"]
+    cp.testing.assert_array_equal(Gcg.node_masks["foo"], [True, False, False])
+    # Mutating the networkx graph before attributes are used is an error
+    Gcg = nxcg.from_networkx(G, preserve_edge_attrs=True)
+    G.add_edge(2, 3)
+    with pytest.raises(RuntimeError, match="mutated"):
+        Gcg.edge_values["x"]
+    # Failing to load is not cached; it fails again on later accesses
+    with pytest.raises(RuntimeError, match="mutated"):
+        Gcg.edge_values["x"]
+    with pytest.raises(RuntimeError, match="mutated"):
+        Gcg.edge_masks["y"]
+    assert list(Gcg.edge_values.loaded_items()) == []
+
+
+@pytest.mark.parametrize("graph_class", [nx.MultiGraph, nx.MultiDiGraph])
+@pytest.mark.parametrize("chunk_size", [2, 1000])
+def test_convert_multigraph(monkeypatch, graph_class, chunk_size):
+    monkeypatch.setattr(nxcg.convert, "_TO_NETWORKX_CHUNK_SIZE", chunk_size)
+    G = graph_class()
+    G.add_edge(10, 20, x=1)
+    G.add_edge(10, 20, x=2, y=1.5)
+    G.add_edge(20, 30, x=3)
+    G.add_edge(30, 30, x=4)
+    G.add_node(40)
+    cg_class = nxcg.MultiDiGraph if G.is_directed() else nxcg.MultiGraph
+    for kwargs in [{"preserve_all_attrs": True}, {"edge_attrs": {"x": 0, "y": None}}]:
+        Gcg = nxcg.from_networkx(G, **kwargs)
+        assert type(Gcg) is cg_class
+        assert Gcg.is_multigraph()
+        assert Gcg.number_of_edges() == G.number_of_edges() == 4
+        assert Gcg.edge_keys is None
+        if G.is_directed():
+            cp.testing.assert_array_equal(Gcg.row_indices, [0, 0, 1, 2])
+            cp.testing.assert_array_equal(Gcg.col_indices, [1, 1, 2, 2])
+            cp.testing.assert_array_equal(Gcg.edge_indices, [0, 1, 0, 0])
+            cp.testing.assert_array_equal(Gcg.edge_values["x"], [1, 2, 3, 4])
+        else:
+            cp.testing.assert_array_equal(Gcg.row_indices, [0, 0, 1, 1, 1, 2, 2])
+            cp.testing.assert_array_equal(Gcg.col_indices, [1, 1, 0, 0, 2, 1, 2])
+            cp.testing.assert_array_equal(Gcg.edge_indices, [0, 1, 0, 1, 0, 0, 0])
+            cp.testing.assert_array_equal(Gcg.edge_values["x"], [1, 2, 1, 2, 3, 3, 4])
+        assert Gcg.get_edge_data(10, 20) == {0: {"x": 1}, 1: {"x": 2, "y": 1.5}}
+        assert Gcg.get_edge_data(10, 20, 1) == {"x": 2, "y": 1.5}
+        assert Gcg.get_edge_data(10, 20, 2) is None
+        assert Gcg.has_edge(10, 20, 1)
+        assert not Gcg.has_edge(10, 20, 2)
+        H = nxcg.to_networkx(Gcg)
+        assert type(H) is graph_class
+        assert H.nodes == G.nodes
+        assert H.adj == G.adj
+
+    # Parallel edges are combined (and weights summed) for pylibcugraph
+    src, dst, weights = Gcg._get_plc_edges(Gcg.edge_values["x"])
+    if G.is_directed():
+        cp.testing.assert_array_equal(src, [0, 1, 2])
+        cp.testing.assert_array_equal(dst, [1, 2, 2])
+        cp.testing.assert_array_equal(weights, [3, 3, 4])
+    else:
+        cp.testing.assert_array_equal(src, [0, 1, 1, 2, 2])
+        cp.testing.assert_array_equal(dst, [1, 0, 2, 1, 2])
+        cp.testing.assert_array_equal(weights, [3, 3, 3, 3, 4])
+    assert weights.dtype == Gcg.edge_values["x"].dtype
+
+    # Arbitrary edge keys
+    G.add_edge(10, 30, key="a", x=5)
+    Gcg = nxcg.from_networkx(G, preserve_edge_attrs=True)
+    assert Gcg.edge_indices is None
+    assert Gcg.get_edge_data(10, 30) == {"a": {"x": 5}}
+    H = nxcg.to_networkx(Gcg)
+    assert H.adj == G.adj
+    assert Gcg.to_directed().is_multigraph()
+
+
+@pytest.mark.parametrize(
+    "nodes",
+    [
+        [3, 1, 0, 2],  # permutation of range(N)
+        [10, 12, 17, 11],  # dense with gaps (lookup table)
+        [-5, 0, 10**12, 7],  # sparse (binary search)
+        [2**70, 1, 2, 3],  # too large for int64
+        ["b", "a", "c", "d"],
+        ["b", 1, "c", 0],
+    ],
+)
+@pytest.mark.parametrize("use_buffers", [False, True])
+def test_convert_renumber(monkeypatch, nodes, use_buffers):
+    G = nx.DiGraph()
+    G.add_nodes_from(nodes)
+    for i, (u, v) in enumerate(itertools.permutations(nodes, 2)):
+        G.add_edge(u, v, x=i, y=-i)
+    if use_buffers:
+        monkeypatch.setattr(nxcg.convert, "_BULK_EDGE_THRESHOLD", 0)
+    Gcg = nxcg.from_networkx(G, edge_attrs={"x": 0, "y": None})
+    assert Gcg.key_to_id == dict(zip(nodes, range(len(nodes))))
+    expected = [Gcg.key_to_id[v] for nbrs in G._adj.values() for v in nbrs]
+    assert Gcg.col_indices.tolist() == expected
+    assert nx.utils.graphs_equal(G, nxcg.to_networkx(Gcg))
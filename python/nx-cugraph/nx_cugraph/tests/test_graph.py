@@ -0,0 +1,111 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import itertools
+
+import cupy as cp
+import networkx as nx
+import numpy as np
+import pytest
+
+import nx_cugraph as nxcg
+
+
+@pytest.mark.parametrize(
+    "graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+def test_edge_queries(graph_class):
+    G = graph_class()
+    # Edges are added out of order so the COO arrays are not in CSR order
+    G.add_edge("c", "a", x=1)
+    G.add_edge("a", "d", x=2)
+    G.add_edge("a", "b", x=3)
+    G.add_edge("d", "d", x=4)
+    G.add_edge("b", "a", x=5)
+    G.add_node("e")
+    if G.is_multigraph():
+        G.add_edge("a", "b", x=6)
+        G.add_edge("a", "b", key="k", x=7)
+    Gcg = nxcg.from_networkx(G, preserve_edge_attrs=True)
+    nodes = [*G, "missing"]
+    for u, v in itertools.product(nodes, nodes):
+        assert Gcg.has_edge(u, v) == G.has_edge(u, v), (u, v)
+        assert Gcg.get_edge_data(u, v) == G.get_edge_data(u, v), (u, v)
+        if u in G:
+            assert Gcg.number_of_edges(u, v) == G.number_of_edges(u, v), (u, v)
+    assert Gcg.number_of_edges() == G.number_of_edges()
+    # The CSR form is computed once and reused by views
+    csr = Gcg._get_csr()
+    assert Gcg._get_csr() is csr
+    assert Gcg.copy(as_view=True)._csr is csr
+    Gcg.clear_edges()
+    assert Gcg._csr is None
+    assert not Gcg.has_edge("a", "b")
+
+
+def test_from_csr_and_csc_keep_compressed_form():
+    # 0 -> 1, 0 -> 2, 2 -> 0
+    indptr = cp.array([0, 2, 2, 3], np.int32)
+    indices = cp.array([1, 2, 0], np.int32)
+    G = nxcg.DiGraph.from_csr(indptr, indices)
+    assert G._csr[0] is indptr
+    assert G._csr[2] is None
+    assert G.has_edge(0, 2)
+    assert not G.has_edge(2, 1)
+    # 1 -> 0, 2 -> 0, 0 -> 2
+    G = nxcg.DiGraph.from_csc(indptr, indices)
+    assert G._csr is None
+    assert G._csc[0] is indptr
+    assert G.has_edge(2, 0)
+    assert not G.has_edge(0, 1)
+    # Lookups used the CSC form that was given
+    assert G._csr is None
+    assert G.reverse(copy=False)._csr is G._csc
+
+
+def test_plc_graph_is_cached():
+    G = nx.path_graph(4)
+    nx.set_edge_attributes(G, 2, "weight")
+    Gcg = nxcg.from_networkx(G, preserve_edge_attrs=True)
+    plc_graph = Gcg._get_plc_graph()
+    assert Gcg._get_plc_graph() is plc_graph
+    assert Gcg.copy(as_view=True)._get_plc_graph() is plc_graph
+    weighted = Gcg._get_plc_graph("weight", 1, np.float32)
+    assert weighted is not plc_graph
+    assert Gcg._get_plc_graph("weight", 1, "float32") is weighted
+    assert Gcg._get_plc_graph("weight", 1, np.float64) is not weighted
+    assert Gcg._get_plc_graph(store_transposed=True) is not plc_graph
+    assert Gcg.to_directed(as_view=True)._get_plc_graph() is not plc_graph
+    # Clearing the edges of a view does not affect the original's cache
+    view = Gcg.copy(as_view=True)
+    view.clear_edges()
+    assert view._get_plc_graph() is not plc_graph
+    assert Gcg._get_plc_graph() is plc_graph
+    Gcg.clear_edges()
+    assert not Gcg._plc_graphs
+    assert Gcg._get_plc_graph() is not plc_graph
+
+
+@pytest.mark.parametrize("weight", ["weight", None])
+def test_louvain_multigraph_sums_parallel_edges(weight):
+    # Two triangles joined by five parallel edges between 2 and 3
+    G = nx.MultiGraph()
+    G.add_edges_from([(0, 1), (1, 2), (0, 2), (3, 4), (4, 5), (3, 5)])
+    G.add_edges_from([(2, 3)] * 5)
+    expected = nx.community.louvain_communities(G, weight=weight, seed=42)
+    assert sorted(map(sorted, expected)) == [[0, 1], [2, 3], [4, 5]]
+    Gcg = nxcg.from_networkx(G)
+    result = nxcg.community.louvain_communities(Gcg, weight=weight)
+    assert sorted(map(sorted, result)) == [[0, 1], [2, 3], [4, 5]]
+    # Without summing, the parallel edges would count as a single edge
+    result = nxcg.community.louvain_communities(nxcg.from_networkx(nx.Graph(G)))
+    assert sorted(map(sorted, result)) == [[0, 1, 2], [3, 4, 5]]
@@ -0,0 +1,84 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import networkx as nx
+import pytest
+
+import nx_cugraph as nxcg
+from nx_cugraph.utils import _LazyDict
+
+
+def _make_graph(graph_class):
+    G = graph_class(name="my graph")
+    G.add_edge("a", "b", weight=1.5, color=1)
+    G.add_edge("b", "c", weight=2.5)
+    G.add_edge("c", "a", weight=3.5, color=3)
+    G.add_node("d", size=10)
+    G.nodes["a"]["size"] = 20
+    if G.is_multigraph():
+        G.add_edge("a", "b", weight=4.5, color=4)
+    return G
+
+
+@pytest.mark.parametrize(
+    "graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_roundtrip(graph_class, mmap, tmp_path):
+    G = _make_graph(graph_class)
+    Gcg = nxcg.from_networkx(G, preserve_all_attrs=True)
+    Gcg.save(tmp_path / "graph")
+    Gloaded = nxcg.Graph.load(tmp_path / "graph", mmap=mmap)
+    assert type(Gloaded) is type(Gcg)
+    assert Gloaded.graph == {"name": "my graph"}
+    if mmap:
+        assert isinstance(Gloaded.edge_values, _LazyDict)
+        assert not list(Gloaded.edge_values.loaded_items())
+    H = nxcg.to_networkx(Gloaded)
+    assert type(H) is graph_class
+    assert nx.utils.graphs_equal(G, H)
+    if mmap:
+        assert set(dict(Gloaded.edge_values.loaded_items())) == {"weight", "color"}
+
+
+def test_save_load_integer_nodes(tmp_path):
+    G = nx.MultiDiGraph()
+    G.add_edges_from([(0, 1, "x"), (0, 1, "y"), (1, 2, "x")])
+    Gcg = nxcg.from_networkx(G)
+    Gcg.save(tmp_path)
+    Gloaded = nxcg.MultiDiGraph.load(tmp_path)
+    assert Gloaded.key_to_id is None
+    assert Gloaded.edge_keys == Gcg.edge_keys
+    assert nx.utils.graphs_equal(G, nxcg.to_networkx(Gloaded))
+
+
+def test_save_load_errors(tmp_path):
+    G = nx.Graph()
+    G.add_edge(("a", 1), "b")
+    with pytest.raises(TypeError, match="keys"):
+        nxcg.from_networkx(G).save(tmp_path / "tuple_keys")
+    Gcg = nxcg.from_networkx(nx.path_graph(3))
+    Gcg.graph["obj"] = object()
+    with pytest.raises(TypeError, match="JSON"):
+        Gcg.save(tmp_path / "graph_attrs")
+
+    nxcg.from_networkx(nx.path_graph(3, create_using=nx.DiGraph)).save(tmp_path)
+    with pytest.raises(TypeError, match="DiGraph"):
+        nxcg.MultiGraph.load(tmp_path)
+    manifest_path = tmp_path / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["version"] += 1
+    manifest_path.write_text(json.dumps(manifest))
+    with pytest.raises(ValueError, match="version"):
+        nxcg.Graph.load(tmp_path)
@@ -14,11 +14,16 @@ from __future__ import annotations
 
 import operator as op
 import sys
+from collections.abc import MutableMapping
 from random import Random
+from typing import TYPE_CHECKING
 
 import cupy as cp
 
-__all__ = ["_groupby", "_handle_seed"]
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+__all__ = ["_groupby", "_handle_seed", "_LazyDict"]
 
 
 def _groupby(groups: cp.ndarray, values: cp.ndarray) -> dict[int, cp.ndarray]:
@@ -58,3 +63,65 @@ def _handle_seed(seed: int | Random | None) -> int:
     if isinstance(seed, Random):
         return seed.randint(0, sys.maxsize)
     return op.index(seed)  # Ensure seed is integral
+
+
+class _LazyDict(MutableMapping):
+    """Dict-like object with values that are computed when first accessed.
+
+    Values are created by calling the zero-argument function given for each key,
+    which is done until it succeeds once. Setting or deleting a key discards its loader.
+    Key order is the order of the loaders, as with a regular dict.
+    """
+
+    def __init__(self, loaders: dict[object, Callable[[], object]]):
+        self._data = dict.fromkeys(loaders)
+        self._loaders = dict(loaders)
+
+    def __getitem__(self, key):
+        val = self._data[key]
+        if key in self._loaders:
+            # Only discard the loader if it succeeds, so a failure is not cached
+            val = self._data[key] = self._loaders[key]()
+            del self._loaders[key]
+        return val
+
+    def __setitem__(self, key, val) -> None:
+        self._loaders.pop(key, None)
+        self._data[key] = val
+
+    def __delitem__(self, key) -> None:
+        del self._data[key]
+        self._loaders.pop(key, None)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        items = ", ".join(
+            f"{key!r}: <not loaded>" if key in self._loaders else f"{key!r}: {val!r}"
+            for key, val in self._data.items()
+        )
+        return f"{type(self).__name__}({{{items}}})"
+
+    def clear(self) -> None:
+        # Don't use `MutableMapping.clear`, which loads every value
+        self._data.clear()
+        self._loaders.clear()
+
+    def copy(self) -> _LazyDict:
+        rv = object.__new__(type(self))
+        rv._data = self._data.copy()
+        rv._loaders = self._loaders.copy()
+        return rv
+
+    def loaded_items(self) -> Iterator[tuple[object, object]]:
+        """Iterate over items that have already been loaded."""
+        return (
+            (key, val) for key, val in self._data.items() if key not in self._loaders
+        )